@@ -40,6 +40,19 @@ with open("README.md", "r", encoding="utf8") as docs:
 with open("requirements.txt", "r", encoding="utf8") as reqs:
     required = reqs.read().splitlines()
 
+# optional dependencies enabling faster or additional functionality (YFPY falls back gracefully when they are missing)
+extras_required = {
+    "async": ["aiohttp>=3.8", "uvloop>=0.17; sys_platform != 'win32'"],
+    "http2": ["aiohttp>=3.8", "httpx[http2]>=0.24"],
+    "fast-json": ["orjson>=3.9", "msgspec>=0.18"],
+    "cache": ["diskcache>=5.6"],
+    "stream": ["ijson>=3.2"],
+    "compression": ["brotli>=1.0", "zstandard>=0.21"],
+}
+extras_required["all"] = sorted({
+    requirement for extra_requirements in extras_required.values() for requirement in extra_requirements
+})
+
 supported_python_minor_versions = [
     version for version in
     range(int(__version_minimum_python__.split(".")[-1]), (int(__version_maximum_python__.split(".")[-1]) + 1))
@@ -68,5 +81,6 @@ setuptools.setup(
         "Intended Audience :: Developers"
     ],
     python_requires=f">={__version_minimum_python__}",
-    install_requires=required
+    install_requires=required,
+    extras_require=extras_required
 )
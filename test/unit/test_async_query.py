@@ -0,0 +1,598 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY async query module.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from yfpy import async_query as yfpy_async_query  # noqa: E402
+from yfpy.async_query import AsyncYahooFantasySportsQuery  # noqa: E402
+from yfpy.models import League, Player, Roster, Team  # noqa: E402
+
+
+@pytest.mark.unit
+def test_gather_team_rosters_by_week(monkeypatch):
+    """Unit test for concurrently retrieving team rosters.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.agather_team_rosters_by_week`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    requested_urls = []
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        requested_urls.append(url)
+        team_id = url.split(".t.")[1].split("/")[0]
+        await asyncio.sleep(0.01 * (3 - int(team_id)))
+        return SimpleNamespace(url=url), {"fantasy_content": {"team": [
+            [{"team_key": f"390.l.729259.t.{team_id}"}],
+            {"roster": {"coverage_type": "week", "week": team_id}}
+        ]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    rosters = asyncio.run(query.agather_team_rosters_by_week([1, 2], 1))
+
+    assert len(requested_urls) == 2
+    assert all(isinstance(roster, Roster) for roster in rosters)
+    assert [roster.week for roster in rosters] == [1, 2]
+
+
+@pytest.mark.unit
+def test_get_league_bundle(monkeypatch):
+    """Unit test for concurrently retrieving all league sections.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.get_league_bundle`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    league_section_data = {
+        "metadata": {"league_key": "390.l.729259", "is_finished": 1},
+        "settings": {"settings": {"draft_type": "live"}},
+        "standings": {"standings": {"teams": {"0": {"team": [[{"team_key": "390.l.729259.t.1"}]]}, "count": 1}}},
+        "teams": {"teams": {
+            "0": {"team": [[{"team_key": "390.l.729259.t.1"}]]},
+            "1": {"team": [[{"team_key": "390.l.729259.t.2"}]]},
+            "count": 2
+        }},
+        "draftresults": {"draft_results": {
+            "0": {"draft_result": {"pick": 1}},
+            "1": {"draft_result": {"pick": 2}},
+            "count": 2
+        }},
+        "transactions": {"transactions": {
+            "0": {"transaction": [{"transaction_key": "390.l.729259.tr.1"}]},
+            "1": {"transaction": [{"transaction_key": "390.l.729259.tr.2"}]},
+            "count": 2
+        }},
+    }
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        return SimpleNamespace(url=url), {"fantasy_content": {"league": [league_section_data[url.split("/")[-1]]]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    league_bundle = query.get_league_bundle()
+    query.cleanup()
+
+    assert list(league_bundle.keys()) == ["metadata", "settings", "standings", "teams", "draft_results", "transactions"]
+    assert isinstance(league_bundle["metadata"], League)
+    assert league_bundle["settings"].draft_type == "live"
+    assert league_bundle["teams"][0].team_key == "390.l.729259.t.1"
+    assert league_bundle["draft_results"][0].pick == 1
+
+
+@pytest.mark.unit
+def test_get_all_team_standings(monkeypatch):
+    """Unit test for concurrently retrieving the standings of all teams in the league.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.get_all_team_standings`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    requested_urls = []
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        requested_urls.append(url)
+        if url.endswith("/metadata"):
+            return SimpleNamespace(url=url), {"fantasy_content": {"league": [
+                {"league_key": "390.l.729259", "num_teams": 3}
+            ]}}
+        team_id = url.split(".t.")[1].split("/")[0]
+        await asyncio.sleep(0.01 * (4 - int(team_id)))
+        return SimpleNamespace(url=url), {"fantasy_content": {"team": [
+            [{"team_key": f"390.l.729259.t.{team_id}"}],
+            {"team_standings": {"rank": team_id}}
+        ]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    team_standings = query.get_all_team_standings()
+    query.cleanup()
+
+    assert len(requested_urls) == 4
+    assert [standings.rank for standings in team_standings] == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_gather_players(monkeypatch):
+    """Unit test for concurrently retrieving the season stats of multiple players.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.agather_players`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    requested_urls = []
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        requested_urls.append(url)
+        player_id = url.split(".p.")[1].split("/")[0]
+        await asyncio.sleep(0.01 * (3 - int(player_id)))
+        return SimpleNamespace(url=url), {"fantasy_content": {"league": [
+            {"league_key": "390.l.729259"},
+            {"players": {"0": {"player": [
+                [{"player_key": f"390.p.{player_id}"}],
+                {"player_points": {"coverage_type": "season", "total": float(player_id)}}
+            ]}, "count": 1}}
+        ]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    players = asyncio.run(query.agather_players(query.aget_player_stats_for_season, ["390.p.1", "390.p.2"]))
+
+    assert all(url.endswith("/stats") and "/league/390.l.729259/players;" in url for url in requested_urls)
+    assert all(isinstance(player, Player) for player in players)
+    assert [player.player_points.total for player in players] == [1.0, 2.0]
+
+
+@pytest.mark.unit
+def test_aget_players_stats_for_season(monkeypatch):
+    """Unit test for concurrently retrieving the season stats of multiple players with one query per 25 players.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.aget_players_stats_for_season`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    requested_urls = []
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        requested_urls.append(url)
+        player_keys = url.split("player_keys=")[1].split("/")[0].split(",")
+        # the last batch is answered first
+        await asyncio.sleep(0.01 * (2 - len(requested_urls)))
+        players = {
+            str(index): {"player": [[{"player_key": player_key}]]} for index, player_key in enumerate(player_keys)
+        }
+        return SimpleNamespace(url=url), {"fantasy_content": {"league": [
+            {"league_key": "390.l.729259"}, {"players": {**players, "count": len(player_keys)}}
+        ]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    player_keys = [f"390.p.{player_id}" for player_id in range(30)]
+    players = asyncio.run(query.aget_players_stats_for_season(player_keys))
+
+    assert len(requested_urls) == 2
+    assert all(url.endswith("/stats") and "/league/390.l.729259/players;" in url for url in requested_urls)
+    assert [player.player_key for player in players] == player_keys
+
+
+@pytest.mark.unit
+def test_batch_players(monkeypatch):
+    """Unit test for coalescing concurrent player queries into batched multi-player queries.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.batch_players`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    requested_urls = []
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        requested_urls.append(url)
+        player_keys = url.split("player_keys=")[1].split("/")[0].split(",")
+        return SimpleNamespace(url=url), {"fantasy_content": {"league": [
+            {"league_key": "390.l.729259"},
+            {"players": {
+                **{str(i): {"player": [[{"player_key": player_key}], {"ownership": {"ownership_type": "team"}}]}
+                   for i, player_key in enumerate(reversed(player_keys))},
+                "count": len(player_keys)
+            }}
+        ]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    async def get_player_ownership():
+        async with query.batch_players():
+            return await asyncio.gather(
+                *(query.aget_player_ownership(f"390.p.{player_id}") for player_id in (1, 2, 1, 3)),
+                query.aget_player_draft_analysis("390.p.1")
+            )
+
+    players = asyncio.run(get_player_ownership())
+
+    assert sorted(requested_urls) == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/players;"
+        "player_keys=390.p.1,390.p.2,390.p.3/ownership",
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/players;player_keys=390.p.1/"
+        "draft_analysis"
+    ]
+    assert [player.player_key for player in players] == ["390.p.1", "390.p.2", "390.p.1", "390.p.3", "390.p.1"]
+    assert players[0] is players[2]
+
+
+@pytest.mark.unit
+def test_gather_team_roster_by_weeks(monkeypatch):
+    """Unit test for concurrently retrieving the roster of a team for multiple weeks.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.agather_team_roster_by_weeks`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.league_key = "390.l.729259"
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        week = url.split("week=")[1]
+        await asyncio.sleep(0.01 * (3 - int(week)))
+        return SimpleNamespace(url=url), {"fantasy_content": {"team": [
+            [{"team_key": "390.l.729259.t.1"}],
+            {"roster": {"coverage_type": "week", "week": week}}
+        ]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    rosters = asyncio.run(query.agather_team_roster_by_weeks(1, [1, 2, 3]))
+
+    assert all(isinstance(roster, Roster) for roster in rosters)
+    assert [roster.week for roster in rosters] == [1, 2, 3]
+
+
+@pytest.mark.unit
+def test_gather_queries(monkeypatch):
+    """Unit test for concurrently running the same kind of query for multiple URLs.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.agather_queries`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+
+    async def mock_aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        team_key = url.split("/")[-2]
+        return SimpleNamespace(url=url), {"fantasy_content": {"team": [[{"team_key": team_key}]]}}
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget_response_data", mock_aget_response_data)
+
+    team_keys = [f"390.l.729259.t.{team_id}" for team_id in range(1, 5)]
+    teams = asyncio.run(query.agather_queries(
+        [f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/metadata" for team_key in team_keys],
+        ("team",),
+        Team
+    ))
+
+    assert all(isinstance(team, Team) for team in teams)
+    assert [team.team_key for team in teams] == team_keys
+
+
+@pytest.mark.unit
+def test_aget_response_data_decodes_response_bytes(monkeypatch):
+    """Unit test for decoding the raw bytes of asynchronous responses.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery._aget_response_data`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.oauth = SimpleNamespace(access_token="token")
+    url = "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/metadata"
+
+    class MockResponse(object):
+        status = 200
+        reason = "OK"
+        headers = {"Content-Type": "application/json;charset=UTF-8"}
+
+        def __init__(self):
+            self.url = url
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            return False
+
+        async def read(self) -> bytes:
+            return b'{"fantasy_content": {"league": [{"league_key": "390.l.729259", "name": "T\\u00e9st"}]}}'
+
+    async def mock_get_aiohttp_session(self) -> Any:
+        return SimpleNamespace(get=lambda *args, **kwargs: MockResponse())
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_get_aiohttp_session", mock_get_aiohttp_session)
+
+    league = asyncio.run(query.aquery(url, ["league"], League))
+
+    assert league.league_key == "390.l.729259"
+    assert league.name == "Tést".encode("utf-8")
+
+
+@pytest.mark.unit
+def test_aget_response_data_shares_inflight_requests(monkeypatch):
+    """Unit test for sharing a single in-flight request between concurrent asynchronous queries of the same URL.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery._aget_response_data`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.offline = False
+    query.oauth = SimpleNamespace(access_token="token")
+    url = "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/metadata"
+
+    requested_urls = []
+
+    async def mock_aget(self, request_url: str, access_token: str) -> Tuple[Any, int, str, bytes]:
+        requested_urls.append(request_url)
+        await asyncio.sleep(0.01)
+        response = SimpleNamespace(url=request_url, headers={"Content-Type": "application/json"})
+        return response, 200, "OK", b'{"fantasy_content": {"league": [{"league_key": "390.l.729259"}]}}'
+
+    monkeypatch.setattr(AsyncYahooFantasySportsQuery, "_aget", mock_aget)
+
+    async def get_leagues():
+        return await asyncio.gather(*(query.aquery(url, ["league"], League) for _ in range(3)))
+
+    leagues = asyncio.run(get_leagues())
+
+    assert requested_urls == [url]
+    assert all(league.league_key == "390.l.729259" for league in leagues)
+    assert not query._ainflight
+
+    # sequential queries of the same URL are requested again once the in-flight request is done
+    asyncio.run(query.aquery(url, ["league"], League))
+    assert requested_urls == [url, url]
+
+
+@pytest.mark.unit
+def test_aiohttp_session_negotiates_supported_compression():
+    """Unit test for negotiating every compression supported by aiohttp on the shared client session.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery._get_aiohttp_session`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+
+    async def get_session_headers():
+        async with query:
+            session = await query._get_aiohttp_session()
+            return session.headers
+
+    # leave Accept-Encoding to aiohttp so that brotli is requested whenever its decoder is installed
+    assert "Accept-Encoding" not in asyncio.run(get_session_headers())
+
+
+@pytest.mark.unit
+def test_sync_methods_reuse_client_session():
+    """Unit test for reusing the client session (and its keep-alive connections) across synchronous method calls.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.cleanup`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+
+    session = query._run_sync(query._get_aiohttp_session)
+    assert query._run_sync(query._get_aiohttp_session) is session
+    assert not session.closed
+
+    query.cleanup()
+    assert session.closed
+    assert query._sync_event_loop is None
+
+
+@pytest.mark.unit
+def test_sync_methods_use_loop_factory():
+    """Unit test for running the synchronous methods on an event loop created by a custom loop factory.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery._run_sync`.
+
+    Returns:
+        None
+
+    """
+    created_loops = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:
+        created_loops.append(asyncio.new_event_loop())
+        return created_loops[-1]
+
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True,
+        loop_factory=loop_factory
+    )
+
+    async def get_running_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    assert query._run_sync(get_running_loop) is query._run_sync(get_running_loop) is created_loops[0]
+    assert len(created_loops) == 1
+
+    query.cleanup()
+    assert created_loops[0].is_closed()
+
+
+@pytest.mark.unit
+def test_sync_methods_share_background_event_loop():
+    """Unit test for running concurrent synchronous method calls from multiple threads on one background event loop.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery._run_sync`.
+
+    Returns:
+        None
+
+    """
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+
+    running_calls = []
+
+    async def wait_for_concurrent_call() -> Tuple[asyncio.AbstractEventLoop, threading.Thread]:
+        running_calls.append(None)
+        # only completes when the calls of both threads are running on the event loop at the same time
+        for _ in range(500):
+            if len(running_calls) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(running_calls) == 2
+        return asyncio.get_running_loop(), threading.current_thread()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: query._run_sync(wait_for_concurrent_call), range(2)))
+
+    assert results[0] == results[1] == (query._sync_event_loop, query._sync_event_loop_thread)
+    assert query._sync_event_loop_thread is not threading.current_thread()
+    assert query._sync_event_loop_thread.daemon
+
+    sync_event_loop_thread = query._sync_event_loop_thread
+    query.cleanup()
+    assert not sync_event_loop_thread.is_alive()
+    assert query._sync_event_loop_thread is None
+
+
+@pytest.mark.unit
+def test_aget_response_data_http2(monkeypatch):
+    """Unit test for sending asynchronous requests with the HTTP/2 httpx client.
+
+    Note:
+        Tests :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery._aget_response_data`.
+
+    Returns:
+        None
+
+    """
+    monkeypatch.setattr(yfpy_async_query, "httpx", SimpleNamespace())
+    query = AsyncYahooFantasySportsQuery(
+        "729259", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True,
+        http2=True
+    )
+    query.offline = False
+    query.oauth = SimpleNamespace(access_token="token")
+    url = "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/metadata"
+
+    requests = []
+
+    async def mock_get(request_url: str, **kwargs) -> SimpleNamespace:
+        requests.append(kwargs["headers"])
+        return SimpleNamespace(
+            status_code=200, reason_phrase="OK", headers={"Content-Type": "application/json;charset=UTF-8"},
+            content=b'{"fantasy_content": {"league": [{"league_key": "390.l.729259"}]}}', url=request_url,
+            http_version="HTTP/2"
+        )
+
+    monkeypatch.setattr(
+        AsyncYahooFantasySportsQuery, "_get_httpx_client", lambda self: SimpleNamespace(get=mock_get)
+    )
+
+    league = asyncio.run(query.aquery(url, ["league"], League))
+
+    assert league.league_key == "390.l.729259"
+    assert requests == [{"Authorization": "Bearer token"}]
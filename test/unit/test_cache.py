@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY cache module.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import pytest
+
+from yfpy import cache as yfpy_cache
+from yfpy.cache import QueryCache
+from yfpy.models import Game
+
+
+@pytest.mark.unit
+def test_query_cache_expires_and_evicts(monkeypatch):
+    """Unit test for expiring and evicting cached query results.
+
+    Note:
+        Tests :func:`~yfpy.cache.QueryCache.get`.
+
+    Returns:
+        None
+
+    """
+    current_time = [1000.0]
+    monkeypatch.setattr(yfpy_cache.time, "monotonic", lambda: current_time[0])
+
+    query_cache = QueryCache(maxsize=2)
+    query_cache.set("live", "live_data", ttl=60)
+    query_cache.set("historical", "historical_data")
+
+    current_time[0] += 61
+    assert query_cache.get("live") is None
+    assert query_cache.get("historical") == "historical_data"
+
+    query_cache.set("first", "first_data")
+    query_cache.set("second", "second_data")
+    assert "historical" not in query_cache
+    assert len(query_cache) == 2
+
+
+@pytest.mark.unit
+def test_query_cache_disk_tier(tmp_path):
+    """Unit test for persisting cached query results to disk across cache instances.
+
+    Note:
+        Tests :func:`~yfpy.cache.QueryCache.get`.
+
+    Returns:
+        None
+
+    """
+    pytest.importorskip("diskcache")
+
+    cache_key = ("https://fantasysports.yahooapis.com/fantasy/v2/game/390/metadata", ("game",), Game)
+
+    first_cache = QueryCache(cache_dir=tmp_path)
+    first_cache.set(cache_key, Game({"game_key": "390", "season": 2019}))
+    first_cache.close()
+
+    second_cache = QueryCache(cache_dir=tmp_path)
+    game = second_cache.get(cache_key)
+    second_cache.close()
+
+    assert isinstance(game, Game)
+    assert game.game_key == "390"
+
+
+@pytest.mark.unit
+def test_query_cache_memory_only_entries(tmp_path):
+    """Unit test for caching query results in memory without persisting them to disk.
+
+    Note:
+        Tests :func:`~yfpy.cache.QueryCache.set`.
+
+    Returns:
+        None
+
+    """
+    pytest.importorskip("diskcache")
+
+    first_cache = QueryCache(cache_dir=tmp_path)
+    first_cache.set("memory_only", "memory_only_data", persist=False)
+    assert first_cache.get("memory_only") == "memory_only_data"
+    first_cache.close()
+
+    second_cache = QueryCache(cache_dir=tmp_path)
+    assert second_cache.get("memory_only") is None
+    second_cache.close()
+
+
+@pytest.mark.unit
+def test_query_cache_stale_entries(monkeypatch):
+    """Unit test for retrieving expired query results to fall back on.
+
+    Note:
+        Tests :func:`~yfpy.cache.QueryCache.get_stale`.
+
+    Returns:
+        None
+
+    """
+    current_time = [1000.0]
+    monkeypatch.setattr(yfpy_cache.time, "monotonic", lambda: current_time[0])
+
+    query_cache = QueryCache()
+    query_cache.set("live", "live_data", ttl=60)
+
+    current_time[0] += 61
+    assert query_cache.get("live") is None
+    assert query_cache.get_stale("live") == "live_data"
+    assert query_cache.get_stale("missing") is None
@@ -0,0 +1,1799 @@
+# -*- coding: utf-8 -*-
+"""Pytest unit tests for YFPY query module.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import io
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+from requests import Response, Session
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError
+
+from yfpy import query as yfpy_query
+from yfpy.cache import QueryCache
+from yfpy.exceptions import YahooFantasySportsDataNotFound, YahooFantasySportsException
+from yfpy.models import Game, LazyYahooObject, League, Player, Roster
+from yfpy.query import YahooFantasySportsQuery
+
+
+def build_response(status_code: int, body: Any = None, headers: Dict[str, str] = None,
+                   url: str = "https://fantasysports.yahooapis.com/fantasy/v2/test") -> Response:
+    """Build a requests Response without making a network request.
+    """
+    response = Response()
+    response.status_code = status_code
+    response.url = url
+    response._content = json.dumps(body).encode("utf-8") if body is not None else b"<html></html>"
+    response.headers["Content-Type"] = "application/json;charset=UTF-8" if body is not None else "text/html"
+    response.headers.update(headers or {})
+    return response
+
+
+class MockSession(object):
+    """Mock OAuth session returning canned responses in order.
+    """
+
+    def __init__(self, responses: List[Response]):
+        self.responses = responses
+        self.request_count = 0
+
+    def get(self, url: str, **kwargs) -> Response:
+        response = self.responses[self.request_count]
+        self.request_count += 1
+        return response
+
+
+@pytest.fixture
+def offline_query() -> YahooFantasySportsQuery:
+    """Instantiate an offline YahooFantasySportsQuery object.
+    """
+    return YahooFantasySportsQuery(
+        "######", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+
+
+@pytest.fixture
+def no_sleep(offline_query) -> List[float]:
+    """Record retry delays instead of waiting.
+    """
+    delays = []
+    offline_query._cancel_event = SimpleNamespace(wait=lambda delay: delays.append(delay))
+    return delays
+
+
+@pytest.mark.unit
+def test_get_response_retries_iteratively(offline_query, no_sleep):
+    """Unit test for request retries with exponential backoff.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    session = MockSession([
+        build_response(503),
+        build_response(503),
+        build_response(200, {"fantasy_content": {"game": []}})
+    ])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    response = offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert response.status_code == 200
+    assert session.request_count == 3
+    assert len(no_sleep) == 2
+    assert all(0 <= delay <= yfpy_query.RETRY_BACKOFF_CAP_SECONDS for delay in no_sleep)
+    # retry configuration is not consumed by failed requests
+    assert offline_query._retries == 3
+
+
+@pytest.mark.unit
+def test_get_response_honors_retry_after(offline_query, no_sleep):
+    """Unit test for request retries honoring the Retry-After header.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(429, headers={"Retry-After": "7"}),
+        build_response(200, {"fantasy_content": {"game": []}})
+    ]))
+
+    offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert no_sleep == [7.0]
+
+
+@pytest.mark.unit
+def test_get_response_caps_retry_after(offline_query, no_sleep):
+    """Unit test for capping the delay honored from a huge Retry-After header.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(503, headers={"Retry-After": "86400"}),
+        build_response(200, {"fantasy_content": {"game": []}})
+    ]))
+
+    offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert no_sleep == [yfpy_query.RETRY_AFTER_MAX_SECONDS]
+
+
+@pytest.mark.unit
+def test_get_response_raises_after_retries(offline_query, no_sleep):
+    """Unit test for request failure after all retries are exhausted.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    session = MockSession([build_response(503) for _ in range(4)])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    with pytest.raises(HTTPError):
+        offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert session.request_count == 4
+    assert len(no_sleep) == 3
+
+
+@pytest.mark.unit
+def test_get_response_stops_retrying_at_deadline(offline_query, no_sleep):
+    """Unit test for not retrying failed requests after the deadline has passed.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    session = MockSession([build_response(503) for _ in range(4)])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    with pytest.raises(HTTPError):
+        offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test", deadline=time.monotonic())
+
+    assert session.request_count == 1
+    assert len(no_sleep) == 0
+
+
+@pytest.mark.unit
+def test_cleanup_cancels_retries(offline_query):
+    """Unit test for cancelling pending request retries when the query is cleaned up.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.cleanup`.
+
+    Returns:
+        None
+
+    """
+    session = MockSession([build_response(503, headers={"Retry-After": "60"}) for _ in range(4)])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    errors = []
+
+    def get_response():
+        try:
+            offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+        except YahooFantasySportsException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=get_response)
+    thread.start()
+    while session.request_count == 0:
+        time.sleep(0.001)
+    offline_query.cleanup()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert session.request_count == 1
+    assert len(errors) == 1
+
+
+@pytest.mark.unit
+def test_get_response_refreshes_expiring_access_token(offline_query):
+    """Unit test for refreshing an expiring access token before making a request instead of after it is rejected.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    session = MockSession([build_response(200, {"fantasy_content": {"game": []}}) for _ in range(2)])
+
+    def refresh_access_token():
+        offline_query.oauth.access_token = "fresh_access_token"
+        offline_query.oauth.token_time = time.time()
+
+    offline_query.oauth = SimpleNamespace(
+        session=session, access_token="stale_access_token", token_time=time.time() - 3600,
+        refresh_access_token=refresh_access_token
+    )
+
+    for _ in range(2):
+        offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert session.access_token == "fresh_access_token"
+    assert session.request_count == 2
+
+
+@pytest.mark.unit
+def test_context_manager_cleans_up(offline_query):
+    """Unit test for cleaning up the query when it is used as a context manager.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.cleanup`.
+
+    Returns:
+        None
+
+    """
+    with offline_query as query:
+        assert query is offline_query
+        cancel_event = query._cancel_event
+        assert not cancel_event.is_set()
+
+    assert cancel_event.is_set()
+    assert not offline_query._cancel_event.is_set()
+
+
+@pytest.mark.unit
+def test_get_response_retries_after_cleanup(offline_query):
+    """Unit test for retrying failed requests of a query that has already been cleaned up.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.cleanup`.
+
+    Returns:
+        None
+
+    """
+    offline_query.cleanup()
+    session = MockSession([
+        build_response(429, headers={"Retry-After": "0"}),
+        build_response(200, {"fantasy_content": {"game": []}})
+    ])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    response = offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert response.status_code == 200
+    assert session.request_count == 2
+
+
+@pytest.mark.unit
+def test_get_response_inflight_deadline(offline_query):
+    """Unit test for the deadline expiring while waiting for an in-flight request to the same URL.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    url = "https://fantasysports.yahooapis.com/fantasy/v2/test"
+    offline_query._inflight[url] = Future()
+
+    with pytest.raises(YahooFantasySportsException, match="in-flight request"):
+        offline_query.get_response(url, deadline=time.monotonic())
+
+
+@pytest.mark.unit
+def test_get_response_decodes_only_json_error_bodies(offline_query, no_sleep, monkeypatch):
+    """Unit test for only decoding failed responses that can contain a Yahoo error description.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    offline_query._retries = 0
+    html_response = build_response(500)
+    monkeypatch.setattr(html_response, "json", lambda: pytest.fail("HTML error page should not be decoded"))
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        html_response,
+        build_response(400, {"error": {"description": "Invalid league key"}})
+    ]))
+
+    with pytest.raises(HTTPError):
+        offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    with pytest.raises(YahooFantasySportsDataNotFound):
+        offline_query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+
+@pytest.mark.unit
+def test_query_cache(offline_query):
+    """Unit test for reusing cached query results.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    session = MockSession([
+        build_response(200, {"fantasy_content": {"game": [{"game_key": "390", "season": "2019"}]}})
+    ])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    url = "https://fantasysports.yahooapis.com/fantasy/v2/game/390/metadata"
+    first_result = offline_query.query(url, ["game"], cache=True)
+    second_result = offline_query.query(url, ["game"], cache=True)
+
+    assert session.request_count == 1
+    assert first_result is second_result
+
+
+@pytest.mark.unit
+def test_query_extracts_multiple_data_keys(offline_query):
+    """Unit test for extracting multiple sibling data keys from a Yahoo list of single-key dictionaries.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+    Returns:
+        None
+
+    """
+    team_stats_response_body = {"fantasy_content": {"team": [
+        [{"team_key": "390.l.729259.t.1"}, {"team_id": "1"}],
+        {"team_points": {"coverage_type": "week", "total": "112.5"}},
+        {"team_projected_points": {"coverage_type": "week", "total": "108.2"}}
+    ]}}
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, team_stats_response_body),
+        build_response(200, team_stats_response_body)
+    ]))
+
+    result = offline_query.query(
+        "https://fantasysports.yahooapis.com/fantasy/v2/team/390.l.729259.t.1/stats;type=week;week=1",
+        ["team", ["team_points", "team_projected_points"]]
+    )
+
+    assert result["team_points"].total == 112.5
+    assert result["team_projected_points"].total == 108.2
+
+    # getters pass constant data key paths as tuples (including nested tuples of sibling data keys)
+    assert offline_query.get_team_stats_by_week(1, 1) == result
+
+
+@pytest.mark.unit
+def test_get_data_key_path():
+    """Unit test for converting data key lists to hashable data key paths.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery._get_data_key_path`.
+
+    Returns:
+        None
+
+    """
+    data_key_path = ("users", "0", "user", "games")
+
+    assert YahooFantasySportsQuery._get_data_key_path(data_key_path) is data_key_path
+    assert YahooFantasySportsQuery._get_data_key_path(list(data_key_path)) == data_key_path
+    assert YahooFantasySportsQuery._get_data_key_path(("team", ["team_points", "team_projected_points"])) == (
+        "team", ("team_points", "team_projected_points")
+    )
+
+
+@pytest.mark.unit
+def test_query_sorts_results(offline_query):
+    """Unit test for sorting query results with a sort function before they are flattened.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_user_games`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"users": {
+            "0": {"user": [
+                {"guid": "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+                {"games": {
+                    "0": {"game": [{"game_key": "406", "season": "2021"}]},
+                    "1": {"game": [{"game_key": "390", "season": "2019"}]},
+                    "2": {"game": [{"game_key": "399", "season": "2020"}]},
+                    "count": 3
+                }}
+            ]},
+            "count": 1
+        }}})
+    ]))
+
+    user_games = offline_query.get_user_games()
+
+    assert [game.season for game in user_games] == [2019, 2020, 2021]
+    assert all(isinstance(game, Game) for game in user_games)
+
+
+@pytest.mark.unit
+def test_query_lazy(offline_query):
+    """Unit test for lazily parsing query data.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.all_output_as_json_str = True
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"games": {
+            "0": {"game": [{"game_key": "390", "code": "nfl", "season": "2019"}]},
+            "count": 1
+        }}})
+    ]))
+
+    result = offline_query.query(
+        "https://fantasysports.yahooapis.com/fantasy/v2/games;game_codes=nfl;seasons=2019", ["games"], lazy=True
+    )
+
+    assert isinstance(result, LazyYahooObject)
+    assert isinstance(result.get("game"), Game)
+    assert result.get("game").game_key == "390"
+    assert result.get("game") is result["game"]
+
+
+@pytest.mark.unit
+def test_oauth_shared_between_queries():
+    """Unit test for sharing OAuth objects between query objects using the same credentials.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery._authenticate`.
+
+    Returns:
+        None
+
+    """
+    credentials = {
+        "access_token": "access_token",
+        "refresh_token": "refresh_token",
+        "consumer_key": "consumer_key",
+        "consumer_secret": "consumer_secret"
+    }
+    first_query = YahooFantasySportsQuery("######", **credentials)
+    second_query = YahooFantasySportsQuery("######", **credentials)
+    other_query = YahooFantasySportsQuery("######", **{**credentials, "refresh_token": "other_refresh_token"})
+
+    assert first_query.oauth is second_query.oauth
+    assert first_query.oauth is not other_query.oauth
+    assert first_query.oauth.session.access_token == "access_token"
+
+
+@pytest.mark.unit
+def test_configure_session(offline_query):
+    """Unit test for configuring the OAuth session to reuse pooled connections and request compressed responses.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery._configure_session`.
+
+    Returns:
+        None
+
+    """
+    offline_query.oauth = SimpleNamespace(session=Session())
+    offline_query._configure_session()
+
+    adapter = offline_query.oauth.session.get_adapter(yfpy_query.YAHOO_FANTASY_API_BASE_URL)
+    assert adapter._pool_maxsize == yfpy_query.HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == 0
+    assert "gzip" in offline_query.oauth.session.headers["Accept-Encoding"]
+
+
+@pytest.mark.unit
+def test_get_response_single_flight(offline_query, monkeypatch):
+    """Unit test for sharing a single in-flight request between concurrent callers for the same URL.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    request_started = threading.Event()
+    release_request = threading.Event()
+
+    class BlockingSession(MockSession):
+
+        def get(self, url: str, **kwargs) -> Response:
+            request_started.set()
+            release_request.wait(timeout=5)
+            return super().get(url, **kwargs)
+
+    waiting_callers = []
+
+    class RecordingFuture(Future):
+
+        def result(self, timeout=None):
+            waiting_callers.append(threading.current_thread())
+            return super().result(timeout)
+
+    monkeypatch.setattr(yfpy_query, "Future", RecordingFuture)
+    session = BlockingSession([build_response(200, {"fantasy_content": {"game": []}})])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    url = "https://fantasysports.yahooapis.com/fantasy/v2/game/390/metadata"
+    responses = []
+    threads = [threading.Thread(target=lambda: responses.append(offline_query.get_response(url))) for _ in range(3)]
+    threads[0].start()
+    request_started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    while len(waiting_callers) < 2:
+        time.sleep(0.001)
+    release_request.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert session.request_count == 1
+    assert len(responses) == 3
+    assert all(response is responses[0] for response in responses)
+
+
+@pytest.mark.unit
+def test_get_game_key_by_season_raw(offline_query):
+    """Unit test for retrieving a single raw value without parsing the query data.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_game_key_by_season`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.all_output_as_json_str = True
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"games": {
+            "0": {"game": [{"game_key": "390", "code": "nfl", "season": "2019"}]},
+            "count": 1
+        }}})
+    ]))
+
+    assert offline_query.get_game_key_by_season(2019) == "390"
+    assert offline_query.get_game_key_by_season(2019) == "390"
+
+
+@pytest.mark.unit
+def test_query_stream(offline_query):
+    """Unit test for streaming the JSON data items at a JSON path.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query_stream`.
+
+    Returns:
+        None
+
+    """
+    pytest.importorskip("ijson")
+
+    response = build_response(200, {"fantasy_content": {"league": [
+        {"league_key": "390.l.729259"},
+        {"players": {"0": {"player": [{"player_key": "390.p.30977"}]}, "1": {"player": [{"player_key": "390.p.31002"}]},
+                     "count": 2}}
+    ]}})
+    response.raw = io.BytesIO(response.content)
+    offline_query.offline = False
+    offline_query.oauth = SimpleNamespace(session=MockSession([response]))
+
+    players = offline_query.query_stream(
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/players",
+        "fantasy_content.league.item.players",
+        key_value_pairs=True
+    )
+
+    assert [player["player"][0]["player_key"] for key, player in players if key != "count"] == [
+        "390.p.30977", "390.p.31002"
+    ]
+    assert len(offline_query.executed_queries) == 1
+
+
+@pytest.mark.unit
+def test_get_team_roster_player_stats_streamed(offline_query):
+    """Unit test for incrementally parsing large team roster collections while they are downloaded.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_stats`.
+
+    Returns:
+        None
+
+    """
+    pytest.importorskip("ijson")
+
+    roster_json = {"fantasy_content": {"team": [
+        [{"team_key": "390.l.729259.t.1"}],
+        {"roster": {"0": {"players": {
+            "0": {"player": [[{"player_key": "390.p.30977"}], {"player_points": {"total": 151.46}}]},
+            "1": {"player": [[{"player_key": "390.p.31002"}], {"player_points": {"total": 98.5}}]},
+            "count": 2
+        }}}}
+    ]}}
+    # large responses are streamed, while small responses (with a known Content-Length) are decoded all at once
+    streamed_response = build_response(200, roster_json)
+    streamed_response.raw = io.BytesIO(streamed_response.content)
+    small_response = build_response(200, roster_json, headers={"Content-Length": "512"})
+    small_response.raw = io.BytesIO(small_response.content)
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=MockSession([streamed_response, small_response]))
+
+    for _ in range(2):
+        players = offline_query.get_team_roster_player_stats(1)
+
+        assert all(isinstance(player, Player) for player in players)
+        assert [player.player_key for player in players] == ["390.p.30977", "390.p.31002"]
+        assert players[0].player_points.total == 151.46
+        offline_query._query_cache.clear()
+
+    assert len(offline_query.executed_queries) == 2
+
+
+@pytest.mark.unit
+def test_get_team_roster_player_stats_not_streamed_by_pure_python_ijson(offline_query, monkeypatch):
+    """Unit test for decoding whole collection responses instead of streaming them with the pure Python ijson backend.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_stats`.
+
+    Returns:
+        None
+
+    """
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(yfpy_query.ijson, "backend", "python")
+
+    roster_json = {"fantasy_content": {"team": [
+        [{"team_key": "390.l.729259.t.1"}],
+        {"roster": {"0": {"players": {
+            "0": {"player": [[{"player_key": "390.p.30977"}], {"player_points": {"total": 151.46}}]},
+            "count": 1
+        }}}}
+    ]}}
+    session = MockSession([build_response(200, roster_json)])
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    players = offline_query.get_team_roster_player_stats(1)
+
+    assert [player.player_key for player in players] == ["390.p.30977"]
+    assert session.request_count == 1
+
+
+@pytest.mark.unit
+def test_executed_queries_bounded(monkeypatch):
+    """Unit test for keeping a bounded number of executed query summaries.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_response`.
+
+    Returns:
+        None
+
+    """
+    monkeypatch.setattr(yfpy_query, "EXECUTED_QUERIES_MAXLEN", 2)
+    query = YahooFantasySportsQuery(
+        "######", access_token=None, refresh_token=None, consumer_key=None, consumer_secret=None, offline=True
+    )
+    query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"game": []}}, url=f"https://fantasysports.yahooapis.com/{i}")
+        for i in range(3)
+    ]))
+
+    for _ in range(3):
+        query.get_response("https://fantasysports.yahooapis.com/fantasy/v2/test")
+
+    assert [executed_query["url"] for executed_query in query.executed_queries] == [
+        "https://fantasysports.yahooapis.com/1", "https://fantasysports.yahooapis.com/2"
+    ]
+    assert set(query.executed_queries[0].keys()) == {"url", "response_status_code", "elapsed_ms"}
+
+
+@pytest.mark.unit
+def test_get_league_key_memoized(offline_query, monkeypatch):
+    """Unit test for memoizing league keys derived from the game id and league id.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_key`.
+
+    Returns:
+        None
+
+    """
+    requested_game_ids = []
+
+    def get_game_metadata_by_game_id(self, game_id: int) -> Game:
+        requested_game_ids.append(game_id)
+        return Game({"game_key": str(game_id)})
+
+    monkeypatch.setattr(YahooFantasySportsQuery, "get_game_metadata_by_game_id", get_game_metadata_by_game_id)
+
+    offline_query.game_id = 390
+    assert offline_query.get_league_key() == "390.l.######"
+    assert offline_query.get_league_key() == "390.l.######"
+    assert requested_game_ids == [390]
+
+    offline_query.league_id = "729259"
+    assert offline_query.get_league_key() == "390.l.729259"
+
+    assert offline_query.get_league_key() == "390.l.729259"
+    assert requested_game_ids == [390, 390]
+
+    # team keys are built from the memoized league key
+    assert offline_query._get_team_key(3) == "390.l.729259.t.3"
+    with pytest.raises(YahooFantasySportsException, match="Invalid team ID"):
+        offline_query._get_team_key("390.l.729259.t.3")
+    assert requested_game_ids == [390, 390]
+
+    offline_query.league_key = "406.l.413954"
+    assert offline_query.get_league_key() == "406.l.413954"
+    assert requested_game_ids == [390, 390]
+
+
+@pytest.mark.unit
+def test_league_cache_ttl(offline_query):
+    """Unit test for caching league data until it expires, and indefinitely once the league is finished.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_metadata`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query._cache_ttl = 0
+    session = MockSession([
+        build_response(200, {"fantasy_content": {"league": [{"league_key": "390.l.729259", "is_finished": 0}]}}),
+        build_response(200, {"fantasy_content": {"league": [{"league_key": "390.l.729259", "is_finished": 1}]}}),
+        build_response(200, {"fantasy_content": {"league": [{"league_key": "390.l.729259", "is_finished": 1}]}}),
+    ])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    assert offline_query.get_league_metadata().is_finished == 0
+    assert offline_query.get_league_metadata().is_finished == 1
+    assert session.request_count == 2
+
+    # data retrieved once the league is known to be finished never expires
+    offline_query.get_league_metadata()
+    offline_query.get_league_metadata()
+    assert session.request_count == 3
+
+
+@pytest.mark.unit
+def test_league_cache_ttl_after_league_change(offline_query):
+    """Unit test for not treating a newly selected league as finished because the previous league was finished.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_metadata`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"league": [
+            {"league_key": "390.l.729259", "current_week": "17", "draft_status": "postdraft", "is_finished": 1}
+        ]}})
+    ]))
+
+    offline_query.get_league_metadata()
+    assert offline_query._get_league_cache_ttl() is None
+    assert offline_query._get_draft_results_cache_ttl() is None
+    assert offline_query._get_week_cache_ttl(1) is None
+
+    offline_query.league_key = "406.l.413954"
+    assert offline_query._get_league_cache_ttl() == offline_query._cache_ttl
+    assert offline_query._get_draft_results_cache_ttl() == offline_query._cache_ttl
+    assert offline_query._get_week_cache_ttl(1) == offline_query._cache_ttl
+    assert offline_query._league_num_teams is None
+
+
+@pytest.mark.unit
+def test_league_cache_revalidation(offline_query):
+    """Unit test for revalidating expired cached league data with conditional requests.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+    Returns:
+        None
+
+    """
+    request_headers = []
+
+    class RecordingSession(MockSession):
+
+        def get(self, url: str, **kwargs) -> Response:
+            request_headers.append(kwargs.get("headers"))
+            return super().get(url, **kwargs)
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query._cache_ttl = 0
+    offline_query.oauth = SimpleNamespace(session=RecordingSession([
+        build_response(
+            200, {"fantasy_content": {"league": [{"league_key": "390.l.729259", "name": "Test League"}]}},
+            headers={"ETag": "\"v1\"", "Last-Modified": "Sun, 11 Oct 2026 12:00:00 GMT"}
+        ),
+        build_response(304),
+        build_response(200, {"fantasy_content": {"league": [{"league_key": "390.l.729259", "name": "New Name"}]}}),
+    ]))
+
+    league = offline_query.get_league_metadata()
+    assert league.name == b"Test League"
+    assert request_headers[0] is None
+
+    # unchanged data is reused without being parsed again
+    assert offline_query.get_league_metadata() is league
+    assert request_headers[1] == {"If-None-Match": "\"v1\"", "If-Modified-Since": "Sun, 11 Oct 2026 12:00:00 GMT"}
+
+    assert offline_query.get_league_metadata().name == b"New Name"
+    assert request_headers[2] == request_headers[1]
+
+
+@pytest.mark.unit
+def test_query_stale_fallback(offline_query, no_sleep):
+    """Unit test for returning expired cached data when Yahoo is unreachable or unavailable.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+    Returns:
+        None
+
+    """
+    class OutageSession(MockSession):
+
+        def get(self, url: str, **kwargs) -> Response:
+            response = super().get(url, **kwargs)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query._cache_ttl = 0
+    session = OutageSession([
+        build_response(200, {"fantasy_content": {"team": [[{"team_key": "390.l.729259.t.1", "name": "Team One"}]]}}),
+        # unavailable after all retries
+        *[build_response(503) for _ in range(offline_query._retries + 1)],
+        # unreachable
+        RequestsConnectionError("Connection refused"),
+        # client errors are not masked by stale data
+        *[build_response(403) for _ in range(offline_query._retries + 1)],
+    ])
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    team = offline_query.get_team_metadata(1)
+    assert team.name == b"Team One"
+
+    assert offline_query.get_team_metadata(1) is team
+    assert offline_query.get_team_metadata(1) is team
+    assert session.request_count == offline_query._retries + 3
+
+    with pytest.raises(HTTPError):
+        offline_query.get_team_metadata(1)
+
+    # queries that were never cached still raise
+    offline_query.oauth = SimpleNamespace(session=OutageSession([RequestsConnectionError("Connection refused")]))
+    with pytest.raises(RequestsConnectionError):
+        offline_query.get_team_metadata(2)
+
+
+@pytest.mark.unit
+def test_login_query_data_not_persisted(offline_query, tmp_path):
+    """Unit test for only caching query data of the logged-in user in memory when a disk cache is shared.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery._cache_query_data`.
+
+    Returns:
+        None
+
+    """
+    pytest.importorskip("diskcache")
+
+    user_cache_key = (
+        "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;codes=nfl/", ("users",), None
+    )
+    league_cache_key = ("https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259", ("league",), None)
+
+    offline_query._query_cache = QueryCache(cache_dir=tmp_path)
+    offline_query._cache_query_data(user_cache_key, ["user_games"])
+    offline_query._cache_query_data(league_cache_key, "league")
+    assert offline_query._query_cache.get(user_cache_key) == ["user_games"]
+    offline_query._query_cache.close()
+
+    # a query object of another Yahoo account sharing the disk cache directory
+    other_query_cache = QueryCache(cache_dir=tmp_path)
+    assert other_query_cache.get(user_cache_key) is None
+    assert other_query_cache.get(league_cache_key) == "league"
+    other_query_cache.close()
+
+
+@pytest.mark.unit
+def test_get_league_info_sections(offline_query):
+    """Unit test for retrieving only selected league info sections.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_info`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+
+    class RecordingSession(MockSession):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            return super().get(url, **kwargs)
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=RecordingSession([
+        build_response(200, {"fantasy_content": {"league": [{"league_key": "390.l.729259"}]}})
+    ]))
+
+    offline_query.get_league_info(sections=["standings", "settings"])
+    offline_query.get_league_info(sections=["settings", "standings"])
+
+    assert requested_urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259;out=settings,standings"
+    ]
+
+    with pytest.raises(YahooFantasySportsException):
+        offline_query.get_league_info(sections=["settings", "rosters"])
+
+
+@pytest.mark.unit
+def test_get_league_players_concurrent_batches(offline_query):
+    """Unit test for concurrent retrieval of league player batches in order.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_players`.
+
+    Returns:
+        None
+
+    """
+    total_player_count = 60
+    requested_batches = []
+
+    class PlayerBatchSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            batch_start = int(url.split("start=")[1].split(";")[0])
+            batch_size = int(url.split("count=")[1])
+            requested_batches.append((batch_start, batch_size))
+            players = {
+                str(index): {"player": [[{"player_key": f"390.p.{player_index}"}]]}
+                for index, player_index in enumerate(
+                    range(batch_start, min(batch_start + batch_size, total_player_count))
+                )
+            }
+            if players:
+                players["count"] = len(players)
+            return build_response(
+                200, {"fantasy_content": {"league": [{"league_key": "390.l.729259"}, {"players": players or []}]}}
+            )
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=PlayerBatchSession())
+
+    league_players = offline_query.get_league_players()
+    assert [player.player_key for player in league_players] == [f"390.p.{index}" for index in range(60)]
+
+    requested_batches.clear()
+    league_players = offline_query.get_league_players(player_count_limit=30, player_count_start=5)
+    assert [player.player_key for player in league_players] == [f"390.p.{index}" for index in range(5, 30)]
+    # only the players up to the limit are requested and parsed
+    assert requested_batches == [(5, 25)]
+
+    requested_batches.clear()
+    league_players = offline_query.get_league_players(player_count_limit=3)
+    assert [player.player_key for player in league_players] == ["390.p.0", "390.p.1", "390.p.2"]
+    assert requested_batches == [(0, 3)]
+
+
+@pytest.mark.unit
+def test_get_league_players_stops_after_short_batch(offline_query, no_sleep, caplog):
+    """Unit test for not consuming the league player batches past a batch with fewer players than requested.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_players`.
+
+    Returns:
+        None
+
+    """
+    total_player_count = 60
+    requested_batches = []
+
+    class PlayerBatchSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            batch_start = int(url.split("start=")[1].split(";")[0])
+            batch_size = int(url.split("count=")[1])
+            requested_batches.append((batch_start, batch_size))
+            if batch_start >= total_player_count:
+                # batches past the last player fail without a payload, which would trigger individual retrievals
+                return build_response(400, {"error": {"description": "Invalid player"}}, url=url)
+            return build_response(200, {"fantasy_content": {"league": [
+                {"league_key": "390.l.729259"},
+                {"players": {
+                    **{str(index): {"player": [[{"player_key": f"390.p.{player_index}"}]]}
+                       for index, player_index in enumerate(
+                        range(batch_start, min(batch_start + batch_size, total_player_count)))},
+                    "count": min(batch_size, total_player_count - batch_start)
+                }}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=PlayerBatchSession())
+
+    with caplog.at_level(logging.DEBUG, logger="yfpy.query"):
+        league_players = offline_query.get_league_players()
+
+    assert [player.player_key for player in league_players] == [f"390.p.{index}" for index in range(60)]
+    # only the first window of batches is sent, and no players are retrieved individually after the short batch
+    assert all(batch_size == 25 for _, batch_size in requested_batches)
+    assert len(requested_batches) <= 8
+    assert "League player count: 60" in caplog.text
+
+
+@pytest.mark.unit
+def test_get_league_players_individual_retrieval(offline_query, no_sleep):
+    """Unit test for falling back to individual player retrieval when a league player batch fails.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_players`.
+
+    Returns:
+        None
+
+    """
+    failed_player_index = 2
+    requested_urls = []
+
+    class FailingPlayerBatchSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            batch_start = int(url.split("start=")[1].split(";")[0])
+            batch_size = int(url.split("count=")[1])
+            if batch_size > 1 or batch_start == failed_player_index:
+                return build_response(400, {"error": {"description": "Invalid player"}}, url=url)
+            return build_response(
+                200, {"fantasy_content": {"league": [
+                    {"league_key": "390.l.729259"},
+                    {"players": {"0": {"player": [[{"player_key": f"390.p.{batch_start}"}]]}, "count": 1}}
+                ]}}
+            )
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=FailingPlayerBatchSession())
+
+    league_players = offline_query.get_league_players(player_count_limit=5)
+    assert [player.player_key for player in league_players] == ["390.p.0", "390.p.1", "390.p.3", "390.p.4"]
+    assert len(requested_urls) == 6
+
+    # players that previously failed to be retrieved are not requested again
+    requested_urls.clear()
+    league_players = offline_query.get_league_players(player_count_limit=5)
+    assert [player.player_key for player in league_players] == ["390.p.0", "390.p.1", "390.p.3", "390.p.4"]
+    assert len(requested_urls) == 5
+    assert not any("start=2;count=1" in url for url in requested_urls)
+
+
+@pytest.mark.unit
+def test_query_replay(offline_query):
+    """Unit test for replaying queries from captured responses without authenticating or making requests.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query` and
+        :func:`~yfpy.query.YahooFantasySportsQuery.parse_response`.
+
+    Returns:
+        None
+
+    """
+    league_metadata_url = "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/metadata"
+    captured_responses = {
+        league_metadata_url: b'{"fantasy_content": {"league": [{"league_key": "390.l.729259", "season": "2019"}]}}'
+    }
+
+    offline_query._fetch_function = captured_responses.__getitem__
+    offline_query.league_key = "390.l.729259"
+
+    assert offline_query.get_league_metadata().season == 2019
+    assert offline_query.parse_response(captured_responses[league_metadata_url], ["league"], League).season == 2019
+
+    with pytest.raises(YahooFantasySportsDataNotFound):
+        offline_query.parse_response(b'{"error": {"description": "Invalid league"}}', ["league"])
+
+
+@pytest.mark.unit
+def test_get_league_scoreboards(offline_query):
+    """Unit test for concurrent retrieval of league scoreboards for multiple weeks.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_league_scoreboards`.
+
+    Returns:
+        None
+
+    """
+
+    class ScoreboardSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            week = int(url.split("week=")[1])
+            return build_response(
+                200, {"fantasy_content": {"league": [{"league_key": "390.l.729259"}, {"scoreboard": {"week": week}}]}}
+            )
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=ScoreboardSession())
+
+    scoreboards = offline_query.get_league_scoreboards(range(17, 0, -1))
+    assert list(scoreboards.keys()) == list(range(17, 0, -1))
+    assert all(scoreboard.week == week for week, scoreboard in scoreboards.items())
+
+
+@pytest.mark.unit
+def test_get_team_stats_by_weeks(offline_query):
+    """Unit test for concurrent retrieval of team stats for multiple weeks.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_team_stats_by_weeks`.
+
+    Returns:
+        None
+
+    """
+
+    class TeamStatsSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            week = int(url.split("week=")[1])
+            return build_response(200, {"fantasy_content": {"team": [
+                [{"team_key": "390.l.729259.t.1"}],
+                {"team_points": {"week": week, "total": week * 10.0}, "team_projected_points": {"week": week}}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=TeamStatsSession())
+
+    team_stats = offline_query.get_team_stats_by_weeks(1, range(17, 0, -1))
+    assert list(team_stats.keys()) == list(range(17, 0, -1))
+    assert all(stats["team_points"].total == week * 10.0 for week, stats in team_stats.items())
+
+
+@pytest.mark.unit
+def test_get_team_roster_player_info_by_dates(offline_query):
+    """Unit test for concurrent retrieval of team rosters with player info for multiple dates.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_info_by_dates`.
+
+    Returns:
+        None
+
+    """
+
+    class TeamRosterSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            chosen_date = url.split("date=")[1].split("/")[0]
+            response = build_response(200, {"fantasy_content": {"team": [
+                [{"team_key": "390.l.729259.t.1"}],
+                {"roster": {"0": {"players": {
+                    "0": {"player": [[{"player_key": "390.p.30977"}], {"selected_position": {"date": chosen_date}}]},
+                    "count": 1
+                }}}}
+            ]}}, headers={"Content-Length": "512"})
+            response.raw = io.BytesIO(response.content)
+            return response
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=TeamRosterSession())
+
+    chosen_dates = ["2011-05-03", "2011-05-01", "2011-05-02"]
+    rosters = offline_query.get_team_roster_player_info_by_dates(1, chosen_dates)
+    assert list(rosters.keys()) == chosen_dates
+    assert all(players[0].selected_position.date == chosen_date for chosen_date, players in rosters.items())
+
+
+@pytest.mark.unit
+def test_week_cache_ttl(offline_query):
+    """Unit test for never expiring cached league data of completed weeks.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_by_week`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+
+    class RosterSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            if url.endswith("/metadata"):
+                return build_response(200, {"fantasy_content": {"league": [
+                    {"league_key": "390.l.729259", "current_week": "10", "is_finished": 0}
+                ]}})
+            week = int(url.split("week=")[1])
+            return build_response(200, {"fantasy_content": {"team": [
+                [{"team_key": "390.l.729259.t.1"}], {"roster": {"week": week}}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=RosterSession())
+
+    assert offline_query._get_week_cache_ttl(1) == offline_query._cache_ttl
+    offline_query.get_league_metadata()
+    assert offline_query._get_week_cache_ttl(1) is None
+    assert offline_query._get_week_cache_ttl(9) == offline_query._cache_ttl
+    assert offline_query._get_week_cache_ttl("current") == offline_query._cache_ttl
+
+    for _ in range(2):
+        assert offline_query.get_team_roster_by_week(1, 1).week == 1
+    assert len(requested_urls) == 2
+    assert offline_query._query_cache.get(
+        offline_query._get_query_cache_key(requested_urls[-1], yfpy_query.TEAM_ROSTER_DATA_KEY_PATH, Roster)
+    ) is not None
+
+
+@pytest.mark.unit
+def test_draft_results_cache_ttl(offline_query):
+    """Unit test for never expiring cached draft results once the league draft is finished.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_team_draft_results`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"league": [
+            {"league_key": "390.l.729259", "current_week": "1", "draft_status": "predraft", "is_finished": 0}
+        ]}}),
+        build_response(200, {"fantasy_content": {"league": [
+            {"league_key": "390.l.729259", "current_week": "1", "draft_status": "postdraft", "is_finished": 0}
+        ]}})
+    ]))
+
+    offline_query.get_league_metadata()
+    assert offline_query._get_draft_results_cache_ttl() == offline_query._cache_ttl
+
+    offline_query.clear_cache()
+    offline_query.get_league_metadata()
+    assert offline_query._get_draft_results_cache_ttl() is None
+    assert offline_query._get_league_cache_ttl() == offline_query._cache_ttl
+
+
+@pytest.mark.unit
+def test_get_teams_roster_by_week(offline_query):
+    """Unit test for retrieving the rosters of multiple teams with a single request.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_teams_roster_by_week`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+
+    class TeamsSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            team_keys = url.split("team_keys=")[1].split("/")[0].split(",")
+            return build_response(200, {"fantasy_content": {"league": [
+                {"league_key": "390.l.729259"},
+                {"teams": {
+                    **{str(i): {"team": [[{"team_key": team_key}], {"roster": {"week": 1}}]}
+                       for i, team_key in enumerate(team_keys)},
+                    "count": len(team_keys)
+                }}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=TeamsSession())
+
+    rosters = offline_query.get_teams_roster_by_week(range(1, 4), 1)
+
+    assert requested_urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/teams;"
+        "team_keys=390.l.729259.t.1,390.l.729259.t.2,390.l.729259.t.3/roster;week=1"
+    ]
+    assert [roster.week for roster in rosters] == [1, 1, 1]
+
+
+@pytest.mark.unit
+def test_get_teams_roster_player_stats_by_week(offline_query):
+    """Unit test for retrieving the roster player stats of multiple teams with batched league-scoped requests.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_teams_roster_player_stats_by_week`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+
+    class LeagueSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            if "team_keys=" in url:
+                team_keys = url.split("team_keys=")[1].split("/")[0].split(",")
+                return build_response(200, {"fantasy_content": {"league": [
+                    {"league_key": "390.l.729259"},
+                    {"teams": {
+                        **{str(i): {"team": [[{"team_key": team_key}], {"roster": {"0": {"players": {
+                            **{str(j): {"player": [[{"player_key": f"390.p.{i}{j}"}]]} for j in range(2)},
+                            "count": 2
+                        }}}}]} for i, team_key in enumerate(team_keys)},
+                        "count": len(team_keys)
+                    }}
+                ]}})
+            player_keys = url.split("player_keys=")[1].split("/")[0].split(",")
+            return build_response(200, {"fantasy_content": {"league": [
+                {"league_key": "390.l.729259"},
+                {"players": {
+                    **{str(i): {"player": [[{"player_key": player_key}], {"player_points": {"week": 1}}]}
+                       for i, player_key in enumerate(reversed(player_keys))},
+                    "count": len(player_keys)
+                }}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=LeagueSession())
+
+    rosters = offline_query.get_teams_roster_player_stats_by_week([1, 2], 1)
+
+    assert requested_urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/teams;"
+        "team_keys=390.l.729259.t.1,390.l.729259.t.2/roster;week=1",
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/players;"
+        "player_keys=390.p.00,390.p.01,390.p.10,390.p.11/stats;type=week;week=1"
+    ]
+    assert {team_id: [player.player_key for player in players] for team_id, players in rosters.items()} == {
+        1: ["390.p.00", "390.p.01"],
+        2: ["390.p.10", "390.p.11"]
+    }
+    assert rosters[1][0].player_points.week == 1
+
+
+@pytest.mark.unit
+def test_get_teams_roster_player_stats_by_week_missing_player(offline_query, caplog):
+    """Unit test for skipping rostered players missing from the batched player stats response.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_teams_roster_player_stats_by_week`.
+
+    Returns:
+        None
+
+    """
+    dropped_player_key = "390.p.01"
+
+    class LeagueSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            if "team_keys=" in url:
+                return build_response(200, {"fantasy_content": {"league": [
+                    {"league_key": "390.l.729259"},
+                    {"teams": {"0": {"team": [[{"team_key": "390.l.729259.t.1"}], {"roster": {"0": {"players": {
+                        **{str(j): {"player": [[{"player_key": f"390.p.0{j}"}]]} for j in range(2)},
+                        "count": 2
+                    }}}}]}, "count": 1}}
+                ]}})
+            player_keys = [
+                player_key for player_key in url.split("player_keys=")[1].split("/")[0].split(",")
+                if player_key != dropped_player_key
+            ]
+            return build_response(200, {"fantasy_content": {"league": [
+                {"league_key": "390.l.729259"},
+                {"players": {
+                    **{str(i): {"player": [[{"player_key": player_key}], {"player_points": {"week": 1}}]}
+                       for i, player_key in enumerate(player_keys)},
+                    "count": len(player_keys)
+                }}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=LeagueSession())
+
+    with caplog.at_level(logging.WARNING, logger="yfpy.query"):
+        rosters = offline_query.get_teams_roster_player_stats_by_week([1], 1)
+
+    assert [player.player_key for player in rosters[1]] == ["390.p.00"]
+    assert dropped_player_key in caplog.text
+
+
+@pytest.mark.unit
+def test_get_players_stats_by_week(offline_query):
+    """Unit test for retrieving the stats of multiple players with one request per batch of players.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_players_stats_by_week`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+
+    class PlayersSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            player_keys = url.split("player_keys=")[1].split("/")[0].split(",")
+            return build_response(200, {"fantasy_content": {"league": [
+                {"league_key": "390.l.729259"},
+                {"players": {
+                    **{str(i): {"player": [[{"player_key": player_key}], {"player_points": {"week": 1}}]}
+                       for i, player_key in enumerate(player_keys)},
+                    "count": len(player_keys)
+                }}
+            ]}})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=PlayersSession())
+
+    player_keys = [f"390.p.{player_id}" for player_id in range(1, 31)]
+    players = offline_query.get_players_stats_by_week(player_keys, 1)
+
+    assert len(requested_urls) == 2
+    assert requested_urls[0].endswith(f"players;player_keys={','.join(player_keys[:25])}/stats;type=week;week=1")
+    assert [player.player_key for player in players] == player_keys
+    assert offline_query.get_players_stats_by_week(player_keys[:1], 1)[0].player_key == "390.p.1"
+
+
+@pytest.mark.unit
+def test_get_player_stats_by_week(offline_query):
+    """Unit test for retrieving the stats of a single player within and outside of the chosen league.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_by_week`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+    player_json = [[{"player_key": "390.p.30977"}], {"player_points": {"week": 1}}]
+
+    class PlayerSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            players_json = {"players": {"0": {"player": player_json}, "count": 1}}
+            if "/league/" in url:
+                return build_response(200, {"fantasy_content": {"league": [
+                    {"league_key": "390.l.729259"}, players_json
+                ]}})
+            return build_response(200, {"fantasy_content": players_json})
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=PlayerSession())
+
+    assert offline_query.get_player_stats_by_week("390.p.30977", 1).player_key == "390.p.30977"
+    assert offline_query.get_player_stats_by_week("390.p.30977", 1, limit_to_league_stats=False).player_points.week == 1
+    assert requested_urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/league/390.l.729259/players;player_keys=390.p.30977/"
+        "stats;type=week;week=1",
+        "https://fantasysports.yahooapis.com/fantasy/v2/players;player_keys=390.p.30977/stats;type=week;week=1"
+    ]
+
+
+@pytest.mark.unit
+def test_get_player_stats_by_week_prefetches_next_week(offline_query):
+    """Unit test for prefetching the player stats of the next week (up to the current week) into the query cache.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_by_week`.
+
+    Returns:
+        None
+
+    """
+    requested_urls = []
+
+    class PlayerSession(object):
+
+        def get(self, url: str, **kwargs) -> Response:
+            requested_urls.append(url)
+            week = int(url.rsplit("=", 1)[1])
+            return build_response(200, {"fantasy_content": {"players": {"0": {"player": [
+                [{"player_key": "390.p.30977"}], {"player_points": {"week": week}}
+            ]}, "count": 1}}})
+
+    offline_query.offline = False
+    offline_query.oauth = SimpleNamespace(session=PlayerSession())
+    offline_query._league_current_week = 2
+    offline_query._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+
+    assert offline_query.get_player_stats_by_week("390.p.30977", 1, limit_to_league_stats=False).player_points.week == 1
+    # wait for the prefetch of week 2 to be cached
+    offline_query._prefetch_executor.shutdown(wait=True)
+    assert requested_urls == [
+        "https://fantasysports.yahooapis.com/fantasy/v2/players;player_keys=390.p.30977/stats;type=week;week=1",
+        "https://fantasysports.yahooapis.com/fantasy/v2/players;player_keys=390.p.30977/stats;type=week;week=2"
+    ]
+
+    # week 2 is served from the prefetched results, and week 3 is past the current week so it is not prefetched
+    offline_query._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+    assert offline_query.get_player_stats_by_week("390.p.30977", 2, limit_to_league_stats=False).player_points.week == 2
+    offline_query.cleanup()
+    assert len(requested_urls) == 2
+
+
+@pytest.mark.unit
+def test_get_player_stats_by_date_validates_input(offline_query):
+    """Unit test for rejecting malformed player keys and dates without making a request.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_by_date`.
+
+    Returns:
+        None
+
+    """
+    session = MockSession([])
+    offline_query.offline = False
+    offline_query.league_key = "403.l.729259"
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    with pytest.raises(YahooFantasySportsException, match="Invalid date"):
+        offline_query.get_player_stats_by_date("nhl.p.4588", "05/01/2011")
+    with pytest.raises(YahooFantasySportsException, match="Invalid player key"):
+        offline_query.get_player_stats_by_date("4588", "2011-05-01")
+    with pytest.raises(YahooFantasySportsException, match="Invalid player key"):
+        offline_query.get_players_stats_by_date(["403.p.4588", "403.p"], "2011-05-01")
+    assert session.request_count == 0
+
+
+@pytest.mark.unit
+def test_get_player_stats_for_season_lazy(offline_query):
+    """Unit test for only parsing the accessed player data of lazily retrieved player stats.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_for_season`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"players": {"0": {"player": [
+            [{"player_key": "390.p.30977"}],
+            {"player_points": {"coverage_type": "season", "total": "359.14"}},
+            {"player_stats": {"coverage_type": "season", "stats": [{"stat": {"stat_id": "4", "value": "4381"}}]}}
+        ]}, "count": 1}}})
+    ]))
+
+    player = offline_query.get_player_stats_for_season("390.p.30977", limit_to_league_stats=False, lazy=True)
+
+    assert isinstance(player, LazyYahooObject)
+    assert player.player_key == "390.p.30977"
+    assert player.player_points.total == 359.14
+    assert "player_stats" not in player._children
+    assert offline_query.get_player_stats_for_season("390.p.30977", limit_to_league_stats=False, lazy=True) is player
+
+
+@pytest.mark.unit
+def test_get_player_stats_for_season_only_stat_ids(offline_query):
+    """Unit test for only unpacking and parsing selected player stats.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_for_season`.
+
+    Returns:
+        None
+
+    """
+    player_json = {"fantasy_content": {"league": [
+        {"league_key": "390.l.729259"},
+        {"players": {"0": {"player": [
+            [{"player_key": "390.p.30977"}],
+            {"player_stats": {
+                "0": {"coverage_type": "season"},
+                "stats": [{"stat": {"stat_id": str(stat_id), "value": str(stat_id * 10)}} for stat_id in range(1, 31)]
+            }}
+        ]}, "count": 1}}
+    ]}}
+    session = MockSession([build_response(200, player_json)])
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    player = offline_query.get_player_stats_for_season("390.p.30977", only_stat_ids=[4, "5"])
+    assert player.player_key == "390.p.30977"
+    assert player.player_stats.coverage_type == "season"
+    assert [(stat.stat_id, stat.value) for stat in player.player_stats.stats] == [(4, 40.0), (5, 50.0)]
+
+    # the unfiltered stats are cached, so different stats can be selected without requesting them again
+    player = offline_query.get_player_stats_for_season("390.p.30977", only_stat_ids=[30])
+    assert [stat.stat_id for stat in player.player_stats.stats] == [30]
+    assert session.request_count == 1
+
+
+@pytest.mark.unit
+def test_clear_cache(offline_query):
+    """Unit test for reusing cached team draft results until the query cache is cleared.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.clear_cache`.
+
+    Returns:
+        None
+
+    """
+    draft_results_json = {"fantasy_content": {"team": [
+        [{"team_key": "390.l.729259.t.1"}],
+        {"draft_results": {"0": {"draft_result": {"pick": 4, "round": 1}}, "count": 1}}
+    ]}}
+    session = MockSession([build_response(200, draft_results_json), build_response(200, draft_results_json)])
+
+    offline_query.offline = False
+    offline_query.league_key = "390.l.729259"
+    offline_query.oauth = SimpleNamespace(session=session)
+
+    assert offline_query.get_team_draft_results(1)[0].pick == 4
+    assert offline_query.get_team_draft_results(1)[0].pick == 4
+    assert session.request_count == 1
+
+    offline_query.clear_cache()
+    assert offline_query.get_team_draft_results(1)[0].pick == 4
+    assert session.request_count == 2
+
+
+@pytest.mark.unit
+def test_query_returns_single_item_collections_as_lists(offline_query):
+    """Unit test for returning Yahoo collections containing a single item as lists.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.get_user_leagues_by_game_key`.
+
+    Returns:
+        None
+
+    """
+    offline_query.offline = False
+    offline_query.oauth = SimpleNamespace(session=MockSession([
+        build_response(200, {"fantasy_content": {"users": {"0": {"user": [
+            [{"guid": "ABC"}],
+            {"games": {"0": {"game": [
+                {"game_key": "390"},
+                {"leagues": {"0": {"league": [{"league_key": "390.l.729259", "season": "2019"}]}, "count": 1}}
+            ]}, "count": 1}}
+        ]}, "count": 1}}})
+    ]))
+
+    leagues = offline_query.get_user_leagues_by_game_key(390)
+    assert isinstance(leagues, list)
+    assert [league.league_key for league in leagues] == ["390.l.729259"]
+
+
+@pytest.mark.unit
+def test_prewarm(offline_query):
+    """Unit test for validating the OAuth token and opening a connection in the background before the first query.
+
+    Note:
+        Tests :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+    Returns:
+        None
+
+    """
+    requests = []
+    head_started = threading.Event()
+    release_head = threading.Event()
+
+    class PrewarmSession(MockSession):
+
+        def head(self, url: str, **kwargs) -> Response:
+            head_started.set()
+            release_head.wait(5)
+            requests.append(("HEAD", url))
+            return build_response(200, {})
+
+        def get(self, url: str, **kwargs) -> Response:
+            requests.append(("GET", url))
+            return super().get(url, **kwargs)
+
+    offline_query.offline = False
+    offline_query.oauth = SimpleNamespace(
+        access_token="token",
+        token_is_valid=lambda: True,
+        session=PrewarmSession([build_response(200, {"fantasy_content": {"game": [{"game_key": "390"}]}})])
+    )
+    offline_query._start_prewarm()
+    assert head_started.wait(5)
+
+    # the first query waits for the prewarm that is still in progress
+    threading.Timer(0.05, release_head.set).start()
+    offline_query.query("https://fantasysports.yahooapis.com/fantasy/v2/game/nfl", ["game"], Game)
+
+    assert requests == [
+        ("HEAD", "https://fantasysports.yahooapis.com/fantasy/v2"),
+        ("GET", "https://fantasysports.yahooapis.com/fantasy/v2/game/nfl")
+    ]
+    assert offline_query._prewarm_future is None
@@ -5,9 +5,20 @@
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
+import json
+import math
+import pickle
+from io import StringIO
+
 import pytest
 
-from yfpy.utils import prettify_data
+from yfpy import utils as yfpy_utils
+from yfpy.models import Game, Player, TeamPoints, YahooFantasyObject
+from yfpy.utils import (
+    complex_json_handler, compile_data_key_path, convert_strings_to_numeric_equivalents, get_json_list_value,
+    get_subclasses, get_type, jsonify_data, jsonify_data_to_file, load_json, prettify_data, reformat_json_list,
+    unpack_data
+)
 
 
 @pytest.mark.unit
@@ -35,6 +46,98 @@ def test_prettify_data():
     assert result == expected
 
 
+@pytest.mark.unit
+def test_jsonify_data():
+    """Unit test for util used to serialize YFPY objects to JSON strings.
+
+    Note:
+        Tests :func:`~yfpy.utils.jsonify_data`.
+
+    Returns:
+        None
+
+    """
+    data = [Game({"game_key": "390", "name": "Football é", "season": 2019}), {1: "non-string key"}]
+
+    for item in data:
+        assert jsonify_data(item) == json.dumps(item, indent=2, ensure_ascii=False, default=complex_json_handler)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_jsonify_data_floats(monkeypatch, use_orjson):
+    """Unit test for util used to serialize floats in exponent notation and NaN floats to JSON strings and files.
+
+    Note:
+        Tests :func:`~yfpy.utils.jsonify_data` and :func:`~yfpy.utils.jsonify_data_to_file`.
+
+    Returns:
+        None
+
+    """
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(yfpy_utils, "orjson", None)
+
+    data = {"small": 1e-7, "large": 1e16, "nan": float("nan")}
+
+    data_file = StringIO()
+    jsonify_data_to_file(data, data_file)
+    assert data_file.getvalue() == jsonify_data(data)
+
+    result = json.loads(jsonify_data(data))
+    assert result["small"] == 1e-7
+    assert result["large"] == 1e16
+    if use_orjson:
+        assert result["nan"] is None
+    else:
+        assert jsonify_data(data) == json.dumps(data, indent=2, ensure_ascii=False)
+        assert math.isnan(result["nan"])
+
+
+@pytest.mark.unit
+def test_load_json():
+    """Unit test for util used to deserialize JSON documents.
+
+    Note:
+        Tests :func:`~yfpy.utils.load_json`.
+
+    Returns:
+        None
+
+    """
+    assert load_json(b'{"fantasy_content": {"league": [{"league_key": "390.l.729259"}]}}') == {
+        "fantasy_content": {"league": [{"league_key": "390.l.729259"}]}
+    }
+    assert load_json('{"name": "Wrenasaurus"}') == {"name": "Wrenasaurus"}
+
+    with pytest.raises(ValueError):
+        load_json(b"<html></html>")
+
+
+@pytest.mark.unit
+def test_load_json_msgspec(monkeypatch):
+    """Unit test for util used to deserialize JSON documents with msgspec when orjson is not installed.
+
+    Note:
+        Tests :func:`~yfpy.utils.load_json`.
+
+    Returns:
+        None
+
+    """
+    monkeypatch.setattr(yfpy_utils, "msgspec", pytest.importorskip("msgspec"))
+    monkeypatch.setattr(yfpy_utils, "orjson", None)
+
+    assert load_json(b'{"fantasy_content": {"league": [{"league_key": "390.l.729259"}]}}') == {
+        "fantasy_content": {"league": [{"league_key": "390.l.729259"}]}
+    }
+
+    with pytest.raises(ValueError):
+        load_json(b"<html></html>")
+
+
 @pytest.mark.unit
 def test_unpack_data():
     """Unit test for util used to unpack nested data.
@@ -50,6 +153,52 @@ def test_unpack_data():
     """
 
 
+@pytest.mark.unit
+def test_unpack_data_player_model():
+    """Unit test for unpacking nested data into a Player model with all attributes available through its __dict__.
+
+    Note:
+        Tests :func:`~yfpy.utils.unpack_data`.
+
+    Returns:
+        None
+
+    """
+    player = Player(unpack_data([
+        [{"player_key": "390.p.30977"}, {"name": {"full": "Josh Allen", "first": "Josh", "last": "Allen"}}],
+        {"player_points": {"coverage_type": "week", "week": "1", "total": "12.5"}}
+    ], YahooFantasyObject))
+
+    assert vars(player)["full_name"] == "Josh Allen"
+    assert vars(player)["player_key"] == "390.p.30977"
+    assert player.full_name == "Josh Allen"
+    assert player.player_points_value == 12.5
+    assert json.loads(player.to_json()) == {
+        "name": {"first": "Josh", "full": "Josh Allen", "last": "Allen"},
+        "player_key": "390.p.30977",
+        "player_points": {"coverage_type": "week", "total": 12.5, "week": 1}
+    }
+    assert pickle.loads(pickle.dumps(player)) == player
+
+
+@pytest.mark.unit
+def test_get_subclasses():
+    """Unit test for util used to map snake case subclass names to subclasses for casting.
+
+    Note:
+        Tests :func:`~yfpy.utils.get_subclasses`.
+
+    Returns:
+        None
+
+    """
+    subclasses = get_subclasses(YahooFantasyObject)
+
+    assert subclasses["game"] is Game
+    assert subclasses["team_points"] is TeamPoints
+    assert get_subclasses(YahooFantasyObject) is subclasses
+
+
 @pytest.mark.unit
 def test_convert_strings_to_numeric_equivalents():
     """Unit test for util used to convert strings to their numerical equivalents.
@@ -57,12 +206,20 @@ def test_convert_strings_to_numeric_equivalents():
     Note:
         Tests :func:`~yfpy.utils.convert_strings_to_numeric_equivalents`.
 
-    TODO: write unit test
-
     Returns:
         None
 
     """
+    assert convert_strings_to_numeric_equivalents("10") == 10
+    assert convert_strings_to_numeric_equivalents("-8.5") == -8.5
+    assert convert_strings_to_numeric_equivalents("0") == 0
+    assert convert_strings_to_numeric_equivalents("007") == "007"
+    assert convert_strings_to_numeric_equivalents("1.2.3") == "1.2.3"
+    assert convert_strings_to_numeric_equivalents("nfl.p.3727") == "nfl.p.3727"
+    assert convert_strings_to_numeric_equivalents(".5") == 0.5
+    assert convert_strings_to_numeric_equivalents("-") == "-"
+    assert convert_strings_to_numeric_equivalents("") == ""
+    assert convert_strings_to_numeric_equivalents(None) is None
 
 
 @pytest.mark.unit
@@ -72,12 +229,16 @@ def test_get_type():
     Note:
         Tests :func:`~yfpy.utils.get_type`.
 
-    TODO: write unit test
-
     Returns:
         None
 
     """
+    game_data = {"game_key": 390, "code": "nfl"}
+    json_obj_dict = get_type({"game": game_data, "count": 1}, YahooFantasyObject, get_subclasses(YahooFantasyObject))
+
+    assert isinstance(json_obj_dict["game"], Game)
+    assert json_obj_dict["game"].code == "nfl"
+    assert json_obj_dict["count"] == 1
 
 
 @pytest.mark.unit
@@ -183,3 +344,59 @@ def test_reformat_json_list():
         None
 
     """
+
+
+@pytest.mark.unit
+def test_get_json_list_value():
+    """Unit test for util used to look up data keys in Yahoo JSON lists without building chain maps.
+
+    Note:
+        Tests :func:`~yfpy.utils.get_json_list_value`.
+
+    Returns:
+        None
+
+    """
+    json_list = [[{"player_key": "nfl.p.3727"}, {}, {"name": {"full": "Adam Vinatieri"}}], {"player_points": 8.5}]
+
+    assert get_json_list_value(json_list, "name") == {"full": "Adam Vinatieri"}
+    assert get_json_list_value(json_list, "player_points") == 8.5
+    assert get_json_list_value(json_list, "ownership") is None
+    assert get_json_list_value(json_list, "ownership", 0) == 0
+
+    for data_key in ("player_key", "name", "player_points", "ownership"):
+        assert get_json_list_value(json_list, data_key) == reformat_json_list(json_list).get(data_key)
+
+
+@pytest.mark.unit
+def test_compile_data_key_path():
+    """Unit test for util used to compile a data key path into a reusable data extraction function.
+
+    Note:
+        Tests :func:`~yfpy.utils.compile_data_key_path`.
+
+    Returns:
+        None
+
+    """
+    json_obj = {
+        "users": {
+            "0": {
+                "user": [
+                    {"guid": "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+                    {"games": {"count": 0}}
+                ]
+            },
+            "count": 1
+        }
+    }
+
+    extract_games = compile_data_key_path(("users", "0", "user", "games"))
+
+    assert extract_games(json_obj) == {"count": 0}
+    assert compile_data_key_path(("users", "0", "user", ("guid", "games")))(json_obj) == [
+        {"guid": "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+        {"games": {"count": 0}}
+    ]
+    assert compile_data_key_path(("users", "1", "user"))(json_obj) is None
+    assert compile_data_key_path(("users", "0", "user", "games")) is extract_games
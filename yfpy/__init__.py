@@ -4,8 +4,9 @@ __email__ = "uberfastman@uberfastman.dev"
 from yfpy.data import Data
 from yfpy.exceptions import YahooFantasySportsException, YahooFantasySportsDataNotFound
 from yfpy.logger import get_logger
-from yfpy.models import User, Game, League, Team, Standings, Manager, RosterAdds, TeamLogo, TeamPoints, \
-    TeamStandings, OutcomeTotals, Streak, Settings, RosterPosition, StatCategories, StatModifiers, Stat, \
+from yfpy.models import LazyYahooObject, User, Game, League, Team, Standings, Manager, RosterAdds, TeamLogo, \
+    TeamPoints, TeamStandings, OutcomeTotals, Streak, Settings, RosterPosition, StatCategories, StatModifiers, Stat, \
     StatPositionType, Bonus, Matchup, MatchupGrade, Player, ByeWeeks, Headshot, Name, PlayerPoints, PlayerStats, \
     SelectedPosition
 from yfpy.query import YahooFantasySportsQuery
+from yfpy.async_query import AsyncYahooFantasySportsQuery
@@ -0,0 +1,1647 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for making concurrent Yahoo Fantasy Sports REST API queries with asyncio.
+
+This module provides asynchronous versions of the Yahoo Fantasy Sports API queries on the AsyncYahooFantasySportsQuery
+    class, which share a single aiohttp client session so that independent queries can be run concurrently.
+
+Note:
+    Requires the optional aiohttp dependency (pip install aiohttp), and the optional httpx dependency with HTTP/2
+    support (pip install httpx[http2]) to send concurrent queries as multiplexed HTTP/2 streams. The synchronous methods
+    that run concurrent queries use the faster uvloop event loop when the optional uvloop dependency is installed (pip
+    install uvloop), or the event loop created by the loop_factory of AsyncYahooFantasySportsQuery when one is provided.
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    ASYNC_CONNECTION_LIMIT (int): Default maximum number of simultaneous connections to the Yahoo Fantasy Sports API.
+    ASYNC_REQUEST_TIMEOUT_SECONDS (float): Number of seconds asynchronous requests to the Yahoo Fantasy Sports API may
+        take before they time out.
+    ASYNC_PLAYER_BATCH_WINDOW_SECONDS (float): Number of seconds player queries made within a batch_players context wait
+        for other player queries of the same kind to be batched with.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from requests.exceptions import HTTPError
+
+from yfpy.exceptions import YahooFantasySportsDataNotFound, YahooFantasySportsException
+from yfpy.models import DraftResult, Game, GameWeek, LazyYahooObject, League, Matchup, Player, PositionType, Roster, \
+    RosterPosition, Scoreboard, Settings, Standings, StatCategories, Team, TeamPoints, TeamProjectedPoints, \
+    TeamStandings, Transaction
+from yfpy.query import GAME_INFO_SUBRESOURCES, LEAGUE_MATCHUPS_DATA_KEY_PATH, LEAGUE_PLAYER_DATA_KEY_PATH, \
+    LEAGUE_PLAYERS_BATCH_SIZE, PLAYER_DATA_KEY_PATH, PLAYER_INFO_SUBRESOURCES, TEAM_DATA_KEY_PATH, \
+    TEAM_DRAFT_RESULTS_DATA_KEY_PATH, TEAM_INFO_SUBRESOURCES, TEAM_MATCHUPS_DATA_KEY_PATH, TEAM_POINTS_DATA_KEY_PATH, \
+    TEAM_ROSTER_DATA_KEY_PATH, TEAM_ROSTER_PLAYERS_DATA_KEY_PATH, TEAM_STANDINGS_DATA_KEY_PATH, \
+    TEAM_WEEK_POINTS_DATA_KEY_PATH, YAHOO_FANTASY_API_BASE_URL, YahooFantasySportsQuery, _check_date, \
+    _check_player_key, _check_team_id, _sort_by_game_season, _sort_by_position_type, _sort_by_roster_position
+from yfpy.utils import load_json
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+logger = logging.getLogger(__name__)
+
+# maximum number of simultaneous connections to Yahoo, which keeps concurrent queries within Yahoo's rate limits
+ASYNC_CONNECTION_LIMIT: int = 8
+
+# total time (in seconds) asynchronous requests may take, which matches the aiohttp default for both HTTP clients, since
+# the httpx default (5 seconds per read) times out while Yahoo is still generating large responses
+ASYNC_REQUEST_TIMEOUT_SECONDS: float = 5 * 60.0
+
+# time (in seconds) player queries wait to be coalesced with concurrent player queries of the same kind when batched
+ASYNC_PLAYER_BATCH_WINDOW_SECONDS: float = 0.005
+
+
+# noinspection PyTypeChecker
+class AsyncYahooFantasySportsQuery(YahooFantasySportsQuery):
+    """Yahoo Fantasy Sports REST API query CLASS with asynchronous query methods that can be run concurrently.
+
+    Authentication is handled by the synchronous YahooFantasySportsQuery, and its access token is sent as a bearer token
+    by a shared aiohttp client session. Client sessions are closed by aclose (or async with) for asynchronous methods,
+    and by cleanup (or with) for synchronous methods.
+    """
+
+    __slots__ = (
+        "_connection_limit", "_http2", "_aiohttp_sessions", "_httpx_clients", "_loop_factory", "_sync_event_loop",
+        "_sync_event_loop_thread", "_sync_lock", "_player_batching", "_pending_player_batches", "_ainflight"
+    )
+
+    def __init__(self, *args, connection_limit: int = ASYNC_CONNECTION_LIMIT, http2: bool = False,
+                 loop_factory: Callable[[], asyncio.AbstractEventLoop] = None, **kwargs):
+        """Instantiate an AsyncYahooFantasySportsQuery for running concurrent queries against the Yahoo REST API.
+
+        Args:
+            *args: Positional arguments passed to YahooFantasySportsQuery.
+            connection_limit (int, optional): Maximum number of simultaneous connections to the Yahoo Fantasy Sports
+                API.
+            http2 (bool, optional): Boolean to send queries with an httpx client that multiplexes concurrent queries as
+                HTTP/2 streams over shared connections (falling back to HTTP/1.1 if Yahoo does not negotiate HTTP/2)
+                instead of with an aiohttp client session.
+            loop_factory (Callable[[], asyncio.AbstractEventLoop], optional): Function creating the event loop that
+                runs the synchronous methods (such as the new_event_loop function of an alternative event loop
+                implementation). Defaults to uvloop.new_event_loop when the optional uvloop dependency is installed, and
+                to asyncio.new_event_loop otherwise.
+            **kwargs: Keyword arguments passed to YahooFantasySportsQuery.
+
+        """
+        if aiohttp is None:
+            raise YahooFantasySportsException(
+                "AsyncYahooFantasySportsQuery requires the aiohttp package. Please install it with: pip install aiohttp"
+            )
+        if http2 and httpx is None:
+            raise YahooFantasySportsException(
+                "AsyncYahooFantasySportsQuery with http2=True requires the httpx package with HTTP/2 support. Please "
+                "install it with: pip install httpx[http2]"
+            )
+
+        super().__init__(*args, **kwargs)
+        self._connection_limit: int = connection_limit
+        self._http2: bool = http2
+        # client sessions are bound to the event loop they were created in, so each event loop gets its own clients
+        self._aiohttp_sessions: Dict[asyncio.AbstractEventLoop, "aiohttp.ClientSession"] = {}
+        self._httpx_clients: Dict[asyncio.AbstractEventLoop, "httpx.AsyncClient"] = {}
+        self._loop_factory: Callable[[], asyncio.AbstractEventLoop] = loop_factory or (
+            uvloop.new_event_loop if uvloop is not None else asyncio.new_event_loop
+        )
+        # event loop kept running in a background thread by the synchronous methods so that their pooled keep-alive
+        # connections are reused across calls and concurrent calls from multiple threads share them
+        self._sync_event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_event_loop_thread: Optional[threading.Thread] = None
+        self._sync_lock = threading.Lock()
+        # number of entered batch_players contexts and pending player query batches by kind of player query
+        self._player_batching: int = 0
+        self._pending_player_batches: Dict[Tuple[str, bool, Optional[float]], Dict[str, asyncio.Future]] = {}
+        # in-flight asynchronous requests shared by concurrent queries of the same URL
+        self._ainflight: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def _get_aiohttp_session(self) -> "aiohttp.ClientSession":
+        """Retrieve the shared aiohttp client session of the running event loop, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Client session with a connection pool limited to the configured number of
+            connections.
+
+        """
+        loop = asyncio.get_running_loop()
+        session = self._aiohttp_sessions.get(loop)
+        if session is None or session.closed:
+            # aiohttp advertises every compression it can decode (including brotli when it is installed) by default
+            session = self._aiohttp_sessions[loop] = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._connection_limit),
+                timeout=aiohttp.ClientTimeout(total=ASYNC_REQUEST_TIMEOUT_SECONDS)
+            )
+        return session
+
+    def _get_httpx_client(self) -> "httpx.AsyncClient":
+        """Retrieve the shared HTTP/2 httpx client of the running event loop, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: HTTP/2 client with a connection pool limited to the configured number of connections.
+
+        """
+        loop = asyncio.get_running_loop()
+        client = self._httpx_clients.get(loop)
+        if client is None or client.is_closed:
+            try:
+                # keep every pooled connection alive so that concurrent queries keep multiplexing over open connections
+                client = self._httpx_clients[loop] = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=self._connection_limit, max_keepalive_connections=self._connection_limit
+                    ),
+                    timeout=ASYNC_REQUEST_TIMEOUT_SECONDS
+                )
+            except ImportError as e:
+                raise YahooFantasySportsException(
+                    f"AsyncYahooFantasySportsQuery with http2=True requires HTTP/2 support for httpx ({e}). Please "
+                    f"install it with: pip install httpx[http2]"
+                )
+        return client
+
+    async def aclose(self) -> None:
+        """Close the shared aiohttp client session (and HTTP/2 httpx client) of the running event loop.
+
+        Returns:
+            None
+
+        """
+        loop = asyncio.get_running_loop()
+        session = self._aiohttp_sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
+        client = self._httpx_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    def cleanup(self) -> None:
+        """Close the client sessions, event loop, and event loop thread used by the synchronous methods, and cleanup
+        temporary files and directories, close the disk query cache (if one exists), and cancel any pending request
+        retries.
+
+        Returns:
+            None
+
+        """
+        with self._sync_lock:
+            if self._sync_event_loop is not None:
+                asyncio.run_coroutine_threadsafe(self.aclose(), self._sync_event_loop).result()
+                self._sync_event_loop.call_soon_threadsafe(self._sync_event_loop.stop)
+                self._sync_event_loop_thread.join()
+                self._sync_event_loop.close()
+                self._sync_event_loop = None
+                self._sync_event_loop_thread = None
+        super().cleanup()
+
+    async def _aget(self, url: str, access_token: str) -> Tuple[Any, int, str, bytes]:
+        """Asynchronously send a single request to the Yahoo Fantasy Sports REST API with the shared HTTP/2 httpx client
+        or aiohttp client session.
+
+        Args:
+            url (str): REST API request URL string.
+            access_token (str): OAuth access token sent as a bearer token.
+
+        Returns:
+            tuple(Any, int, str, bytes): API response (httpx.Response or aiohttp.ClientResponse), its status code, its
+            reason phrase, and its raw content.
+
+        """
+        headers = {"Authorization": f"Bearer {access_token}"}
+        if self._http2:
+            response = await self._get_httpx_client().get(url, params={"format": "json"}, headers=headers)
+            logger.debug("Response HTTP version: %s", response.http_version)
+            return response, response.status_code, response.reason_phrase, response.content
+
+        session = await self._get_aiohttp_session()
+        async with session.get(url, params={"format": "json"}, headers=headers) as response:
+            return response, response.status, response.reason, await response.read()
+
+    async def _aget_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        """Asynchronously retrieve Yahoo Fantasy Sports data from the REST API along with its decoded JSON content.
+
+        Concurrent requests to the same URL share a single in-flight request, so that each URL is only requested once
+        at a time.
+
+        Args:
+            url (str): REST API request URL string.
+
+        Returns:
+            tuple(Any, dict[str, Any]): API response (httpx.Response or aiohttp.ClientResponse) from Yahoo Fantasy
+            Sports API request and its decoded JSON.
+
+        """
+        # in-flight requests are bound to the event loop they were started in
+        inflight_key = (asyncio.get_running_loop(), url)
+        inflight_request = self._ainflight.get(inflight_key)
+        if inflight_request is None:
+            inflight_request = self._ainflight[inflight_key] = asyncio.ensure_future(self._arequest_response_data(url))
+            inflight_request.add_done_callback(lambda _: self._ainflight.pop(inflight_key, None))
+        else:
+            logger.debug("Waiting for in-flight request to URL: %s", url)
+
+        # shield the shared request so that a cancelled caller does not cancel it for the other callers
+        return await asyncio.shield(inflight_request)
+
+    async def _arequest_response_data(self, url: str) -> Tuple[Any, Dict[str, Any]]:
+        """Asynchronously request Yahoo Fantasy Sports data from the REST API and decode its JSON content.
+
+        Failed requests are retried up to the configured number of retries using exponential backoff with full jitter.
+
+        Args:
+            url (str): REST API request URL string.
+
+        Returns:
+            tuple(Any, dict[str, Any]): API response (httpx.Response or aiohttp.ClientResponse) from Yahoo Fantasy
+            Sports API request and its decoded JSON.
+
+        """
+        if self._is_access_token_expiring():
+            # refreshing the token is a blocking request, so run it outside the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._refresh_access_token, self.oauth.access_token
+            )
+
+        response = None
+        response_json = {}
+        for attempt in range(self._retries + 1):
+            logger.debug("Making asynchronous request to URL: %s", url)
+            access_token = self.oauth.access_token
+            request_start_time = time.monotonic()
+            response, status_code, reason, response_content = await self._aget(url, access_token)
+
+            # when you exceed Yahoo's allowed data request limits, they throw a request status code of 999
+            if status_code == 999:
+                raise HTTPError("Yahoo data unavailable due to rate limiting. Please try again later.")
+
+            if status_code == 401 and attempt < self._retries:
+                # refreshing the token is a blocking request, so run it outside the event loop
+                await asyncio.get_running_loop().run_in_executor(None, self._refresh_access_token, access_token)
+                continue
+
+            try:
+                response_json = {}
+                # skip decoding error responses that cannot contain a Yahoo error description
+                if not self._has_decodable_body(status_code, response.headers.get("Content-Type")):
+                    raise HTTPError(f"{status_code} Error: {reason} for url: {response.url}")
+
+                logger.debug("Response content encoding: %s", response.headers.get("Content-Encoding", "identity"))
+                try:
+                    # decode the raw response bytes directly (with orjson when it is installed)
+                    response_json = load_json(response_content)
+                    logger.debug("Response (JSON): %s", response_json)
+                except ValueError:
+                    pass
+
+                elapsed_seconds = time.monotonic() - request_start_time
+                self._check_response_error(status_code, response_json, str(response.url))
+                if status_code >= 400:
+                    raise HTTPError(f"{status_code} Error: {reason} for url: {response.url}")
+                break
+
+            except HTTPError as e:
+                remaining_retries = self._retries - attempt
+                if remaining_retries > 0:
+                    # retry with exponential back-off and full jitter
+                    delay = self._get_retry_delay(response, attempt)
+                    logger.warning(f"Request for URL {url} failed with status code {status_code}. "
+                                   f"Retrying {remaining_retries} more time{'s' if remaining_retries > 1 else ''} "
+                                   f"in {delay:.2f} seconds...")
+                    await asyncio.sleep(delay)
+                else:
+                    # log error and terminate query if status code is not 200 after all retries
+                    logger.error(f"Request failed with status code: {status_code} - {e}")
+                    raise
+
+        self._check_fantasy_content(response_json, str(response.url))
+
+        self._record_executed_query(str(response.url), status_code, elapsed_seconds)
+
+        return response, response_json
+
+    async def aquery(self, url: str, data_key_list: Union[List[str], List[List[str]]], data_type_class: Type = None,
+                     sort_function: Callable = None, cache: bool = False, lazy: bool = False, raw: bool = False,
+                     cache_ttl: float = None
+                     ) -> (Union[str, YahooFantasySportsQuery.YFO, List[YahooFantasySportsQuery.YFO],
+                                 Dict[str, YahooFantasySportsQuery.YFO], LazyYahooObject, Any]):
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.query`.
+
+        Args:
+            url (str): REST API request URL string.
+            data_key_list (list[str] | list[list[str]] | tuple): List (or tuple) of keys used to extract the specific
+                data desired by the given query.
+            data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
+                data).
+            sort_function (Callable of sort function, optional)): Optional lambda function to return sorted query
+                results.
+            cache (bool, optional): Boolean to reuse previously parsed results for the same query instead of
+                requesting them again (until they expire after cache_ttl seconds).
+            lazy (bool, optional): Boolean to return a LazyYahooObject instead of unpacking all retrieved data.
+            raw (bool, optional): Boolean to return the raw JSON data extracted at the data key path without unpacking
+                or parsing it.
+            cache_ttl (float, optional): Number of seconds until cached results expire (never expire when not
+                provided).
+
+        Returns:
+            object: Model class instance from yfpy/models.py, dictionary, or list (depending on query), with unpacked
+            and parsed response data.
+
+        """
+        if not self.offline:
+            cache_key = None
+            if cache:
+                result_type = self._get_result_type(data_type_class, lazy, raw)
+                cache_key = self._get_query_cache_key(url, data_key_list, result_type)
+                cached_query_data = self._get_cached_query_data(cache_key, lazy or raw)
+                if cached_query_data is not None:
+                    return cached_query_data
+
+            response, response_json = await self._aget_response_data(url)
+            return self._parse_query_data(
+                str(response.url), response_json, data_key_list, data_type_class, sort_function, cache_key, lazy, raw,
+                cache_ttl
+            )
+
+        else:
+            logger.error("Cannot run Yahoo query while using offline mode! Please try again with offline=False.")
+
+    async def agather_queries(self, urls: Iterable[str], data_key_list: Union[List[str], List[List[str]]],
+                              data_type_class: Type = None) -> List[Any]:
+        """Concurrently run the same kind of query for multiple REST API request URLs.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> from yfpy.models import Team
+            >>> async def get_teams():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.agather_queries(
+            ...             [f"https://fantasysports.yahooapis.com/fantasy/v2/team/406.l.413954.t.{team_id}/metadata"
+            ...              for team_id in range(1, 11)],
+            ...             ("team",),
+            ...             Team
+            ...         )
+            >>> asyncio.run(get_teams())
+            [
+              Team({...}),
+              ...,
+              Team({...})
+            ]
+
+        Args:
+            urls (Iterable[str]): REST API request URL strings.
+            data_key_list (list[str] | list[list[str]] | tuple): List (or tuple) of keys used to extract the specific
+                data desired by each query.
+            data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
+                data).
+
+        Returns:
+            list[Any]: Query results in the same order as the REST API request URLs.
+
+        """
+        return list(await asyncio.gather(*(self.aquery(url, data_key_list, data_type_class) for url in urls)))
+
+    async def aget_all_yahoo_fantasy_game_keys(self) -> List[Game]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_all_yahoo_fantasy_game_keys`.
+
+        Returns:
+            list[Game]: List of YFPY Game instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/games;game_codes={self.game_code}",
+            ("games",),
+            sort_function=_sort_by_game_season,
+            cache=True
+        )
+
+    async def aget_game_key_by_season(self, season: int) -> str:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_key_by_season`.
+
+        Args:
+            season (int): User defined season/year for which to retrieve the Yahoo Fantasy Sports game.
+
+        Returns:
+            str: The game key for a Yahoo Fantasy Sports game specified by season.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/games;game_codes={self.game_code};seasons={season}",
+            ("games", "0", "game", "game_key"),
+            cache=True,
+            raw=True
+        )
+
+    async def aget_current_game_info(self) -> Game:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_current_game_info`.
+
+        Returns:
+            Game: YFPY Game instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{self.game_code};out={GAME_INFO_SUBRESOURCES}",
+            ("game",),
+            Game
+        )
+
+    async def aget_current_game_metadata(self) -> Game:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_current_game_metadata`.
+
+        Returns:
+            Game: YFPY Game instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{self.game_code}/metadata",
+            ("game",),
+            Game
+        )
+
+    async def aget_game_info_by_game_id(self, game_id: int) -> Game:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_info_by_game_id`.
+
+        Args:
+            game_id (int): Game ID for which to retrieve the game info.
+
+        Returns:
+            Game: YFPY Game instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id};out={GAME_INFO_SUBRESOURCES}",
+            ("game",),
+            Game
+        )
+
+    async def aget_game_metadata_by_game_id(self, game_id: int) -> Game:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_metadata_by_game_id`.
+
+        Args:
+            game_id (int): Game ID for which to retrieve the game metadata.
+
+        Returns:
+            Game: YFPY Game instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/metadata",
+            ("game",),
+            Game,
+            cache=True
+        )
+
+    async def aget_game_weeks_by_game_id(self, game_id: int) -> List[GameWeek]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_weeks_by_game_id`.
+
+        Args:
+            game_id (int): Game ID for which to retrieve the game weeks.
+
+        Returns:
+            list[GameWeek]: List of YFPY GameWeek instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/game_weeks",
+            ("game", "game_weeks"),
+            cache=True
+        )
+
+    async def aget_game_stat_categories_by_game_id(self, game_id: int) -> StatCategories:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_stat_categories_by_game_id`.
+
+        Args:
+            game_id (int): Game ID for which to retrieve the game stat categories.
+
+        Returns:
+            StatCategories: YFPY StatCategories instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/stat_categories",
+            ("game", "stat_categories"),
+            StatCategories,
+            cache=True
+        )
+
+    async def aget_game_position_types_by_game_id(self, game_id: int) -> List[PositionType]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_position_types_by_game_id`.
+
+        Args:
+            game_id (int): Game ID for which to retrieve the game position types.
+
+        Returns:
+            list[PositionType]: List of YFPY PositionType instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/position_types",
+            ("game", "position_types"),
+            sort_function=_sort_by_position_type,
+            cache=True
+        )
+
+    async def aget_game_roster_positions_by_game_id(self, game_id: int) -> List[RosterPosition]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_game_roster_positions_by_game_id`.
+
+        Args:
+            game_id (int): Game ID for which to retrieve the game roster positions.
+
+        Returns:
+            list[RosterPosition]: List of YFPY RosterPosition instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/roster_positions",
+            ("game", "roster_positions"),
+            sort_function=_sort_by_roster_position,
+            cache=True
+        )
+
+    async def aget_league_key(self, season: int = None) -> str:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_key`.
+
+        Args:
+            season (int): User defined season/year for which to retrieve the Yahoo Fantasy Sports league key.
+
+        Returns:
+            str: League key string for selected league.
+
+        """
+        if self.league_key:
+            return self.league_key
+
+        league_key_cache_key = (season, self.game_id, self.league_id)
+        league_key = self._league_key_cache.get(league_key_cache_key)
+        if not league_key:
+            if season:
+                game_key = await self.aget_game_key_by_season(season)
+            elif self.game_id:
+                game_key = (await self.aget_game_metadata_by_game_id(self.game_id)).game_key
+            else:
+                logger.warning(
+                    "No game id or season/year provided, defaulting to current fantasy season.")
+                game_key = (await self.aget_current_game_metadata()).game_key
+            league_key = self._league_key_cache[league_key_cache_key] = f"{game_key}.l.{self.league_id}"
+
+        return league_key
+
+    async def _aget_team_key(self, team_id: Union[str, int]) -> str:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery._get_team_key`.
+
+        Args:
+            team_id (str | int): Selected team ID (can be integers 1 through n where n is the number of teams in the
+                league).
+
+        Returns:
+            str: Team key string for selected team.
+
+        """
+        _check_team_id(team_id)
+        return f"{await self.aget_league_key()}.t.{team_id}"
+
+    async def aget_league_info(self, sections: Iterable[str] = None) -> League:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_info`.
+
+        Args:
+            sections (Iterable[str], optional): League info sections to retrieve, which defaults to all of them.
+
+        Returns:
+            League: YFPY League instance.
+
+        """
+        league = await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()};"
+            f"out={self._get_league_info_subresources(sections)}",
+            ("league",),
+            League,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+        self._update_league_status(league)
+        return league
+
+    async def aget_league_metadata(self) -> League:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_metadata`.
+
+        Returns:
+            League: YFPY League instance.
+
+        """
+        league = await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/metadata",
+            ("league",),
+            League,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+        self._update_league_status(league)
+        return league
+
+    async def aget_league_settings(self) -> Settings:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_settings`.
+
+        Returns:
+            Settings: YFPY Settings instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/settings",
+            ("league", "settings"),
+            Settings,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    async def aget_league_standings(self) -> Standings:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_standings`.
+
+        Returns:
+            Standings: YFPY Standings instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/standings",
+            ("league", "standings"),
+            Standings,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    async def aget_league_teams(self) -> List[Team]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_teams`.
+
+        Returns:
+            list[Team]: List of YFPY Team instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/teams",
+            ("league", "teams"),
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    async def aget_league_draft_results(self) -> List[DraftResult]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_draft_results`.
+
+        Returns:
+            list[DraftResult]: List of YFPY DraftResult instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/draftresults",
+            ("league", "draft_results"),
+            cache=True,
+            cache_ttl=self._get_draft_results_cache_ttl()
+        )
+
+    async def aget_league_transactions(self) -> List[Transaction]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_transactions`.
+
+        Returns:
+            list[Transaction]: List of YFPY Transaction instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/transactions",
+            ("league", "transactions"),
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    async def aget_league_scoreboard_by_week(self, chosen_week: int) -> Scoreboard:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_scoreboard_by_week`.
+
+        Args:
+            chosen_week (int): Selected week for which to retrieve data.
+
+        Returns:
+            Scoreboard: YFPY Scoreboard instance.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/scoreboard;week={chosen_week}",
+            ("league", "scoreboard"),
+            Scoreboard,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    async def aget_league_bundle(self) -> Dict[str, Any]:
+        """Concurrently retrieve the league metadata, settings, standings, teams, draft results, and transactions.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_league_bundle():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.aget_league_bundle()
+            >>> asyncio.run(get_league_bundle())
+            {
+              "metadata": League({...}),
+              "settings": Settings({...}),
+              "standings": Standings({...}),
+              "teams": [Team({...}), ...],
+              "draft_results": [DraftResult({...}), ...],
+              "transactions": [Transaction({...}), ...]
+            }
+
+        Returns:
+            dict[str, Any]: Dictionary of league data by league section.
+
+        """
+        # resolve the league key once before fanning out so concurrent queries do not all look it up
+        await self.aget_league_key()
+
+        league_sections = {
+            "metadata": self.aget_league_metadata(),
+            "settings": self.aget_league_settings(),
+            "standings": self.aget_league_standings(),
+            "teams": self.aget_league_teams(),
+            "draft_results": self.aget_league_draft_results(),
+            "transactions": self.aget_league_transactions(),
+        }
+        return dict(zip(league_sections.keys(), await asyncio.gather(*league_sections.values())))
+
+    def get_league_bundle(self) -> Dict[str, Any]:
+        """Synchronous version of :func:`aget_league_bundle` for callers that are not already running an event loop.
+
+        Returns:
+            dict[str, Any]: Dictionary of league data by league section.
+
+        """
+        return self._run_sync(self.aget_league_bundle)
+
+    def _run_sync(self, async_method: Callable[..., Awaitable[Any]], *args) -> Any:
+        """Run an asynchronous query method to completion for callers that are not already running an event loop.
+
+        The event loop (created by the loop factory, which creates a uvloop event loop by default when the optional
+        uvloop dependency is installed) is started on first use in a background daemon thread, and it and its client
+        session are kept open between calls so that pooled keep-alive connections are reused (including by concurrent
+        calls from multiple threads), until they are closed by
+        :func:`~yfpy.async_query.AsyncYahooFantasySportsQuery.cleanup`.
+
+        Args:
+            async_method (Callable[..., Awaitable[Any]]): Asynchronous query method of this query object.
+            *args: Positional arguments passed to the asynchronous query method.
+
+        Returns:
+            Any: Result of the asynchronous query method.
+
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise YahooFantasySportsException(
+                "Synchronous AsyncYahooFantasySportsQuery methods cannot be called from a running event loop. Please "
+                f"await AsyncYahooFantasySportsQuery.{async_method.__name__} instead."
+            )
+
+        with self._sync_lock:
+            if self._sync_event_loop is None:
+                self._sync_event_loop = self._loop_factory()
+                self._sync_event_loop_thread = threading.Thread(
+                    target=self._sync_event_loop.run_forever, name="yfpy-event-loop", daemon=True
+                )
+                self._sync_event_loop_thread.start()
+            sync_event_loop = self._sync_event_loop
+        return asyncio.run_coroutine_threadsafe(async_method(*args), sync_event_loop).result()
+
+    async def aget_league_matchups_by_week(self, chosen_week: int) -> List[Matchup]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_league_matchups_by_week`.
+
+        Args:
+            chosen_week (int): Selected week for which to retrieve data.
+
+        Returns:
+            list[Matchup]: List of YFPY Matchup instances.
+
+        """
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/scoreboard;week={chosen_week}",
+            LEAGUE_MATCHUPS_DATA_KEY_PATH
+        )
+
+    async def aget_team_info(self, team_id: Union[str, int]) -> Team:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_info`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            Team: YFPY Team instance.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key};out={TEAM_INFO_SUBRESOURCES}",
+            TEAM_DATA_KEY_PATH,
+            Team
+        )
+
+    async def aget_team_metadata(self, team_id: Union[str, int]) -> Team:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_metadata`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            Team: YFPY Team instance.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/metadata",
+            TEAM_DATA_KEY_PATH,
+            Team
+        )
+
+    async def aget_team_stats(self, team_id: Union[str, int]) -> TeamPoints:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_stats`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            TeamPoints: YFPY TeamPoints instance.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/stats",
+            TEAM_POINTS_DATA_KEY_PATH,
+            TeamPoints
+        )
+
+    async def aget_team_stats_by_week(
+            self, team_id: Union[str, int], chosen_week: Union[int, str] = "current"
+    ) -> Dict[str, Union[TeamPoints, TeamProjectedPoints]]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_stats_by_week`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            dict[str, TeamPoints | TeamProjectedPoints]: Dictionary containing keys "team_points" and
+            "team_projected_points" with respective values YFPY TeamPoints and YFPY TeamProjectedPoints instances.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/stats;type=week;week={chosen_week}",
+            TEAM_WEEK_POINTS_DATA_KEY_PATH
+        )
+
+    async def aget_team_standings(self, team_id: Union[str, int]) -> TeamStandings:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_standings`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            TeamStandings: YFPY TeamStandings instance.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/standings",
+            TEAM_STANDINGS_DATA_KEY_PATH,
+            TeamStandings
+        )
+
+    async def aget_team_roster_by_week(self, team_id: Union[str, int],
+                                       chosen_week: Union[int, str] = "current") -> Roster:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_by_week`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            Roster: YFPY Roster instance.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster;week={chosen_week}",
+            TEAM_ROSTER_DATA_KEY_PATH,
+            Roster
+        )
+
+    async def aget_team_roster_player_info_by_week(self, team_id: Union[str, int],
+                                                   chosen_week: Union[int, str] = "current") -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_info_by_week`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            list[Player]: List of YFPY Player instances.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster;week={chosen_week}/players;"
+            f"out={PLAYER_INFO_SUBRESOURCES}",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH
+        )
+
+    async def aget_team_roster_player_info_by_date(self, team_id: Union[str, int],
+                                                   chosen_date: str = None) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_info_by_date`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_date (str, optional): Selected date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex.
+                2011-05-01)
+
+        Returns:
+            list[Player]: List of YFPY Player instances.
+
+        """
+        if chosen_date:
+            _check_date(chosen_date)
+        team_key = await self._aget_team_key(team_id)
+        roster_resource = f"roster;date={chosen_date}" if chosen_date else "roster"
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/{roster_resource}/players;out={PLAYER_INFO_SUBRESOURCES}",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH
+        )
+
+    async def aget_team_draft_results(self, team_id: Union[str, int]) -> List[DraftResult]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_draft_results`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            list[DraftResult]: List of YFPY DraftResult instances.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/draftresults",
+            TEAM_DRAFT_RESULTS_DATA_KEY_PATH,
+            cache=True,
+            cache_ttl=self._get_draft_results_cache_ttl()
+        )
+
+    async def aget_team_matchups(self, team_id: Union[str, int]) -> List[Matchup]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_matchups`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            list[Matchup]: List of YFPY Matchup instances.
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/matchups",
+            TEAM_MATCHUPS_DATA_KEY_PATH,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    async def aget_team_roster_player_stats(self, team_id: Union[str, int]) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_stats`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "player_stats".
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster/players/stats;type=season",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH
+        )
+
+    async def aget_team_roster_player_stats_by_week(self, team_id: Union[str, int],
+                                                    chosen_week: Union[int, str] = "current") -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_team_roster_player_stats_by_week`.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "player_stats".
+
+        """
+        team_key = await self._aget_team_key(team_id)
+        return await self.aquery(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster;week={chosen_week}/players/stats",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH,
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
+        )
+
+    @asynccontextmanager
+    async def batch_players(self) -> AsyncIterator[None]:
+        """Coalesce the asynchronous single player queries made concurrently within the context into batched
+        multi-player queries.
+
+        Player queries of the same kind (such as the ownership of different players) made within
+        ASYNC_PLAYER_BATCH_WINDOW_SECONDS of each other are sent as a single players;player_keys=... request of up to
+        25 players, and identical player queries share a single result.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_player_ownership():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         async with query.batch_players():
+            ...             return await asyncio.gather(
+            ...                 query.aget_player_ownership("331.p.7200"), query.aget_player_ownership("331.p.9317")
+            ...             )
+            >>> asyncio.run(get_player_ownership())
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Returns:
+            AsyncIterator[None]: Asynchronous context in which player queries are batched.
+
+        """
+        self._player_batching += 1
+        try:
+            yield
+        finally:
+            self._player_batching -= 1
+
+    async def _aget_player(self, player_key: str, player_subresource: str, limit_to_league_stats: bool = True,
+                           cache_ttl: float = None) -> Player:
+        """Retrieve a subresource of a specific player by player_key, batched with concurrent queries of the same kind
+        when called within :func:`batch_players`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            player_subresource (str): Player subresource (with its parameters) to retrieve.
+            limit_to_league_stats (bool, optional): Boolean to query the player within the chosen league instead of
+                across the game as a whole.
+            cache_ttl (float, optional): Number of seconds until cached results expire (never expire when not
+                provided).
+
+        Returns:
+            Player: YFPY Player instance.
+
+        """
+        _check_player_key(player_key)
+        if self._player_batching:
+            batch_key = (player_subresource, limit_to_league_stats, cache_ttl)
+            player_batch = self._pending_player_batches.get(batch_key)
+            if player_batch is None:
+                player_batch = self._pending_player_batches[batch_key] = {}
+                asyncio.ensure_future(
+                    self._aflush_player_batch(batch_key, player_batch, ASYNC_PLAYER_BATCH_WINDOW_SECONDS)
+                )
+
+            player_future = player_batch.get(player_key)
+            if player_future is None:
+                player_future = player_batch[player_key] = asyncio.get_running_loop().create_future()
+                if len(player_batch) >= LEAGUE_PLAYERS_BATCH_SIZE:
+                    asyncio.ensure_future(self._aflush_player_batch(batch_key, player_batch))
+            return await asyncio.shield(player_future)
+
+        if limit_to_league_stats:
+            player_url = f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/players"
+            data_key_path = LEAGUE_PLAYER_DATA_KEY_PATH
+        else:
+            player_url = f"{YAHOO_FANTASY_API_BASE_URL}/players"
+            data_key_path = PLAYER_DATA_KEY_PATH
+        return await self.aquery(
+            f"{player_url};player_keys={player_key}/{player_subresource}",
+            data_key_path,
+            Player,
+            cache=True,
+            cache_ttl=cache_ttl
+        )
+
+    async def _aflush_player_batch(self, batch_key: Tuple[str, bool, Optional[float]],
+                                   player_batch: Dict[str, asyncio.Future], delay: float = 0.0) -> None:
+        """Send a pending batch of player queries as a single multi-player query and resolve the results of each player.
+
+        Args:
+            batch_key (tuple(str, bool, float | None)): Player subresource, Boolean to query the players within the
+                chosen league, and cache TTL shared by the player queries of the batch.
+            player_batch (dict[str, asyncio.Future[Player]]): Results of the pending player queries by player key.
+            delay (float, optional): Number of seconds to wait for more player queries before sending the batch.
+
+        Returns:
+            None
+
+        """
+        if delay:
+            await asyncio.sleep(delay)
+        # the batch was already sent once it was full
+        if self._pending_player_batches.get(batch_key) is not player_batch:
+            return
+        del self._pending_player_batches[batch_key]
+
+        player_subresource, limit_to_league_stats, cache_ttl = batch_key
+        if limit_to_league_stats:
+            players_url = f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/players"
+            data_key_path = ("league", "players")
+        else:
+            players_url = f"{YAHOO_FANTASY_API_BASE_URL}/players"
+            data_key_path = ("players",)
+
+        try:
+            players = await self.aquery(
+                f"{players_url};player_keys={','.join(player_batch)}/{player_subresource}",
+                data_key_path,
+                cache=True,
+                cache_ttl=cache_ttl
+            )
+        except Exception as e:
+            for player_future in player_batch.values():
+                player_future.set_exception(e)
+            return
+
+        players_by_key = {player.player_key: player for player in players}
+        for player_key, player_future in player_batch.items():
+            player = players_by_key.get(player_key)
+            if player is not None:
+                player_future.set_result(player)
+            else:
+                player_future.set_exception(YahooFantasySportsDataNotFound(
+                    f"No data found for player {player_key} in batched player query.", payload=data_key_path,
+                    url=players_url
+                ))
+
+    async def aget_player_stats_for_season(self, player_key: str, limit_to_league_stats: bool = True) -> Player:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_for_season`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            Player: YFPY Player instance.
+
+        """
+        return await self._aget_player(player_key, "stats", limit_to_league_stats, self._get_league_cache_ttl())
+
+    async def aget_player_stats_by_week(self, player_key: str, chosen_week: Union[int, str] = "current",
+                                        limit_to_league_stats: bool = True) -> Player:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_by_week`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            Player: YFPY Player instance containing attribute "player_stats".
+
+        """
+        return await self._aget_player(
+            player_key, f"stats;type=week;week={chosen_week}", limit_to_league_stats,
+            self._get_week_cache_ttl(chosen_week)
+        )
+
+    async def aget_player_stats_by_date(self, player_key: str, chosen_date: str = None,
+                                        limit_to_league_stats: bool = True) -> Player:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_player_stats_by_date`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            chosen_date (str, optional): Selected date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex.
+                2011-05-01)
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            Player: YFPY Player instance containing attribute "player_stats".
+
+        """
+        if chosen_date is not None:
+            _check_date(chosen_date)
+        return await self._aget_player(
+            player_key, f"stats;type=date;date={chosen_date}", limit_to_league_stats, self._get_league_cache_ttl()
+        )
+
+    async def aget_player_ownership(self, player_key: str) -> Player:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_player_ownership`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+
+        Returns:
+            Player: YFPY Player instance containing attribute "ownership".
+
+        """
+        return await self._aget_player(player_key, "ownership", cache_ttl=self._get_league_cache_ttl())
+
+    async def aget_player_percent_owned_by_week(self, player_key: str,
+                                                chosen_week: Union[int, str] = "current") -> Player:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_player_percent_owned_by_week`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            Player: YFPY Player instance containing attribute "percent_owned".
+
+        """
+        return await self._aget_player(
+            player_key, f"percent_owned;type=week;week={chosen_week}", cache_ttl=self._get_week_cache_ttl(chosen_week)
+        )
+
+    async def aget_player_draft_analysis(self, player_key: str) -> Player:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_player_draft_analysis`.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+
+        Returns:
+            Player: YFPY Player instance containing attribute "draft_analysis".
+
+        """
+        return await self._aget_player(player_key, "draft_analysis", cache_ttl=self._get_league_cache_ttl())
+
+    async def _aget_players_by_keys(self, player_keys: Iterable[str], player_subresource: str,
+                                    limit_to_league_stats: bool = True, cache_ttl: float = None) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery._get_players_by_keys`, which concurrently
+        retrieves a subresource of multiple players by player_key with one request per batch of players.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            player_subresource (str): Player subresource (with its parameters) to retrieve for each player.
+            limit_to_league_stats (bool, optional): Boolean to retrieve the players within the chosen league instead of
+                across the game as a whole.
+            cache_ttl (float, optional): Number of seconds until cached batches of players expire (never expire when
+                not provided).
+
+        Returns:
+            list[Player]: List of YFPY Player instances in the same order as the player keys.
+
+        """
+        player_keys = list(player_keys)
+        for player_key in player_keys:
+            _check_player_key(player_key)
+        if limit_to_league_stats:
+            players_url = f"{YAHOO_FANTASY_API_BASE_URL}/league/{await self.aget_league_key()}/players"
+            data_key_path = ("league", "players")
+        else:
+            players_url = f"{YAHOO_FANTASY_API_BASE_URL}/players"
+            data_key_path = ("players",)
+
+        batch_player_keys = (
+            ",".join(player_keys[batch_start:batch_start + LEAGUE_PLAYERS_BATCH_SIZE])
+            for batch_start in range(0, len(player_keys), LEAGUE_PLAYERS_BATCH_SIZE)
+        )
+        # concurrent batches are bounded by the connection limit of the shared client session
+        player_batches = await asyncio.gather(*(
+            self.aquery(
+                f"{players_url};player_keys={player_batch_keys}/{player_subresource}",
+                data_key_path,
+                cache=True,
+                cache_ttl=cache_ttl
+            )
+            for player_batch_keys in batch_player_keys
+        ))
+        return [player for player_batch in player_batches for player in player_batch]
+
+    async def aget_players_stats_for_season(self, player_keys: Iterable[str],
+                                            limit_to_league_stats: bool = True) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_players_stats_for_season`.
+
+        This is the recommended way to retrieve the stats of many players (such as every rostered player in the
+        league), since it sends one request per 25 players and runs the requests concurrently.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_players_stats():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.aget_players_stats_for_season(["331.p.7200", "331.p.9317"])
+            >>> asyncio.run(get_players_stats())
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            list[Player]: List of YFPY Player instances in the same order as the player keys.
+
+        """
+        return await self._aget_players_by_keys(
+            player_keys, "stats", limit_to_league_stats, self._get_league_cache_ttl()
+        )
+
+    async def aget_players_stats_by_week(self, player_keys: Iterable[str], chosen_week: Union[int, str] = "current",
+                                         limit_to_league_stats: bool = True) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_players_stats_by_week`.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "player_stats" in the same order as the
+            player keys.
+
+        """
+        return await self._aget_players_by_keys(
+            player_keys, f"stats;type=week;week={chosen_week}", limit_to_league_stats,
+            self._get_week_cache_ttl(chosen_week)
+        )
+
+    async def aget_players_stats_by_date(self, player_keys: Iterable[str], chosen_date: str = None,
+                                         limit_to_league_stats: bool = True) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_players_stats_by_date`.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 403.p.4588 -
+                <game_id>.p.<player_id>).
+            chosen_date (str, optional): Selected date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex.
+                2011-05-01)
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "player_stats" in the same order as the
+            player keys.
+
+        """
+        if chosen_date is not None:
+            _check_date(chosen_date)
+        return await self._aget_players_by_keys(
+            player_keys, f"stats;type=date;date={chosen_date}", limit_to_league_stats, self._get_league_cache_ttl()
+        )
+
+    async def aget_players_ownership(self, player_keys: Iterable[str]) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_players_ownership`.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "ownership" in the same order as the player
+            keys.
+
+        """
+        return await self._aget_players_by_keys(player_keys, "ownership", cache_ttl=self._get_league_cache_ttl())
+
+    async def aget_players_percent_owned_by_week(self, player_keys: Iterable[str],
+                                                 chosen_week: Union[int, str] = "current") -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_players_percent_owned_by_week`.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "percent_owned" in the same order as the
+            player keys.
+
+        """
+        return await self._aget_players_by_keys(
+            player_keys, f"percent_owned;type=week;week={chosen_week}", cache_ttl=self._get_week_cache_ttl(chosen_week)
+        )
+
+    async def aget_players_draft_analysis(self, player_keys: Iterable[str]) -> List[Player]:
+        """Asynchronous version of :func:`~yfpy.query.YahooFantasySportsQuery.get_players_draft_analysis`.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "draft_analysis" in the same order as the
+            player keys.
+
+        """
+        return await self._aget_players_by_keys(player_keys, "draft_analysis", cache_ttl=self._get_league_cache_ttl())
+
+    async def agather_players(self, player_method: Callable[..., Awaitable[Any]], player_keys: Iterable[str],
+                              *args) -> List[Any]:
+        """Concurrently run an asynchronous player query method for multiple players.
+
+        Concurrent requests are bounded by the connection limit of the shared client session, which keeps them within
+        Yahoo's rate limits.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_player_stats():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.agather_players(
+            ...             query.aget_player_stats_for_season, ["331.p.7200", "331.p.9317"]
+            ...         )
+            >>> asyncio.run(get_player_stats())
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_method (Callable[..., Awaitable[Any]]): Asynchronous player query method of this query object, which
+                takes a player key as its first argument.
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            *args: Additional positional arguments passed to the player query method after the player key.
+
+        Returns:
+            list[Any]: Player query results in the same order as the player keys.
+
+        """
+        # resolve the league key once before fanning out so concurrent queries do not all look it up
+        await self.aget_league_key()
+        return list(await asyncio.gather(*(player_method(player_key, *args) for player_key in player_keys)))
+
+    async def agather_all_teams(self, team_method: Callable[..., Awaitable[Any]], *args) -> List[Any]:
+        """Concurrently run an asynchronous team query method for every team in the league.
+
+        Concurrent requests are bounded by the connection limit of the shared client session, which keeps them within
+        Yahoo's rate limits.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_team_standings():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.agather_all_teams(query.aget_team_standings)
+            >>> asyncio.run(get_team_standings())
+            [
+              TeamStandings({...}),
+              ...,
+              TeamStandings({...})
+            ]
+
+        Args:
+            team_method (Callable[..., Awaitable[Any]]): Asynchronous team query method of this query object, which
+                takes a team ID as its first argument.
+            *args: Additional positional arguments passed to the team query method after the team ID.
+
+        Returns:
+            list[Any]: Team query results ordered by team ID.
+
+        """
+        league = await self.aget_league_metadata()
+        return list(await asyncio.gather(
+            *(team_method(team_id, *args) for team_id in range(1, league.num_teams + 1))
+        ))
+
+    def get_all_team_rosters_by_week(self, chosen_week: Union[int, str] = "current") -> List[Roster]:
+        """Concurrently retrieve the rosters of all teams in the league by week.
+
+        Args:
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            list[Roster]: List of YFPY Roster instances ordered by team ID.
+
+        """
+        return self._run_sync(self.agather_all_teams, self.aget_team_roster_by_week, chosen_week)
+
+    def get_all_team_stats(self) -> List[TeamPoints]:
+        """Concurrently retrieve the stats of all teams in the league.
+
+        Returns:
+            list[TeamPoints]: List of YFPY TeamPoints instances ordered by team ID.
+
+        """
+        return self._run_sync(self.agather_all_teams, self.aget_team_stats)
+
+    def get_all_team_standings(self) -> List[TeamStandings]:
+        """Concurrently retrieve the standings of all teams in the league.
+
+        Returns:
+            list[TeamStandings]: List of YFPY TeamStandings instances ordered by team ID.
+
+        """
+        return self._run_sync(self.agather_all_teams, self.aget_team_standings)
+
+    def get_all_team_roster_player_stats(self) -> List[List[Player]]:
+        """Concurrently retrieve the season player stats of the rosters of all teams in the league.
+
+        Returns:
+            list[list[Player]]: Lists of YFPY Player instances containing attribute "player_stats" ordered by team ID.
+
+        """
+        return self._run_sync(self.agather_all_teams, self.aget_team_roster_player_stats)
+
+    async def agather_team_roster_by_weeks(self, team_id: Union[str, int],
+                                           weeks: Iterable[Union[int, str]]) -> List[Roster]:
+        """Concurrently retrieve the roster of a team for multiple weeks.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_rosters():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.agather_team_roster_by_weeks(1, range(1, 18))
+            >>> asyncio.run(get_rosters())
+            [
+              Roster({...}),
+              ...,
+              Roster({...})
+            ]
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            weeks (Iterable[int | str]): Selected weeks for which to retrieve data.
+
+        Returns:
+            list[Roster]: List of YFPY Roster instances in the same order as the selected weeks.
+
+        """
+        # resolve the league key once before fanning out so concurrent queries do not all look it up
+        await self.aget_league_key()
+        return list(await asyncio.gather(
+            *(self.aget_team_roster_by_week(team_id, chosen_week) for chosen_week in weeks)
+        ))
+
+    async def agather_team_rosters_by_week(self, team_ids: Iterable[Union[str, int]],
+                                           chosen_week: Union[int, str] = "current") -> List[Roster]:
+        """Concurrently retrieve the rosters of multiple teams by week.
+
+        Examples:
+            >>> import asyncio
+            >>> from yfpy.async_query import AsyncYahooFantasySportsQuery
+            >>> async def get_rosters():
+            ...     async with AsyncYahooFantasySportsQuery(league_id="######", ...) as query:
+            ...         return await query.agather_team_rosters_by_week(range(1, 11), 1)
+            >>> asyncio.run(get_rosters())
+            [
+              Roster({...}),
+              ...,
+              Roster({...})
+            ]
+
+        Args:
+            team_ids (Iterable[str | int]): Selected team IDs for which to retrieve data.
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            list[Roster]: List of YFPY Roster instances in the same order as the selected team IDs.
+
+        """
+        # resolve the league key once before fanning out so concurrent queries do not all look it up
+        await self.aget_league_key()
+        return list(await asyncio.gather(
+            *(self.aget_team_roster_by_week(team_id, chosen_week) for team_id in team_ids)
+        ))
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""YFPY module for caching parsed Yahoo Fantasy Sports query results.
+
+Parsed query results are kept in an in-process least recently used (LRU) memory cache, and can optionally also be
+persisted to a disk cache (using the optional diskcache dependency) so they can be reused across processes. Expired
+query results are kept in memory (until they are evicted) so they can still be served when Yahoo is unreachable.
+
+Attributes:
+    logger (Logger): Module level logger for usage and debugging.
+    QUERY_CACHE_MAXSIZE (int): Default maximum number of query results retained by the memory cache.
+
+"""
+__author__ = "Wren J. R. (uberfastman)"
+__email__ = "uberfastman@uberfastman.dev"
+
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple, Union
+
+from yfpy.logger import get_logger
+
+try:
+    import diskcache
+except ImportError:  # pragma: no cover
+    diskcache = None
+
+logger = get_logger(__name__)
+
+# maximum number of parsed query results kept in the in-process least recently used (LRU) cache
+QUERY_CACHE_MAXSIZE: int = 1024
+
+# sentinel distinguishing cache misses from cached None values
+_MISSING = object()
+
+
+class QueryCache(object):
+    """Cache of parsed query results with optional expiration and an optional persistent disk tier.
+    """
+
+    __slots__ = ("maxsize", "_memory_cache", "_disk_cache", "_lock")
+
+    def __init__(self, maxsize: int = QUERY_CACHE_MAXSIZE, cache_dir: Union[Path, str] = None):
+        """Instantiate a QueryCache.
+
+        Args:
+            maxsize (int, optional): Maximum number of query results retained by the memory cache.
+            cache_dir (Path | str, optional): Directory in which to persist query results across processes (requires
+                the optional diskcache dependency). Query results are only cached in memory when not provided.
+
+        """
+        self.maxsize: int = maxsize
+        # cache keys mapped to tuples of (expiration time on the monotonic clock or None if never expiring, data)
+        self._memory_cache: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._disk_cache = None
+        if cache_dir:
+            if diskcache:
+                self._disk_cache = diskcache.Cache(str(cache_dir))
+            else:
+                logger.warning(
+                    "Persisting query results to a disk cache requires the diskcache package. Please install it with: "
+                    "pip install diskcache. Falling back to only caching query results in memory."
+                )
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._memory_cache)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retrieve a cached query result, checking the memory cache before the disk cache (if one exists).
+
+        Args:
+            key (Hashable): Cache key for the query.
+            default (Any, optional): Value to return when no unexpired query result is cached for the key.
+
+        Returns:
+            Any: Cached query result, or the default value if no unexpired query result is cached for the key.
+
+        """
+        with self._lock:
+            cached = self._memory_cache.get(key)
+            if cached is not None:
+                expires_at, data = cached
+                if expires_at is None or expires_at > time.monotonic():
+                    self._memory_cache.move_to_end(key)
+                    return data
+
+        if self._disk_cache is not None:
+            try:
+                data, expires_at = self._disk_cache.get(key, default=_MISSING, expire_time=True)
+            except Exception as e:
+                logger.debug("Unable to read query result from disk cache: %s", e)
+                return default
+
+            if data is not _MISSING:
+                # promote the query result to the memory cache for the remainder of its lifetime on disk
+                self._set_memory(key, data, expires_at - time.time() if expires_at else None)
+                return data
+
+        return default
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Retrieve a cached query result from memory even if it has expired (such as to fall back on when the query
+        cannot be requested again).
+
+        Args:
+            key (Hashable): Cache key for the query.
+            default (Any, optional): Value to return when no query result is cached in memory for the key.
+
+        Returns:
+            Any: Cached (possibly expired) query result, or the default value if no query result is cached in memory
+            for the key.
+
+        """
+        with self._lock:
+            cached = self._memory_cache.get(key)
+        return cached[1] if cached is not None else default
+
+    def set(self, key: Hashable, data: Any, ttl: float = None, persist: bool = True) -> None:
+        """Cache a query result, evicting the least recently used query result from memory when full.
+
+        Args:
+            key (Hashable): Cache key for the query.
+            data (Any): Query result to be cached.
+            ttl (float, optional): Number of seconds until the query result expires (never expires when not provided).
+            persist (bool, optional): Boolean to also persist the query result to the disk cache (if one exists).
+
+        Returns:
+            None
+
+        """
+        self._set_memory(key, data, ttl)
+
+        if persist and self._disk_cache is not None:
+            try:
+                self._disk_cache.set(key, data, expire=ttl)
+            except Exception as e:
+                logger.debug("Unable to write query result to disk cache: %s", e)
+
+    def _set_memory(self, key: Hashable, data: Any, ttl: Optional[float]) -> None:
+        """Cache a query result in memory, evicting the least recently used query result when full.
+
+        Args:
+            key (Hashable): Cache key for the query.
+            data (Any): Query result to be cached.
+            ttl (float | None): Number of seconds until the query result expires (never expires when None).
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._memory_cache[key] = (time.monotonic() + ttl if ttl is not None else None, data)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > self.maxsize:
+                self._memory_cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached query results from memory and disk.
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._memory_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+
+    def close(self) -> None:
+        """Close the disk cache (if one exists).
+
+        Returns:
+            None
+
+        """
+        if self._disk_cache is not None:
+            self._disk_cache.close()
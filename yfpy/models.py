@@ -14,12 +14,11 @@ __email__ = "uberfastman@uberfastman.dev"
 
 import os
 from operator import getitem
-from typing import Union, Any, List, Dict, Type
+from typing import Union, Any, List, Dict, Tuple, Type
 
-from stringcase import snakecase
 
 from yfpy.logger import get_logger
-from yfpy.utils import jsonify_data
+from yfpy.utils import get_subclasses, jsonify_data, reformat_json_list, unpack_data
 
 # from yfpy.utils import flatten_to_objects
 
@@ -43,7 +42,7 @@ class YahooFantasyObject(object):
         self._extracted_data: Dict = extracted_data
         self._index: int = 0
         if isinstance(extracted_data, dict):
-            self._keys: List = list(self._extracted_data.keys())
+            self._keys: Tuple[str, ...] = tuple(extracted_data)
 
     def __str__(self):
         """Override __str__ to display YahooFantasyObject attribute values as JSON.
@@ -61,8 +60,9 @@ class YahooFantasyObject(object):
         """
         attribute = object.__getattribute__(self, attribute_name)
 
-        # skip builtin attributes that start with underscores and check if attribute is a list or dict
-        if not attribute_name.startswith("_") and isinstance(attribute, (list, dict)):
+        # skip builtin attributes that start with underscores (checked first since they are accessed the most during
+        # model instantiation) and check if attribute is a list or dict
+        if attribute_name[0] != "_" and isinstance(attribute, (list, dict)):
             if attribute:
                 # extract singular key from parent plural key
                 attribute_element_name = None
@@ -162,6 +162,22 @@ class YahooFantasyObject(object):
         else:
             return value_default
 
+    @staticmethod
+    def _get_model_data(extracted_data: Dict, extracted_data_key: str, model_class: Type["YahooFantasyObject"]) -> Any:
+        """Get the extracted data value of a data key with a model instance value, only instantiating an empty default
+        model instance when the data key is missing.
+
+        Args:
+            extracted_data (dict): Parsed and cleaned JSON data retrieved from the Yahoo Fantasy Sports REST API.
+            extracted_data_key (str): Data key of the extracted data.
+            model_class (Type[YahooFantasyObject]): Model class of the empty default instance.
+
+        Returns:
+            Any: Extracted data value of the data key, or an empty instance of the model class if it does not exist.
+
+        """
+        return extracted_data[extracted_data_key] if extracted_data_key in extracted_data else model_class({})
+
     def _convert_to_string(self, extracted_data_key: str) -> str:
         return str(self._extracted_data.get(extracted_data_key, ""))
 
@@ -176,7 +192,7 @@ class YahooFantasyObject(object):
             values.
 
         """
-        return {snakecase(cls.__name__): cls for cls in self.__class__.__mro__[-2].__subclasses__()}
+        return get_subclasses(self.__class__.__mro__[-2])
 
     def clean_data_dict(self) -> Dict:
         """Recursive method to un-type custom class type objects for serialization.
@@ -226,6 +242,97 @@ class YahooFantasyObject(object):
         return cls(json_data)
 
 
+class LazyYahooObject(object):
+    """Lazy proxy for raw Yahoo Fantasy Sports data that only unpacks and parses the data content that is accessed.
+
+    Unpacking a full query response into model instances can allocate thousands of objects, so call sites that only
+    read one or two fields can use this proxy to parse just the children they touch.
+    """
+
+    __slots__ = ("_raw", "_parent_class", "_children")
+
+    def __init__(self, raw_data: Any, parent_class: Type = YahooFantasyObject):
+        """Instantiate a lazy Yahoo Fantasy Object proxy.
+
+        Args:
+            raw_data (Any): Raw JSON data retrieved from the Yahoo Fantasy Sports REST API.
+            parent_class (Type): Parent class type used to extract custom subclass type options for casting.
+
+        """
+        self._raw: Any = raw_data
+        self._parent_class: Type = parent_class
+        self._children: Dict[str, Any] = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._raw})"
+
+    def __getattr__(self, attribute_name: str):
+        # only called when normal attribute lookup fails, so private names are never treated as data keys
+        if attribute_name.startswith("_"):
+            raise AttributeError(attribute_name)
+        return self.get(attribute_name)
+
+    def __getitem__(self, key: str):
+        value = self.get(key, KeyError)
+        if value is KeyError:
+            raise KeyError(key)
+        return value
+
+    def _resolve_raw_data(self) -> Any:
+        """Drill through Yahoo numbered collection wrappers and lists of single-key dicts to the underlying data.
+
+        Returns:
+            Any: Mapping of data keys to raw JSON data where possible, else the raw JSON data.
+
+        """
+        raw_data = self._raw
+        while True:
+            if isinstance(raw_data, list) and raw_data:
+                raw_data = reformat_json_list(raw_data)
+            # eliminate odd single-key Yahoo dicts with key = "0" and value = <next layer of desired data>
+            elif isinstance(raw_data, dict) and "0" in raw_data and "1" not in raw_data:
+                raw_data = raw_data["0"]
+            else:
+                return raw_data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Unpack, parse, and cast a single data key on first access and memoize the result.
+
+        Args:
+            key (str): Data key to retrieve.
+            default (Any, optional): Value returned when the data key does not exist.
+
+        Returns:
+            Any: Parsed data content for the given key.
+
+        """
+        if key in self._children:
+            return self._children[key]
+
+        raw_data = self._resolve_raw_data()
+        if not hasattr(raw_data, "keys") or key not in raw_data:
+            return default
+
+        value = unpack_data(raw_data[key], self._parent_class)
+        if isinstance(value, dict):
+            # cast the data to the model class matching its data key (if one exists)
+            subclass = get_subclasses(self._parent_class).get(key)
+            if subclass:
+                value = subclass(value)
+
+        self._children[key] = value
+        return value
+
+    def unpack(self) -> Any:
+        """Unpack, parse, and assign data types to all of the raw data content.
+
+        Returns:
+            Any: Fully parsed data content.
+
+        """
+        return unpack_data(self._raw, self._parent_class)
+
+
 # noinspection DuplicatedCode, PyUnresolvedReferences
 class User(YahooFantasyObject):
     """Model class for "user" data key.
@@ -243,8 +350,8 @@ class User(YahooFantasyObject):
 
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.games: List = self._extracted_data.get("games", [])
-        self.guid: str = self._extracted_data.get("guid", "")
+        self.games: List = extracted_data.get("games", [])
+        self.guid: str = extracted_data.get("guid", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -289,32 +396,32 @@ class Game(YahooFantasyObject):
 
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.code: str = self._extracted_data.get("code", "")
-        self.contest_group_id: int = self._extracted_data.get("contest_group_id", None)
-        self.current_week: int = self._extracted_data.get("current_week", None)
-        self.editorial_season: int = self._extracted_data.get("editorial_season", None)
-        self.game_id: int = self._extracted_data.get("game_id", None)
+        self.code: str = extracted_data.get("code", "")
+        self.contest_group_id: int = extracted_data.get("contest_group_id", None)
+        self.current_week: int = extracted_data.get("current_week", None)
+        self.editorial_season: int = extracted_data.get("editorial_season", None)
+        self.game_id: int = extracted_data.get("game_id", None)
         self.game_key: str = self._convert_to_string("game_key")  # convert to string to handle leading zeros
-        self.game_weeks: List[GameWeek] = self._extracted_data.get("game_weeks", [])
-        self.has_schedule: int = self._extracted_data.get("has_schedule", 0)
-        self.is_contest_over: int = self._extracted_data.get("is_contest_over", 0)
-        self.is_contest_reg_active: int = self._extracted_data.get("is_contest_reg_active", 0)
-        self.is_game_over: int = self._extracted_data.get("is_game_over", 0)
-        self.is_live_draft_lobby_active: int = self._extracted_data.get("is_live_draft_lobby_active", 0)
-        self.is_offseason: int = self._extracted_data.get("is_offseason", 0)
-        self.is_registration_over: int = self._extracted_data.get("is_registration_over", 0)
-        self.leagues: List[League] = self._extracted_data.get("leagues", [])
-        self.name: str = self._extracted_data.get("name", "")
-        self.picks_status: str = self._extracted_data.get("picks_status", "")
-        self.players: List[Player] = self._extracted_data.get("players", [])
-        self.position_types: List[PositionType] = self._extracted_data.get("position_types", [])
-        self.roster_positions: List[RosterPosition] = self._extracted_data.get("roster_positions", [])
-        self.scenario_generator: int = self._extracted_data.get("scenario_generator", 0)
-        self.season: int = self._extracted_data.get("season", None)
-        self.stat_categories: StatCategories = self._extracted_data.get("stat_categories", StatCategories({}))
-        self.teams: List[Team] = self._extracted_data.get("teams", [])
-        self.type: str = self._extracted_data.get("type", "")
-        self.url: str = self._extracted_data.get("url", "")
+        self.game_weeks: List[GameWeek] = extracted_data.get("game_weeks", [])
+        self.has_schedule: int = extracted_data.get("has_schedule", 0)
+        self.is_contest_over: int = extracted_data.get("is_contest_over", 0)
+        self.is_contest_reg_active: int = extracted_data.get("is_contest_reg_active", 0)
+        self.is_game_over: int = extracted_data.get("is_game_over", 0)
+        self.is_live_draft_lobby_active: int = extracted_data.get("is_live_draft_lobby_active", 0)
+        self.is_offseason: int = extracted_data.get("is_offseason", 0)
+        self.is_registration_over: int = extracted_data.get("is_registration_over", 0)
+        self.leagues: List[League] = extracted_data.get("leagues", [])
+        self.name: str = extracted_data.get("name", "")
+        self.picks_status: str = extracted_data.get("picks_status", "")
+        self.players: List[Player] = extracted_data.get("players", [])
+        self.position_types: List[PositionType] = extracted_data.get("position_types", [])
+        self.roster_positions: List[RosterPosition] = extracted_data.get("roster_positions", [])
+        self.scenario_generator: int = extracted_data.get("scenario_generator", 0)
+        self.season: int = extracted_data.get("season", None)
+        self.stat_categories: StatCategories = self._get_model_data(extracted_data, "stat_categories", StatCategories)
+        self.teams: List[Team] = extracted_data.get("teams", [])
+        self.type: str = extracted_data.get("type", "")
+        self.url: str = extracted_data.get("url", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -336,10 +443,10 @@ class GameWeek(YahooFantasyObject):
 
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.display_name: str = self._extracted_data.get("display_name", "")
-        self.end: str = self._extracted_data.get("end", "")
-        self.start: str = self._extracted_data.get("start", "")
-        self.week: int = self._extracted_data.get("week", None)
+        self.display_name: str = extracted_data.get("display_name", "")
+        self.end: str = extracted_data.get("end", "")
+        self.start: str = extracted_data.get("start", "")
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -359,8 +466,8 @@ class PositionType(YahooFantasyObject):
 
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.type: str = self._extracted_data.get("type", "")
-        self.display_name: str = self._extracted_data.get("display_name", "")
+        self.type: str = extracted_data.get("type", "")
+        self.display_name: str = extracted_data.get("display_name", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -425,48 +532,48 @@ class League(YahooFantasyObject):
 
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.allow_add_to_dl_extra_pos: int = self._extracted_data.get("allow_add_to_dl_extra_pos", 0)
-        self.current_week: int = self._extracted_data.get("current_week", None)
-        self.draft_results: List[DraftResult] = self._extracted_data.get("draft_results", [])
-        self.draft_status: str = self._extracted_data.get("draft_status", "")
-        self.display_name: str = self._extracted_data.get("display_name", "")
-        self.edit_key: int = self._extracted_data.get("edit_key", None)
-        self.end_date: str = self._extracted_data.get("end_date", "")
-        self.end_week: str = self._extracted_data.get("end_week", None)
-        self.entry_fee: str = self._extracted_data.get("entry_fee", "")
-        self.felo_tier: str = self._extracted_data.get("felo_tier", "")
-        self.game_code: str = self._extracted_data.get("game_code", "")
-        self.iris_group_chat_id: str = self._extracted_data.get("iris_group_chat_id", "")
-        self.is_cash_league: int = self._extracted_data.get("is_cash_league", 0)
-        self.is_finished: int = self._extracted_data.get("is_finished", 0)
-        self.is_plus_league: int = self._extracted_data.get("is_plus_league", 0)
-        self.is_pro_league: int = self._extracted_data.get("is_pro_league", 0)
+        self.allow_add_to_dl_extra_pos: int = extracted_data.get("allow_add_to_dl_extra_pos", 0)
+        self.current_week: int = extracted_data.get("current_week", None)
+        self.draft_results: List[DraftResult] = extracted_data.get("draft_results", [])
+        self.draft_status: str = extracted_data.get("draft_status", "")
+        self.display_name: str = extracted_data.get("display_name", "")
+        self.edit_key: int = extracted_data.get("edit_key", None)
+        self.end_date: str = extracted_data.get("end_date", "")
+        self.end_week: str = extracted_data.get("end_week", None)
+        self.entry_fee: str = extracted_data.get("entry_fee", "")
+        self.felo_tier: str = extracted_data.get("felo_tier", "")
+        self.game_code: str = extracted_data.get("game_code", "")
+        self.iris_group_chat_id: str = extracted_data.get("iris_group_chat_id", "")
+        self.is_cash_league: int = extracted_data.get("is_cash_league", 0)
+        self.is_finished: int = extracted_data.get("is_finished", 0)
+        self.is_plus_league: int = extracted_data.get("is_plus_league", 0)
+        self.is_pro_league: int = extracted_data.get("is_pro_league", 0)
         self.league_id: str = self._convert_to_string("league_id")  # convert to string to handle leading zeros
-        self.league_key: str = self._extracted_data.get("league_key", "")
-        self.league_type: str = self._extracted_data.get("league_type", "")
-        self.league_update_timestamp: int = self._extracted_data.get("league_update_timestamp", None)
-        self.logo_url: str = self._extracted_data.get("logo_url", "")
-        self.name: bytes = self._extracted_data.get("name", "").encode("utf-8")  # support special characters
-        self.num_teams: int = self._extracted_data.get("num_teams", 0)
-        self.password: str = self._extracted_data.get("password", "")
-        self.payment_deadline: str = self._extracted_data.get("payment_deadline", "")
-        self.players: List[Player] = self._extracted_data.get("players", [])
-        self.renew: str = self._extracted_data.get("renew", "")
-        self.renewed: str = self._extracted_data.get("renewed", "")
-        self.scoreboard: Scoreboard = self._extracted_data.get("scoreboard", Scoreboard({}))
+        self.league_key: str = extracted_data.get("league_key", "")
+        self.league_type: str = extracted_data.get("league_type", "")
+        self.league_update_timestamp: int = extracted_data.get("league_update_timestamp", None)
+        self.logo_url: str = extracted_data.get("logo_url", "")
+        self.name: bytes = extracted_data.get("name", "").encode("utf-8")  # support special characters
+        self.num_teams: int = extracted_data.get("num_teams", 0)
+        self.password: str = extracted_data.get("password", "")
+        self.payment_deadline: str = extracted_data.get("payment_deadline", "")
+        self.players: List[Player] = extracted_data.get("players", [])
+        self.renew: str = extracted_data.get("renew", "")
+        self.renewed: str = extracted_data.get("renewed", "")
+        self.scoreboard: Scoreboard = self._get_model_data(extracted_data, "scoreboard", Scoreboard)
         self.matchups: List[Matchup] = self._get_nested_value(self.scoreboard, "matchups", [])
-        self.scoring_type: str = self._extracted_data.get("scoring_type", "")
-        self.season: int = self._extracted_data.get("season", None)
-        self.settings: Settings = self._extracted_data.get("settings", Settings({}))
-        self.short_invitation_url: str = self._extracted_data.get("short_invitation_url", "")
-        self.standings: Standings = self._extracted_data.get("standings", Standings({}))
-        self.start_date: str = self._extracted_data.get("start_date", "")
-        self.start_week: int = self._extracted_data.get("start_week", None)
-        self.teams: List[Team] = self._extracted_data.get("teams", [])
+        self.scoring_type: str = extracted_data.get("scoring_type", "")
+        self.season: int = extracted_data.get("season", None)
+        self.settings: Settings = self._get_model_data(extracted_data, "settings", Settings)
+        self.short_invitation_url: str = extracted_data.get("short_invitation_url", "")
+        self.standings: Standings = self._get_model_data(extracted_data, "standings", Standings)
+        self.start_date: str = extracted_data.get("start_date", "")
+        self.start_week: int = extracted_data.get("start_week", None)
+        self.teams: List[Team] = extracted_data.get("teams", [])
         self.teams_ordered_by_standings: List[Team] = self._get_nested_value(self.standings, "teams", [])
-        self.transactions: List[Transaction] = self._extracted_data.get("transactions", [])
-        self.url: str = self._extracted_data.get("url", "")
-        self.weekly_deadline: str = self._extracted_data.get("weekly_deadline", "")
+        self.transactions: List[Transaction] = extracted_data.get("transactions", [])
+        self.url: str = extracted_data.get("url", "")
+        self.weekly_deadline: str = extracted_data.get("weekly_deadline", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -551,46 +658,47 @@ class Team(YahooFantasyObject):
 
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.can_edit_current_week: int = self._extracted_data.get("can_edit_current_week", 0)
-        self.champion_pick: str = self._extracted_data.get("champion_pick", "")
-        self.champion_status: str = self._extracted_data.get("champion_status", "")
-        self.clinched_playoffs: int = self._extracted_data.get("clinched_playoffs", 0)
-        self.division_id: int = self._extracted_data.get("division_id", None)
-        self.done_week: str = self._extracted_data.get("done_week", None)
-        self.draft_grade: str = self._extracted_data.get("draft_grade", "")
-        self.draft_position: int = self._extracted_data.get("draft_position", None)
-        self.draft_recap_url: str = self._extracted_data.get("draft_recap_url", "")
-        self.draft_results: List[DraftResult] = self._extracted_data.get("draft_results", [])
-        self.elimination_week: int = self._extracted_data.get("elimination_week", None)
-        self.email_address: str = self._extracted_data.get("email_address", "")
-        self.faab_balance: int = self._extracted_data.get("faab_balance", None)
-        self.has_draft_grade: int = self._extracted_data.get("has_draft_grade", 0)
-        self.is_in_contest: int = self._extracted_data.get("is_in_contest", 0)
-        self.is_owned_by_current_login: int = self._extracted_data.get("is_owned_by_current_login", 0)
-        self.last_editable_week: str = self._extracted_data.get("last_editable_week", "")
-        self.league_scoring_type: str = self._extracted_data.get("league_scoring_type", "")
-        self.logo_type: str = self._extracted_data.get("logo_type", "")
-        self.manager: Manager = self._extracted_data.get("manager", Manager({}))
-        self.managers: List[Manager] = self._extracted_data.get("managers", [])
-        self.matchups: List[Matchup] = self._extracted_data.get("matchups", [])
-        self.name: bytes = self._extracted_data.get("name", "").encode("utf-8")  # support special characters
-        self.number_of_moves: int = self._extracted_data.get("number_of_moves", 0)
-        self.number_of_trades: int = self._extracted_data.get("number_of_trades", 0)
-        self.roster: Roster = self._extracted_data.get("roster", Roster({}))
+        self.can_edit_current_week: int = extracted_data.get("can_edit_current_week", 0)
+        self.champion_pick: str = extracted_data.get("champion_pick", "")
+        self.champion_status: str = extracted_data.get("champion_status", "")
+        self.clinched_playoffs: int = extracted_data.get("clinched_playoffs", 0)
+        self.division_id: int = extracted_data.get("division_id", None)
+        self.done_week: str = extracted_data.get("done_week", None)
+        self.draft_grade: str = extracted_data.get("draft_grade", "")
+        self.draft_position: int = extracted_data.get("draft_position", None)
+        self.draft_recap_url: str = extracted_data.get("draft_recap_url", "")
+        self.draft_results: List[DraftResult] = extracted_data.get("draft_results", [])
+        self.elimination_week: int = extracted_data.get("elimination_week", None)
+        self.email_address: str = extracted_data.get("email_address", "")
+        self.faab_balance: int = extracted_data.get("faab_balance", None)
+        self.has_draft_grade: int = extracted_data.get("has_draft_grade", 0)
+        self.is_in_contest: int = extracted_data.get("is_in_contest", 0)
+        self.is_owned_by_current_login: int = extracted_data.get("is_owned_by_current_login", 0)
+        self.last_editable_week: str = extracted_data.get("last_editable_week", "")
+        self.league_scoring_type: str = extracted_data.get("league_scoring_type", "")
+        self.logo_type: str = extracted_data.get("logo_type", "")
+        self.manager: Manager = self._get_model_data(extracted_data, "manager", Manager)
+        self.managers: List[Manager] = extracted_data.get("managers", [])
+        self.matchups: List[Matchup] = extracted_data.get("matchups", [])
+        self.name: bytes = extracted_data.get("name", "").encode("utf-8")  # support special characters
+        self.number_of_moves: int = extracted_data.get("number_of_moves", 0)
+        self.number_of_trades: int = extracted_data.get("number_of_trades", 0)
+        self.roster: Roster = self._get_model_data(extracted_data, "roster", Roster)
         self.players: List[Player] = self._get_nested_value(self.roster, "players", [])
-        self.roster_adds: RosterAdds = self._extracted_data.get("roster_adds", RosterAdds({}))
+        self.roster_adds: RosterAdds = self._get_model_data(extracted_data, "roster_adds", RosterAdds)
         self.roster_adds_value: int = self._get_nested_value(self.roster_adds, "value", 0)
-        self.team_id: int = self._extracted_data.get("team_id", None)
-        self.team_key: str = self._extracted_data.get("team_key", "")
-        self.team_logo: str = self._extracted_data.get("team_logo", "")
-        self.team_logos: List[TeamLogo] = self._extracted_data.get("team_logos", [])
-        self.team_paid: int = self._extracted_data.get("team_paid", 0)
-        self.team_points: TeamPoints = self._extracted_data.get("team_points", TeamPoints({}))
+        self.team_id: int = extracted_data.get("team_id", None)
+        self.team_key: str = extracted_data.get("team_key", "")
+        self.team_logo: str = extracted_data.get("team_logo", "")
+        self.team_logos: List[TeamLogo] = extracted_data.get("team_logos", [])
+        self.team_paid: int = extracted_data.get("team_paid", 0)
+        self.team_points: TeamPoints = self._get_model_data(extracted_data, "team_points", TeamPoints)
         self.points: float = self._get_nested_value(self.team_points, "total", 0.0, float)
-        self.team_projected_points: TeamProjectedPoints = self._extracted_data.get("team_projected_points",
-                                                                                   TeamProjectedPoints({}))
+        self.team_projected_points: TeamProjectedPoints = self._get_model_data(
+            extracted_data, "team_projected_points", TeamProjectedPoints
+        )
         self.projected_points: float = self._get_nested_value(self.team_projected_points, "total", 0.0, float)
-        self.team_standings: TeamStandings = self._extracted_data.get("team_standings", TeamStandings({}))
+        self.team_standings: TeamStandings = self._get_model_data(extracted_data, "team_standings", TeamStandings)
         self.wins: int = self._get_nested_value(self.team_standings, ["outcome_totals", "wins"], 0, int)
         self.losses: int = self._get_nested_value(self.team_standings, ["outcome_totals", "losses"], 0, int)
         self.ties: int = self._get_nested_value(self.team_standings, ["outcome_totals", "ties"], 0, int)
@@ -601,15 +709,15 @@ class Team(YahooFantasyObject):
         self.points_against: float = self._get_nested_value(self.team_standings, "points_against", 0.0, float)
         self.points_for: float = self._get_nested_value(self.team_standings, "points_for", 0.0, float)
         self.rank: int = self._get_nested_value(self.team_standings, "rank", None)
-        self.status: str = self._extracted_data.get("status", "")
+        self.status: str = extracted_data.get("status", "")
         self.streak_type: str = self._get_nested_value(self.team_standings, ["streak", "type"], "")
         self.streak_length: int = self._get_nested_value(self.team_standings, ["streak", "value"], None, int)
-        self.total_strikes: int = self._extracted_data.get("total_strikes", 0)
-        self.url: str = self._extracted_data.get("url", "")
-        self.user_display_name: str = self._extracted_data.get("user_display_name", "")
-        self.user_profile_image: str = self._extracted_data.get("user_profile_image", "")
-        self.waiver_priority: int = self._extracted_data.get("waiver_priority", None)
-        self.win_probability: float = self._get_nested_value(self._extracted_data, "win_probability", 0.0, float)
+        self.total_strikes: int = extracted_data.get("total_strikes", 0)
+        self.url: str = extracted_data.get("url", "")
+        self.user_display_name: str = extracted_data.get("user_display_name", "")
+        self.user_profile_image: str = extracted_data.get("user_profile_image", "")
+        self.waiver_priority: int = extracted_data.get("waiver_priority", None)
+        self.win_probability: float = self._get_nested_value(extracted_data, "win_probability", 0.0, float)
 
 
 # noinspection PyUnresolvedReferences
@@ -631,11 +739,11 @@ class DraftResult(YahooFantasyObject):
             player_key (str): The Yahoo player key of the player that was drafted.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.cost: int = self._extracted_data.get("cost", None)
-        self.pick: int = self._extracted_data.get("pick", None)
-        self.round: int = self._extracted_data.get("round", None)
-        self.team_key: str = self._extracted_data.get("team_key", "")
-        self.player_key: str = self._extracted_data.get("player_key", "")
+        self.cost: int = extracted_data.get("cost", None)
+        self.pick: int = extracted_data.get("pick", None)
+        self.round: int = extracted_data.get("round", None)
+        self.team_key: str = extracted_data.get("team_key", "")
+        self.player_key: str = extracted_data.get("player_key", "")
 
 
 # noinspection PyUnresolvedReferences,GrazieInspection
@@ -653,7 +761,7 @@ class Standings(YahooFantasyObject):
             teams (list[Team]): A list of YFPY Team instances with standings data.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.teams: List[Team] = self._extracted_data.get("teams", [])
+        self.teams: List[Team] = extracted_data.get("teams", [])
 
 
 # noinspection PyUnresolvedReferences
@@ -680,16 +788,16 @@ class Transaction(YahooFantasyObject):
             type (str): The type of the transaction ("add", "drop", "trade", etc.).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.players: List[Player] = self._extracted_data.get("players", [])
-        self.status: str = self._extracted_data.get("status", "")
-        self.timestamp: int = self._extracted_data.get("timestamp", None)
-        self.tradee_team_key: str = self._extracted_data.get("tradee_team_key", "")
-        self.tradee_team_name: str = self._extracted_data.get("tradee_team_name", "")
-        self.trader_team_key: str = self._extracted_data.get("trader_team_key", "")
-        self.trader_team_name: str = self._extracted_data.get("trader_team_name", "")
-        self.transaction_id: int = self._extracted_data.get("transaction_id", None)
-        self.transaction_key: str = self._extracted_data.get("transaction_key", "")
-        self.type: str = self._extracted_data.get("type", "")
+        self.players: List[Player] = extracted_data.get("players", [])
+        self.status: str = extracted_data.get("status", "")
+        self.timestamp: int = extracted_data.get("timestamp", None)
+        self.tradee_team_key: str = extracted_data.get("tradee_team_key", "")
+        self.tradee_team_name: str = extracted_data.get("tradee_team_name", "")
+        self.trader_team_key: str = extracted_data.get("trader_team_key", "")
+        self.trader_team_name: str = extracted_data.get("trader_team_name", "")
+        self.transaction_id: int = extracted_data.get("transaction_id", None)
+        self.transaction_key: str = extracted_data.get("transaction_key", "")
+        self.type: str = extracted_data.get("type", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -724,19 +832,19 @@ class Manager(YahooFantasyObject):
                 competing in the contest.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.email: str = self._extracted_data.get("email", "")
-        self.emails: List[str] = self._extracted_data.get("emails", [])
-        self.fantasy_profile_url: str = self._extracted_data.get("fantasy_profile_url", "")
-        self.felo_score: int = self._extracted_data.get("felo_score", None)
-        self.felo_tier: str = self._extracted_data.get("felo_tier", "")
-        self.guid: str = self._extracted_data.get("guid", "")
-        self.image_url: str = self._extracted_data.get("image_url", "")
-        self.is_comanager: int = self._extracted_data.get("is_comanager", 0)
-        self.is_commissioner: int = self._extracted_data.get("is_comanager", 0)
-        self.is_current_login: int = self._extracted_data.get("is_current_login", 0)
-        self.manager_id: int = self._extracted_data.get("manager_id", None)
-        self.nickname: str = self._extracted_data.get("nickname", "")
-        self.profile_image_url: str = self._extracted_data.get("profile_image_url", "")
+        self.email: str = extracted_data.get("email", "")
+        self.emails: List[str] = extracted_data.get("emails", [])
+        self.fantasy_profile_url: str = extracted_data.get("fantasy_profile_url", "")
+        self.felo_score: int = extracted_data.get("felo_score", None)
+        self.felo_tier: str = extracted_data.get("felo_tier", "")
+        self.guid: str = extracted_data.get("guid", "")
+        self.image_url: str = extracted_data.get("image_url", "")
+        self.is_comanager: int = extracted_data.get("is_comanager", 0)
+        self.is_commissioner: int = extracted_data.get("is_comanager", 0)
+        self.is_current_login: int = extracted_data.get("is_current_login", 0)
+        self.manager_id: int = extracted_data.get("manager_id", None)
+        self.nickname: str = extracted_data.get("nickname", "")
+        self.profile_image_url: str = extracted_data.get("profile_image_url", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -757,10 +865,10 @@ class Roster(YahooFantasyObject):
             players (list[Player]): A list of YFPY Player instances.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.week: int = self._extracted_data.get("week", None)
-        self.is_editable: int = self._extracted_data.get("is_editable", 0)
-        self.players: List[Player] = self._extracted_data.get("players", [])
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.week: int = extracted_data.get("week", None)
+        self.is_editable: int = extracted_data.get("is_editable", 0)
+        self.players: List[Player] = extracted_data.get("players", [])
 
 
 # noinspection PyUnresolvedReferences
@@ -780,9 +888,9 @@ class RosterAdds(YahooFantasyObject):
             value (int): The number of roster adds within the coverage timeframe.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.coverage_value: int = self._get_nested_value(self._extracted_data, "coverage_value", 0, int)
-        self.value: int = self._get_nested_value(self._extracted_data, "value", 0, int)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.coverage_value: int = self._get_nested_value(extracted_data, "coverage_value", 0, int)
+        self.value: int = self._get_nested_value(extracted_data, "value", 0, int)
 
 
 # noinspection PyUnresolvedReferences
@@ -801,8 +909,8 @@ class TeamLogo(YahooFantasyObject):
             url (str): The direct URL of the team logo photo.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.size: str = self._extracted_data.get("size", "")
-        self.url: str = self._extracted_data.get("url", "")
+        self.size: str = extracted_data.get("size", "")
+        self.url: str = extracted_data.get("url", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -823,10 +931,10 @@ class TeamPoints(YahooFantasyObject):
             week (int): The week number (if applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.season: int = self._extracted_data.get("season", None)
-        self.total: float = self._get_nested_value(self._extracted_data, "total", 0.0, float)
-        self.week: int = self._extracted_data.get("week", None)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.season: int = extracted_data.get("season", None)
+        self.total: float = self._get_nested_value(extracted_data, "total", 0.0, float)
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -846,9 +954,9 @@ class TeamProjectedPoints(YahooFantasyObject):
             week (int): The week number.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.total: float = self._get_nested_value(self._extracted_data, "total", 0.0, float)
-        self.week: int = self._extracted_data.get("week", None)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.total: float = self._get_nested_value(extracted_data, "total", 0.0, float)
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -872,14 +980,14 @@ class TeamStandings(YahooFantasyObject):
             streak (Streak): A YFPY Streak instance.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.divisional_outcome_totals: DivisionalOutcomeTotals = self._extracted_data.get(
+        self.divisional_outcome_totals: DivisionalOutcomeTotals = extracted_data.get(
             "divisional_outcome_totals", DivisionalOutcomeTotals({}))
-        self.outcome_totals: OutcomeTotals = self._extracted_data.get("outcome_totals", OutcomeTotals({}))
-        self.playoff_seed: int = self._extracted_data.get("playoff_seed", 0)
-        self.points_against: float = self._get_nested_value(self._extracted_data, "points_against", 0.0, float)
-        self.points_for: float = self._get_nested_value(self._extracted_data, "points_for", 0.0, float)
-        self.rank: int = self._extracted_data.get("rank", None)
-        self.streak: Streak = self._extracted_data.get("streak", Streak({}))
+        self.outcome_totals: OutcomeTotals = self._get_model_data(extracted_data, "outcome_totals", OutcomeTotals)
+        self.playoff_seed: int = extracted_data.get("playoff_seed", 0)
+        self.points_against: float = self._get_nested_value(extracted_data, "points_against", 0.0, float)
+        self.points_for: float = self._get_nested_value(extracted_data, "points_for", 0.0, float)
+        self.rank: int = extracted_data.get("rank", None)
+        self.streak: Streak = self._get_model_data(extracted_data, "streak", Streak)
 
 
 # noinspection PyUnresolvedReferences
@@ -899,9 +1007,9 @@ class DivisionalOutcomeTotals(YahooFantasyObject):
             wins (int): The number of wins by the team within the division.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.losses: int = self._get_nested_value(self._extracted_data, "losses", 0, int)
-        self.ties: int = self._get_nested_value(self._extracted_data, "ties", 0, int)
-        self.wins: int = self._get_nested_value(self._extracted_data, "wins", 0, int)
+        self.losses: int = self._get_nested_value(extracted_data, "losses", 0, int)
+        self.ties: int = self._get_nested_value(extracted_data, "ties", 0, int)
+        self.wins: int = self._get_nested_value(extracted_data, "wins", 0, int)
 
 
 # noinspection PyUnresolvedReferences
@@ -922,10 +1030,10 @@ class OutcomeTotals(YahooFantasyObject):
             wins (int): The number of wins by the team.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.losses: int = self._get_nested_value(self._extracted_data, "losses", 0, int)
-        self.percentage: float = self._get_nested_value(self._extracted_data, "percentage", 0.0, float)
-        self.ties: int = self._get_nested_value(self._extracted_data, "ties", 0, int)
-        self.wins: int = self._get_nested_value(self._extracted_data, "wins", 0, int)
+        self.losses: int = self._get_nested_value(extracted_data, "losses", 0, int)
+        self.percentage: float = self._get_nested_value(extracted_data, "percentage", 0.0, float)
+        self.ties: int = self._get_nested_value(extracted_data, "ties", 0, int)
+        self.wins: int = self._get_nested_value(extracted_data, "wins", 0, int)
 
 
 # noinspection PyUnresolvedReferences
@@ -944,8 +1052,8 @@ class Streak(YahooFantasyObject):
             value (int): The length of the streak.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.type: str = self._extracted_data.get("type", "")
-        self.value: int = self._get_nested_value(self._extracted_data, "value", 0, int)
+        self.type: str = extracted_data.get("type", "")
+        self.value: int = self._get_nested_value(extracted_data, "value", 0, int)
 
 
 # noinspection PyUnresolvedReferences
@@ -964,8 +1072,8 @@ class Scoreboard(YahooFantasyObject):
             week (int): The week for which the scoreboard applies.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.matchups: List[Matchup] = self._extracted_data.get("matchups", [])
-        self.week: int = self._extracted_data.get("week", None)
+        self.matchups: List[Matchup] = extracted_data.get("matchups", [])
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection DuplicatedCode, PyUnresolvedReferences
@@ -1024,40 +1132,40 @@ class Settings(YahooFantasyObject):
             waiver_type (str): Value designating what type of waivers are used by the league ("R" for rolling, etc.).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.cant_cut_list: int = self._extracted_data.get("cant_cut_list", 0)
-        self.divisions: List[Division] = self._extracted_data.get("divisions", [])
-        self.draft_pick_time: int = self._extracted_data.get("draft_pick_time", None)
-        self.draft_time: int = self._extracted_data.get("draft_time", None)
-        self.draft_together: int = self._extracted_data.get("draft_together", 0)
-        self.draft_type: str = self._extracted_data.get("draft_type", "")
-        self.has_multiweek_championship: int = self._extracted_data.get("has_multiweek_championship", 0)
-        self.has_playoff_consolation_games: int = self._extracted_data.get("has_playoff_consolation_games", 0)
-        self.is_auction_draft: int = self._extracted_data.get("is_auction_draft", 0)
-        self.max_teams: int = self._extracted_data.get("max_teams", None)
-        self.num_playoff_consolation_teams: int = self._extracted_data.get("num_playoff_consolation_teams", None)
-        self.num_playoff_teams: int = self._extracted_data.get("num_playoff_teams", None)
-        self.pickem_enabled: int = self._extracted_data.get("pickem_enabled", 0)
-        self.player_pool: str = self._extracted_data.get("player_pool", "")
-        self.playoff_start_week: int = self._extracted_data.get("playoff_start_week", None)
-        self.post_draft_players: str = self._extracted_data.get("post_draft_players", "")
-        self.roster_positions: List[RosterPosition] = self._extracted_data.get("roster_positions", [])
-        self.scoring_type: str = self._extracted_data.get("scoring_type", "")
-        self.sendbird_channel_url: str = self._extracted_data.get("sendbird_channel_url", "")
-        self.stat_categories: StatCategories = self._extracted_data.get("stat_categories", StatCategories({}))
-        self.stat_modifiers: StatModifiers = self._extracted_data.get("stat_modifiers", StatModifiers({}))
-        self.trade_end_date: str = self._extracted_data.get("trade_end_date", "")
-        self.trade_ratify_type: str = self._extracted_data.get("trade_ratify_type", "")
-        self.trade_reject_time: int = self._extracted_data.get("trade_reject_time", None)
-        self.uses_faab: int = self._extracted_data.get("uses_faab", 0)
-        self.uses_fractional_points: int = self._extracted_data.get("uses_fractional_points", 0)
-        self.uses_lock_eliminated_teams: int = self._extracted_data.get("uses_lock_eliminated_teams", 0)
-        self.uses_median_score: int = self._extracted_data.get("uses_median_score", 0)
-        self.uses_negative_points: int = self._extracted_data.get("uses_negative_points", 0)
-        self.uses_playoff: int = self._extracted_data.get("uses_playoff", 0)
-        self.uses_playoff_reseeding: int = self._extracted_data.get("uses_playoff_reseeding", 0)
-        self.waiver_rule: str = self._extracted_data.get("waiver_rule", "")
-        self.waiver_time: int = self._extracted_data.get("waiver_time", None)
-        self.waiver_type: str = self._extracted_data.get("waiver_type", "")
+        self.cant_cut_list: int = extracted_data.get("cant_cut_list", 0)
+        self.divisions: List[Division] = extracted_data.get("divisions", [])
+        self.draft_pick_time: int = extracted_data.get("draft_pick_time", None)
+        self.draft_time: int = extracted_data.get("draft_time", None)
+        self.draft_together: int = extracted_data.get("draft_together", 0)
+        self.draft_type: str = extracted_data.get("draft_type", "")
+        self.has_multiweek_championship: int = extracted_data.get("has_multiweek_championship", 0)
+        self.has_playoff_consolation_games: int = extracted_data.get("has_playoff_consolation_games", 0)
+        self.is_auction_draft: int = extracted_data.get("is_auction_draft", 0)
+        self.max_teams: int = extracted_data.get("max_teams", None)
+        self.num_playoff_consolation_teams: int = extracted_data.get("num_playoff_consolation_teams", None)
+        self.num_playoff_teams: int = extracted_data.get("num_playoff_teams", None)
+        self.pickem_enabled: int = extracted_data.get("pickem_enabled", 0)
+        self.player_pool: str = extracted_data.get("player_pool", "")
+        self.playoff_start_week: int = extracted_data.get("playoff_start_week", None)
+        self.post_draft_players: str = extracted_data.get("post_draft_players", "")
+        self.roster_positions: List[RosterPosition] = extracted_data.get("roster_positions", [])
+        self.scoring_type: str = extracted_data.get("scoring_type", "")
+        self.sendbird_channel_url: str = extracted_data.get("sendbird_channel_url", "")
+        self.stat_categories: StatCategories = self._get_model_data(extracted_data, "stat_categories", StatCategories)
+        self.stat_modifiers: StatModifiers = self._get_model_data(extracted_data, "stat_modifiers", StatModifiers)
+        self.trade_end_date: str = extracted_data.get("trade_end_date", "")
+        self.trade_ratify_type: str = extracted_data.get("trade_ratify_type", "")
+        self.trade_reject_time: int = extracted_data.get("trade_reject_time", None)
+        self.uses_faab: int = extracted_data.get("uses_faab", 0)
+        self.uses_fractional_points: int = extracted_data.get("uses_fractional_points", 0)
+        self.uses_lock_eliminated_teams: int = extracted_data.get("uses_lock_eliminated_teams", 0)
+        self.uses_median_score: int = extracted_data.get("uses_median_score", 0)
+        self.uses_negative_points: int = extracted_data.get("uses_negative_points", 0)
+        self.uses_playoff: int = extracted_data.get("uses_playoff", 0)
+        self.uses_playoff_reseeding: int = extracted_data.get("uses_playoff_reseeding", 0)
+        self.waiver_rule: str = extracted_data.get("waiver_rule", "")
+        self.waiver_time: int = extracted_data.get("waiver_time", None)
+        self.waiver_type: str = extracted_data.get("waiver_type", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1076,8 +1184,8 @@ class Division(YahooFantasyObject):
             name (str): The division name.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.division_id: int = self._extracted_data.get("division_id", None)
-        self.name: str = self._extracted_data.get("name", "")
+        self.division_id: int = extracted_data.get("division_id", None)
+        self.name: str = extracted_data.get("name", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1102,13 +1210,13 @@ class RosterPosition(YahooFantasyObject):
             position_type (str): The position type ("O" for offense, etc.)
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.abbreviation: str = self._extracted_data.get("abbreviation", "")
-        self.count: int = self._extracted_data.get("count", 0)
-        self.display_name: str = self._extracted_data.get("display_name", "")
-        self.is_bench: int = self._extracted_data.get("is_bench", 0)
-        self.is_starting_position: int = self._extracted_data.get("is_starting_position", 0)
-        self.position: str = self._extracted_data.get("position", "")
-        self.position_type: str = self._extracted_data.get("position_type", "")
+        self.abbreviation: str = extracted_data.get("abbreviation", "")
+        self.count: int = extracted_data.get("count", 0)
+        self.display_name: str = extracted_data.get("display_name", "")
+        self.is_bench: int = extracted_data.get("is_bench", 0)
+        self.is_starting_position: int = extracted_data.get("is_starting_position", 0)
+        self.position: str = extracted_data.get("position", "")
+        self.position_type: str = extracted_data.get("position_type", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1128,8 +1236,8 @@ class StatCategories(YahooFantasyObject):
             stats (list[Stat]): A list of YFPY Stat instances representing the league stat categories.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.groups: List[Group] = self._extracted_data.get("groups", [])
-        self.stats: List[Stat] = self._extracted_data.get("stats", [])
+        self.groups: List[Group] = extracted_data.get("groups", [])
+        self.stats: List[Stat] = extracted_data.get("stats", [])
 
 
 # noinspection PyUnresolvedReferences
@@ -1149,9 +1257,9 @@ class Group(YahooFantasyObject):
             group_name (str): The name of the stat categories group.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.group_abbr: str = self._extracted_data.get("group_abbr", "")
-        self.group_display_name: str = self._extracted_data.get("group_display_name", "")
-        self.group_name: str = self._extracted_data.get("group_name", "")
+        self.group_abbr: str = extracted_data.get("group_abbr", "")
+        self.group_display_name: str = extracted_data.get("group_display_name", "")
+        self.group_name: str = extracted_data.get("group_name", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1169,7 +1277,7 @@ class StatModifiers(YahooFantasyObject):
             stats (list[Stat]): A list of YFPY Stat instances containing modifiers for each stat category.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.stats: List[Stat] = self._extracted_data.get("stats", [])
+        self.stats: List[Stat] = extracted_data.get("stats", [])
 
 
 # noinspection PyUnresolvedReferences
@@ -1201,20 +1309,20 @@ class Stat(YahooFantasyObject):
             value (float): The value of the stat (if applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.abbr: str = self._extracted_data.get("abbr", "")
-        self.bonuses: List[Bonus] = self._extracted_data.get("bonuses", [])
-        self.display_name: str = self._extracted_data.get("display_name", "")
-        self.enabled: int = self._extracted_data.get("enabled", 0)
-        self.group: str = self._extracted_data.get("group", "")
-        self.is_excluded_from_display: int = self._extracted_data.get("is_excluded_from_display", 0)
-        self.is_only_display_stat: int = self._extracted_data.get("is_only_display_stat", 0)
-        self.name: str = self._extracted_data.get("name", "")
-        self.position_type: str = self._extracted_data.get("position_type", "")
-        self.position_types: List[PositionType] = self._extracted_data.get("position_types", [])
-        self.sort_order: int = self._extracted_data.get("sort_order", 0)
-        self.stat_id: int = self._extracted_data.get("stat_id", None)
-        self.stat_position_types: List[PositionType] = self._extracted_data.get("position_types", [])
-        self.value: float = self._get_nested_value(self._extracted_data, "value", 0.0, float)
+        self.abbr: str = extracted_data.get("abbr", "")
+        self.bonuses: List[Bonus] = extracted_data.get("bonuses", [])
+        self.display_name: str = extracted_data.get("display_name", "")
+        self.enabled: int = extracted_data.get("enabled", 0)
+        self.group: str = extracted_data.get("group", "")
+        self.is_excluded_from_display: int = extracted_data.get("is_excluded_from_display", 0)
+        self.is_only_display_stat: int = extracted_data.get("is_only_display_stat", 0)
+        self.name: str = extracted_data.get("name", "")
+        self.position_type: str = extracted_data.get("position_type", "")
+        self.position_types: List[PositionType] = extracted_data.get("position_types", [])
+        self.sort_order: int = extracted_data.get("sort_order", 0)
+        self.stat_id: int = extracted_data.get("stat_id", None)
+        self.stat_position_types: List[PositionType] = extracted_data.get("position_types", [])
+        self.value: float = self._get_nested_value(extracted_data, "value", 0.0, float)
 
 
 # noinspection PyUnresolvedReferences
@@ -1234,8 +1342,8 @@ class StatPositionType(YahooFantasyObject):
             position_type (str): The type of the position ("O" for offense, etc.)
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.is_only_display_stat: int = self._extracted_data.get("is_only_display_stat", 0)
-        self.position_type: str = self._extracted_data.get("position_type", "")
+        self.is_only_display_stat: int = extracted_data.get("is_only_display_stat", 0)
+        self.position_type: str = extracted_data.get("position_type", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1254,8 +1362,8 @@ class Bonus(YahooFantasyObject):
             target (int): The stat value target required to be awarded the bonus.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.points: float = self._get_nested_value(self._extracted_data, "points", 0.0, float)
-        self.target: int = self._extracted_data.get("target", None)
+        self.points: float = self._get_nested_value(extracted_data, "points", 0.0, float)
+        self.target: int = extracted_data.get("target", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -1285,19 +1393,19 @@ class Matchup(YahooFantasyObject):
             winner_team_key (str): The Yahoo team key of the team that won the matchup.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.is_consolation: int = self._extracted_data.get("is_consolation", 0)
-        self.is_matchup_recap_available: int = self._extracted_data.get("is_matchup_recap_available", 0)
-        self.is_playoffs: int = self._extracted_data.get("is_playoffs", 0)
-        self.is_tied: int = self._extracted_data.get("is_tied", 0)
-        self.matchup_grades: List[MatchupGrade] = self._extracted_data.get("matchup_grades", [])
-        self.matchup_recap_title: str = self._extracted_data.get("matchup_recap_title", "")
-        self.matchup_recap_url: str = self._extracted_data.get("matchup_recap_url", "")
-        self.status: str = self._extracted_data.get("status", "")
-        self.teams: List[Team] = self._extracted_data.get("teams", [])
-        self.week: int = self._extracted_data.get("week", None)
-        self.week_end: str = self._extracted_data.get("week_end", "")
-        self.week_start: str = self._extracted_data.get("week_start", "")
-        self.winner_team_key: str = self._extracted_data.get("winner_team_key", "")
+        self.is_consolation: int = extracted_data.get("is_consolation", 0)
+        self.is_matchup_recap_available: int = extracted_data.get("is_matchup_recap_available", 0)
+        self.is_playoffs: int = extracted_data.get("is_playoffs", 0)
+        self.is_tied: int = extracted_data.get("is_tied", 0)
+        self.matchup_grades: List[MatchupGrade] = extracted_data.get("matchup_grades", [])
+        self.matchup_recap_title: str = extracted_data.get("matchup_recap_title", "")
+        self.matchup_recap_url: str = extracted_data.get("matchup_recap_url", "")
+        self.status: str = extracted_data.get("status", "")
+        self.teams: List[Team] = extracted_data.get("teams", [])
+        self.week: int = extracted_data.get("week", None)
+        self.week_end: str = extracted_data.get("week_end", "")
+        self.week_start: str = extracted_data.get("week_start", "")
+        self.winner_team_key: str = extracted_data.get("winner_team_key", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1316,8 +1424,8 @@ class MatchupGrade(YahooFantasyObject):
             team_key (str): The Yahoo team key for the team receiving the matchup grade.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.grade: str = self._extracted_data.get("grade", "")
-        self.team_key: str = self._extracted_data.get("team_key", "")
+        self.grade: str = extracted_data.get("grade", "")
+        self.team_key: str = extracted_data.get("team_key", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1383,20 +1491,20 @@ class Player(YahooFantasyObject):
             url (str): The direct URL of the player page on Yahoo Sports.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.bye_weeks: ByeWeeks = self._extracted_data.get("bye_weeks", ByeWeeks({}))
+        self.bye_weeks: ByeWeeks = self._get_model_data(extracted_data, "bye_weeks", ByeWeeks)
         self.bye: int = self._get_nested_value(self.bye_weeks, "week", None, int)
-        self.display_position: str = self._extracted_data.get("display_position", "")
-        self.draft_analysis: DraftAnalysis = self._extracted_data.get("draft_analysis", DraftAnalysis({}))
+        self.display_position: str = extracted_data.get("display_position", "")
+        self.draft_analysis: DraftAnalysis = self._get_model_data(extracted_data, "draft_analysis", DraftAnalysis)
         self.average_draft_pick: float = self._get_nested_value(self.draft_analysis, "average_pick", None, float)
         self.average_draft_round: float = self._get_nested_value(self.draft_analysis, "average_round", None, float)
         self.average_draft_cost: float = self._get_nested_value(self.draft_analysis, "average_cost", None, float)
         self.percent_drafted: float = self._get_nested_value(self.draft_analysis, "percent_drafted", None, float)
-        self.editorial_player_key: str = self._extracted_data.get("editorial_player_key", "")
-        self.editorial_team_abbr: str = self._extracted_data.get("editorial_team_abbr", "")
-        self.editorial_team_full_name: str = self._extracted_data.get("editorial_team_full_name", "")
-        self.editorial_team_key: str = self._extracted_data.get("editorial_team_key", "")
-        self.editorial_team_url: str = self._extracted_data.get("editorial_team_url", "")
-        eligible_positions = self._extracted_data.get("eligible_positions")
+        self.editorial_player_key: str = extracted_data.get("editorial_player_key", "")
+        self.editorial_team_abbr: str = extracted_data.get("editorial_team_abbr", "")
+        self.editorial_team_full_name: str = extracted_data.get("editorial_team_full_name", "")
+        self.editorial_team_key: str = extracted_data.get("editorial_team_key", "")
+        self.editorial_team_url: str = extracted_data.get("editorial_team_url", "")
+        eligible_positions = extracted_data.get("eligible_positions")
         self.eligible_positions: List[str] = []
         if isinstance(eligible_positions, dict):
             self.eligible_positions.append(eligible_positions.get("position"))
@@ -1408,43 +1516,46 @@ class Player(YahooFantasyObject):
                     self.eligible_positions.append(position)
         elif isinstance(eligible_positions, str):
             self.eligible_positions.append(eligible_positions)
-        self.has_player_notes: int = self._extracted_data.get("has_player_notes", 0)
-        self.has_recent_player_notes: int = self._extracted_data.get("has_recent_player_notes", 0)
-        self.headshot: Headshot = self._extracted_data.get("headshot", Headshot({}))
+        self.has_player_notes: int = extracted_data.get("has_player_notes", 0)
+        self.has_recent_player_notes: int = extracted_data.get("has_recent_player_notes", 0)
+        self.headshot: Headshot = self._get_model_data(extracted_data, "headshot", Headshot)
         self.headshot_size: str = self._get_nested_value(self.headshot, "size", "")
         self.headshot_url: str = self._get_nested_value(self.headshot, "url", "")
-        self.image_url: str = self._extracted_data.get("image_url", "")
-        self.injury_note: str = self._extracted_data.get("injury_note", "")
-        self.is_editable: int = self._extracted_data.get("is_editable", 0)
-        self.is_keeper: int = self._extracted_data.get("is_keeper", 0)
-        self.is_undroppable: int = self._extracted_data.get("is_undroppable", 0)
-        self.name: Name = self._extracted_data.get("name", Name({}))
+        self.image_url: str = extracted_data.get("image_url", "")
+        self.injury_note: str = extracted_data.get("injury_note", "")
+        self.is_editable: int = extracted_data.get("is_editable", 0)
+        self.is_keeper: int = extracted_data.get("is_keeper", 0)
+        self.is_undroppable: int = extracted_data.get("is_undroppable", 0)
+        self.name: Name = self._get_model_data(extracted_data, "name", Name)
         self.first_name: str = self._get_nested_value(self.name, "first", "")
         self.last_name: str = self._get_nested_value(self.name, "last", "")
         self.full_name: str = self._get_nested_value(self.name, "full", "")
-        self.ownership: Ownership = self._extracted_data.get("ownership", Ownership({}))
-        self.percent_owned: PercentOwned = self._extracted_data.get("percent_owned", PercentOwned({}))
+        self.ownership: Ownership = self._get_model_data(extracted_data, "ownership", Ownership)
+        self.percent_owned: PercentOwned = self._get_model_data(extracted_data, "percent_owned", PercentOwned)
         self.percent_owned_value: float = self._get_nested_value(self.percent_owned, "value", 0.0, float)
-        self.player_advanced_stats: PlayerAdvancedStats = self._extracted_data.get("player_advanced_stats",
-                                                                                   PlayerAdvancedStats({}))
-        self.player_id: int = self._extracted_data.get("player_id", None)
-        self.player_key: str = self._extracted_data.get("player_key", "")
-        self.player_notes_last_timestamp: int = self._extracted_data.get("player_notes_last_timestamp", None)
-        self.player_points: PlayerPoints = self._extracted_data.get("player_points", PlayerPoints({}))
+        self.player_advanced_stats: PlayerAdvancedStats = self._get_model_data(
+            extracted_data, "player_advanced_stats", PlayerAdvancedStats
+        )
+        self.player_id: int = extracted_data.get("player_id", None)
+        self.player_key: str = extracted_data.get("player_key", "")
+        self.player_notes_last_timestamp: int = extracted_data.get("player_notes_last_timestamp", None)
+        self.player_points: PlayerPoints = self._get_model_data(extracted_data, "player_points", PlayerPoints)
         self.player_points_value: float = self._get_nested_value(self.player_points, "total", 0.0, float)
-        self.player_stats: PlayerStats = self._extracted_data.get("player_stats", PlayerStats({}))
+        self.player_stats: PlayerStats = self._get_model_data(extracted_data, "player_stats", PlayerStats)
         self.stats: List[Stat] = self._get_nested_value(self.player_stats, "stats", [])
-        self.position_type: str = self._extracted_data.get("position_type", "")
-        self.primary_position: str = self._extracted_data.get("primary_position", "")
-        self.selected_position: SelectedPosition = self._extracted_data.get("selected_position",
-                                                                            SelectedPosition({}))
+        self.position_type: str = extracted_data.get("position_type", "")
+        self.primary_position: str = extracted_data.get("primary_position", "")
+        self.selected_position: SelectedPosition = self._get_model_data(
+            extracted_data, "selected_position", SelectedPosition
+        )
         self.selected_position_value: str = self._get_nested_value(self.selected_position, "position", "")
-        self.status: str = self._extracted_data.get("status", "")
-        self.status_full: str = self._extracted_data.get("status_full", "")
-        self.transaction_data: TransactionData = self._extracted_data.get("transaction_data",
-                                                                          TransactionData({}))
-        self.uniform_number: int = self._extracted_data.get("uniform_number", None)
-        self.url: str = self._extracted_data.get("url", "")
+        self.status: str = extracted_data.get("status", "")
+        self.status_full: str = extracted_data.get("status_full", "")
+        self.transaction_data: TransactionData = self._get_model_data(
+            extracted_data, "transaction_data", TransactionData
+        )
+        self.uniform_number: int = extracted_data.get("uniform_number", None)
+        self.url: str = extracted_data.get("url", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1462,7 +1573,7 @@ class ByeWeeks(YahooFantasyObject):
             week (int): The week number that the player is on bye.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.week: int = self._extracted_data.get("week", None)
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -1487,21 +1598,21 @@ class DraftAnalysis(YahooFantasyObject):
             preseason_percent_drafted (float): The overall percentage the player was drafted in the preseason.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.average_pick: float = self._get_nested_value(self._extracted_data, "average_pick", 0.0, float)
-        self.average_round: float = self._get_nested_value(self._extracted_data, "average_round", 0.0, float)
-        self.average_cost: float = self._get_nested_value(self._extracted_data, "average_cost", 0.0, float)
-        self.percent_drafted: float = self._get_nested_value(self._extracted_data, "percent_drafted", 0.0, float)
+        self.average_pick: float = self._get_nested_value(extracted_data, "average_pick", 0.0, float)
+        self.average_round: float = self._get_nested_value(extracted_data, "average_round", 0.0, float)
+        self.average_cost: float = self._get_nested_value(extracted_data, "average_cost", 0.0, float)
+        self.percent_drafted: float = self._get_nested_value(extracted_data, "percent_drafted", 0.0, float)
         self.preseason_average_cost: float = self._get_nested_value(
-            self._extracted_data, "preseason_average_cost", 0.0, float
+            extracted_data, "preseason_average_cost", 0.0, float
         )
         self.preseason_average_pick: float = self._get_nested_value(
-            self._extracted_data, "preseason_average_pick", 0.0, float
+            extracted_data, "preseason_average_pick", 0.0, float
         )
         self.preseason_average_round: float = self._get_nested_value(
-            self._extracted_data, "preseason_average_round", 0.0, float
+            extracted_data, "preseason_average_round", 0.0, float
         )
         self.preseason_percent_drafted: float = self._get_nested_value(
-            self._extracted_data, "preseason_percent_drafted", 0.0, float
+            extracted_data, "preseason_percent_drafted", 0.0, float
         )
 
 
@@ -1521,8 +1632,8 @@ class Headshot(YahooFantasyObject):
             url (str): The direct URL of the headshot photo.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.size: str = self._extracted_data.get("size", "")
-        self.url: str = self._extracted_data.get("url", "")
+        self.size: str = extracted_data.get("size", "")
+        self.url: str = extracted_data.get("url", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1544,11 +1655,11 @@ class Name(YahooFantasyObject):
             last (str): The last name of teh player.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.ascii_first: str = self._extracted_data.get("ascii_first", "")
-        self.ascii_last: str = self._extracted_data.get("ascii_last", "")
-        self.first: str = self._extracted_data.get("first", "")
-        self.full: str = self._extracted_data.get("full", "")
-        self.last: str = self._extracted_data.get("last", "")
+        self.ascii_first: str = extracted_data.get("ascii_first", "")
+        self.ascii_last: str = extracted_data.get("ascii_last", "")
+        self.first: str = extracted_data.get("first", "")
+        self.full: str = extracted_data.get("full", "")
+        self.last: str = extracted_data.get("last", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1571,12 +1682,12 @@ class Ownership(YahooFantasyObject):
             waiver_date (str): The date the player went on waivers (when applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.display_date: int = self._extracted_data.get("display_date", None)
-        self.ownership_type: str = self._extracted_data.get("ownership_type", "")
-        self.owner_team_key: str = self._extracted_data.get("owner_team_key", "")
-        self.owner_team_name: str = self._extracted_data.get("owner_team_name", "")
-        self.teams: List[Team] = self._extracted_data.get("teams", [])
-        self.waiver_date: str = self._extracted_data.get("waiver_date", "")
+        self.display_date: int = extracted_data.get("display_date", None)
+        self.ownership_type: str = extracted_data.get("ownership_type", "")
+        self.owner_team_key: str = extracted_data.get("owner_team_key", "")
+        self.owner_team_name: str = extracted_data.get("owner_team_name", "")
+        self.teams: List[Team] = extracted_data.get("teams", [])
+        self.waiver_date: str = extracted_data.get("waiver_date", "")
 
 
 # noinspection PyUnresolvedReferences
@@ -1598,10 +1709,10 @@ class PercentOwned(YahooFantasyObject):
                 coverage timeframe.
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.week: int = self._extracted_data.get("week", None)
-        self.value: int = self._get_nested_value(self._extracted_data, "value", 0, int)
-        self.delta: float = self._get_nested_value(self._extracted_data, "delta", 0.0, float)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.week: int = extracted_data.get("week", None)
+        self.value: int = self._get_nested_value(extracted_data, "value", 0, int)
+        self.delta: float = self._get_nested_value(extracted_data, "delta", 0.0, float)
 
 
 # noinspection PyUnresolvedReferences
@@ -1622,10 +1733,10 @@ class PlayerAdvancedStats(YahooFantasyObject):
             week (int): The week number (when applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.season: int = self._extracted_data.get("season", None)
-        self.stats: List[Stat] = self._extracted_data.get("stats", [])
-        self.week: int = self._extracted_data.get("week", None)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.season: int = extracted_data.get("season", None)
+        self.stats: List[Stat] = extracted_data.get("stats", [])
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -1646,10 +1757,10 @@ class PlayerPoints(YahooFantasyObject):
             week (int): The week number (when applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.season: int = self._extracted_data.get("season", None)
-        self.total: float = self._get_nested_value(self._extracted_data, "total", 0.0, float)
-        self.week: int = self._extracted_data.get("week", None)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.season: int = extracted_data.get("season", None)
+        self.total: float = self._get_nested_value(extracted_data, "total", 0.0, float)
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -1671,11 +1782,11 @@ class PlayerStats(YahooFantasyObject):
             week (int): The week number (when applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.date: str = self._extracted_data.get("date", "")
-        self.season: int = self._extracted_data.get("season", None)
-        self.stats: List[Stat] = self._extracted_data.get("stats", [])
-        self.week: int = self._extracted_data.get("week", None)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.date: str = extracted_data.get("date", "")
+        self.season: int = extracted_data.get("season", None)
+        self.stats: List[Stat] = extracted_data.get("stats", [])
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -1697,11 +1808,11 @@ class SelectedPosition(YahooFantasyObject):
             week (int): The week number (when applicable).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.coverage_type: str = self._extracted_data.get("coverage_type", "")
-        self.date: str = self._extracted_data.get("date", "")
-        self.is_flex: int = self._extracted_data.get("is_flex", 0)
-        self.position: str = self._extracted_data.get("position", "")
-        self.week: int = self._extracted_data.get("week", None)
+        self.coverage_type: str = extracted_data.get("coverage_type", "")
+        self.date: str = extracted_data.get("date", "")
+        self.is_flex: int = extracted_data.get("is_flex", 0)
+        self.position: str = extracted_data.get("position", "")
+        self.week: int = extracted_data.get("week", None)
 
 
 # noinspection PyUnresolvedReferences
@@ -1725,10 +1836,10 @@ class TransactionData(YahooFantasyObject):
             type (str): The type of the transaction ("add", "drop", "trade", etc.).
         """
         YahooFantasyObject.__init__(self, extracted_data)
-        self.destination_team_key: str = self._extracted_data.get("destination_team_key", "")
-        self.destination_team_name: str = self._extracted_data.get("destination_team_name", "")
-        self.destination_type: str = self._extracted_data.get("destination_type", "")
-        self.source_team_key: str = self._extracted_data.get("source_team_key", "")
-        self.source_team_name: str = self._extracted_data.get("source_team_name", "")
-        self.source_type: str = self._extracted_data.get("source_type", "")
-        self.type: str = self._extracted_data.get("type", "")
+        self.destination_team_key: str = extracted_data.get("destination_team_key", "")
+        self.destination_team_name: str = extracted_data.get("destination_team_name", "")
+        self.destination_type: str = extracted_data.get("destination_type", "")
+        self.source_team_key: str = extracted_data.get("source_team_key", "")
+        self.source_team_name: str = extracted_data.get("source_team_name", "")
+        self.source_type: str = extracted_data.get("source_type", "")
+        self.type: str = extracted_data.get("type", "")
@@ -4,48 +4,350 @@
 This module provides all available Yahoo Fantasy Sports API queries as callable methods on the YahooFantasySportsQuery
     class.
 
+Note:
+    Responses are requested gzip/deflate compressed, and brotli or zstandard compressed when the optional decoders used
+    by requests are installed (pip install brotli zstandard), which shrinks the verbose Yahoo JSON several times over
+    on the wire. Large collections are parsed incrementally while they are downloaded when the optional ijson
+    dependency is installed (pip install ijson).
+
 Attributes:
     logger (Logger): Module level logger for usage and debugging.
+    YAHOO_FANTASY_API_BASE_URL (str): Base URL of the Yahoo Fantasy Sports REST API.
+    GAME_INFO_SUBRESOURCES (str): Subresources retrieved by game info queries.
+    LEAGUE_INFO_SUBRESOURCES (str): Subresources retrieved by league info queries.
+    TEAM_INFO_SUBRESOURCES (str): Subresources retrieved by team info queries.
+    PLAYER_INFO_SUBRESOURCES (str): Subresources retrieved by player info queries.
+    COLLECTION_DATA_KEYS (frozenset[str]): Data keys of Yahoo collections, which queries always return as lists.
+    TEAM_DATA_KEY_PATH (tuple): Data key path of team queries.
+    TEAM_POINTS_DATA_KEY_PATH (tuple): Data key path of team points queries.
+    TEAM_WEEK_POINTS_DATA_KEY_PATH (tuple): Data key path of team points and projected points queries by week.
+    TEAM_STANDINGS_DATA_KEY_PATH (tuple): Data key path of team standings queries.
+    TEAM_ROSTER_DATA_KEY_PATH (tuple): Data key path of team roster queries.
+    TEAM_ROSTER_PLAYERS_DATA_KEY_PATH (tuple): Data key path of team roster player queries.
+    TEAM_DRAFT_RESULTS_DATA_KEY_PATH (tuple): Data key path of team draft results queries.
+    TEAM_MATCHUPS_DATA_KEY_PATH (tuple): Data key path of team matchups queries.
+    LEAGUE_MATCHUPS_DATA_KEY_PATH (tuple): Data key path of league matchup queries.
+    LEAGUE_PLAYER_DATA_KEY_PATH (tuple): Data key path of single player queries within a league.
+    PLAYER_DATA_KEY_PATH (tuple): Data key path of single player queries across a game.
+    RETRY_BACKOFF_BASE_SECONDS (float): Base delay in seconds for exponential backoff between request retries.
+    RETRY_BACKOFF_CAP_SECONDS (float): Maximum delay in seconds for exponential backoff between request retries.
+    RETRY_AFTER_MAX_SECONDS (float): Maximum delay in seconds honored from the Retry-After header of a failed request.
+    HTTP_POOL_CONNECTIONS (int): Number of connection pools cached by the HTTP session.
+    HTTP_POOL_MAXSIZE (int): Maximum number of reusable connections kept open per connection pool.
+    PREWARM_TIMEOUT_SECONDS (float): Number of seconds to wait for the connection prewarm request.
+    ACCESS_TOKEN_REFRESH_AGE_SECONDS (float): Age in seconds after which access tokens are refreshed before making a
+        request.
+    LEAGUE_PLAYERS_BATCH_SIZE (int): Number of players retrieved per request when retrieving league players (or
+        multiple players by player key).
+    LEAGUE_PLAYERS_MAX_WORKERS (int): Maximum number of player batches retrieved concurrently when retrieving league
+        players (or multiple players by player key).
+    LEAGUE_WEEKS_MAX_WORKERS (int): Maximum number of weeks (or dates) retrieved concurrently when retrieving league or
+        team data for multiple weeks (or dates).
+    PREFETCH_MAX_WORKERS (int): Maximum number of likely next queries prefetched concurrently (when prefetching is
+        enabled).
+    EXECUTED_QUERIES_MAXLEN (int): Maximum number of executed query summaries retained by each query object.
+    LIVE_DATA_CACHE_TTL_SECONDS (float): Default number of seconds cached results of queries for data that can still
+        change remain valid.
+    FAILED_PLAYER_RETRIEVAL_CACHE_TTL_SECONDS (float): Number of seconds failed individual league player retrievals
+        are remembered (in memory only) and skipped.
+    STREAMING_MIN_CONTENT_LENGTH (int): Minimum response Content-Length (in bytes) for which collections are parsed
+        incrementally while they are downloaded instead of after the whole response has been decoded.
 
 """
 __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
+import hashlib
 import json
 import logging
+import random
+import re
+import threading
 import time
 import tempfile
-import json
-from pathlib import Path, PosixPath
-from typing import Callable, Dict, List, Type, TypeVar, Union, Any
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import repeat
+from operator import itemgetter
+from pathlib import Path
+from typing import (
+    Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Type, TypeVar, Union, Any
+)
+from weakref import WeakValueDictionary
 
 from requests import Response
-from requests.exceptions import HTTPError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, HTTPError, Timeout
+from requests.utils import DEFAULT_ACCEPT_ENCODING
 from yahoo_oauth import OAuth2
 
-from yfpy.exceptions import YahooFantasySportsDataNotFound
-from yfpy.logger import get_logger
-from yfpy.models import YahooFantasyObject, DraftResult, Game, GameWeek, User, League, Standings, Settings, Player, \
-    PositionType, StatCategories, Transaction, Scoreboard, Team, TeamPoints, TeamProjectedPoints, TeamStandings, \
-    Roster, RosterPosition, Matchup
-from yfpy.utils import jsonify_data, prettify_data, reformat_json_list, unpack_data
+from yfpy.cache import QueryCache
+from yfpy.exceptions import YahooFantasySportsDataNotFound, YahooFantasySportsException
+from yfpy.models import YahooFantasyObject, LazyYahooObject, DraftResult, Game, GameWeek, User, League, Standings, \
+    Settings, Player, PositionType, StatCategories, Transaction, Scoreboard, Team, TeamPoints, TeamProjectedPoints, \
+    TeamStandings, Roster, RosterPosition, Matchup
+from yfpy.utils import compile_data_key_path, jsonify_data, load_json, prettify_data, unpack_data
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG)
+
+# base URL of the Yahoo Fantasy Sports REST API
+YAHOO_FANTASY_API_BASE_URL: str = "https://fantasysports.yahooapis.com/fantasy/v2"
+
+# subresources requested alongside game, league, team, and player info
+GAME_INFO_SUBRESOURCES: str = "metadata,players,game_weeks,stat_categories,position_types,roster_positions"
+LEAGUE_INFO_SUBRESOURCES: str = "metadata,settings,standings,scoreboard,teams,players,draftresults,transactions"
+TEAM_INFO_SUBRESOURCES: str = "metadata,stats,standings,roster,draftresults,matchups"
+PLAYER_INFO_SUBRESOURCES: str = "metadata,stats,ownership,percent_owned,draft_analysis"
+
+# data keys of Yahoo collections, which are returned as lists even when they only contain a single item
+COLLECTION_DATA_KEYS: FrozenSet[str] = frozenset({
+    "draft_results", "game_weeks", "games", "leagues", "matchups", "players", "position_types", "roster_positions",
+    "teams", "transactions"
+})
+
+# data key paths shared by the team and matchup queries of YahooFantasySportsQuery and AsyncYahooFantasySportsQuery
+TEAM_DATA_KEY_PATH: Tuple[str] = ("team",)
+TEAM_POINTS_DATA_KEY_PATH: Tuple[str, str] = ("team", "team_points")
+TEAM_WEEK_POINTS_DATA_KEY_PATH: Tuple[str, Tuple[str, str]] = ("team", ("team_points", "team_projected_points"))
+TEAM_STANDINGS_DATA_KEY_PATH: Tuple[str, str] = ("team", "team_standings")
+TEAM_ROSTER_DATA_KEY_PATH: Tuple[str, str] = ("team", "roster")
+TEAM_ROSTER_PLAYERS_DATA_KEY_PATH: Tuple[str, ...] = ("team", "roster", "0", "players")
+TEAM_DRAFT_RESULTS_DATA_KEY_PATH: Tuple[str, str] = ("team", "draft_results")
+TEAM_MATCHUPS_DATA_KEY_PATH: Tuple[str, str] = ("team", "matchups")
+LEAGUE_MATCHUPS_DATA_KEY_PATH: Tuple[str, ...] = ("league", "scoreboard", "0", "matchups")
+LEAGUE_PLAYER_DATA_KEY_PATH: Tuple[str, ...] = ("league", "players", "0", "player")
+PLAYER_DATA_KEY_PATH: Tuple[str, ...] = ("players", "0", "player")
+
+# exponential backoff settings (in seconds) used when retrying failed requests
+RETRY_BACKOFF_BASE_SECONDS: float = 1.0
+RETRY_BACKOFF_CAP_SECONDS: float = 30.0
+# longer Retry-After delays would block the calling thread (or task) for the whole delay
+RETRY_AFTER_MAX_SECONDS: float = 120.0
+
+# connection pool settings for the HTTP session shared by all queries
+HTTP_POOL_CONNECTIONS: int = 16
+HTTP_POOL_MAXSIZE: int = 32
+
+# timeout (in seconds) of the request opening a keep-alive connection when prewarming the HTTP session
+PREWARM_TIMEOUT_SECONDS: float = 10.0
+
+# age (in seconds) after which Yahoo access tokens (which expire after one hour) are refreshed before making a request,
+# so that requests are not rejected with a 401 status code (and retried) once the access token has expired
+ACCESS_TOKEN_REFRESH_AGE_SECONDS: float = 59 * 60.0
+
+# number of players retrieved per request (the maximum allowed by Yahoo) and maximum number of player batches retrieved
+# concurrently when retrieving league players (or multiple players by player key)
+LEAGUE_PLAYERS_BATCH_SIZE: int = 25
+LEAGUE_PLAYERS_MAX_WORKERS: int = 8
+
+# maximum number of weeks retrieved concurrently when retrieving league data for multiple weeks
+LEAGUE_WEEKS_MAX_WORKERS: int = 8
+
+# maximum number of likely next queries (the next week, the next team, etc.) prefetched concurrently in the background
+PREFETCH_MAX_WORKERS: int = 4
+
+# maximum number of executed query summaries kept by each query object
+EXECUTED_QUERIES_MAXLEN: int = 1024
+
+# number of seconds cached query results for data that can still change (leagues in progress, etc.) remain valid
+LIVE_DATA_CACHE_TTL_SECONDS: float = 60.0
+
+# number of seconds failed individual league player retrievals are cached, so that players missing from Yahoo are not
+# requested again every time the league players are retrieved (kept short because failures are remembered by their
+# index in the league players, which Yahoo reorders over time)
+FAILED_PLAYER_RETRIEVAL_CACHE_TTL_SECONDS: float = 5 * 60.0
+
+# minimum response size (in bytes on the wire) for which large collections are parsed incrementally while they are
+# downloaded, since streaming small responses costs more than decoding them all at once
+STREAMING_MIN_CONTENT_LENGTH: int = 32 * 1024
+
+# OAuth2 clients (and their sessions) shared by all query objects using the same Yahoo app and refresh token, so that
+# query objects do not refresh (and invalidate) each other's access tokens
+_OAUTH_POOL: "WeakValueDictionary[Tuple[str, str], OAuth2]" = WeakValueDictionary()
+_OAUTH_POOL_LOCK = threading.Lock()
+
+# formats of team IDs, player keys (<game_id or game_code>.p.<player_id>), and dates (YYYY-MM-DD) accepted by the REST
+# API, which are checked before they are used in query URLs so that malformed values fail without a request
+_TEAM_ID_PATTERN = re.compile(r"\d+")
+_PLAYER_KEY_PATTERN = re.compile(r"(?:\d+|[a-z]+)\.p\.\d+")
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _check_team_id(team_id: Union[str, int]) -> None:
+    """Check that a team ID is a number before it is used in a query URL.
+
+    Args:
+        team_id (str | int): Selected team ID (can be integers 1 through n where n is the number of teams in the
+            league).
+
+    Returns:
+        None
+
+    """
+    if not _TEAM_ID_PATTERN.fullmatch(str(team_id)):
+        raise YahooFantasySportsException(
+            f"Invalid team ID: {team_id!r}. Team IDs must be integers 1 through n where n is the number of teams in "
+            f"the league."
+        )
+
+
+def _check_player_key(player_key: str) -> None:
+    """Check that a player key is formatted as <game_id>.p.<player_id> before it is used in a query URL.
+
+    Args:
+        player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+
+    Returns:
+        None
+
+    """
+    if not _PLAYER_KEY_PATTERN.fullmatch(str(player_key)):
+        raise YahooFantasySportsException(
+            f"Invalid player key: {player_key!r}. Player keys must be formatted as <game_id>.p.<player_id> (example: "
+            f"331.p.7200)."
+        )
+
+
+def _check_date(chosen_date: str) -> None:
+    """Check that a date is formatted as YYYY-MM-DD before it is used in a query URL.
+
+    Args:
+        chosen_date (str): Selected date. REQUIRED FORMAT: YYYY-MM-DD (Ex. 2011-05-01)
+
+    Returns:
+        None
+
+    """
+    if not _DATE_PATTERN.fullmatch(str(chosen_date)):
+        raise YahooFantasySportsException(
+            f"Invalid date: {chosen_date!r}. Dates must be formatted as YYYY-MM-DD (example: 2011-05-01)."
+        )
+
+
+def _sort_by_game_season(query_data: Dict[str, Game]) -> int:
+    """Sort key for query data containing games.
+
+    Args:
+        query_data (dict[str, Game]): Query data item containing a game.
+
+    Returns:
+        int: Season of the game.
+
+    """
+    return query_data["game"].season
+
+
+def _sort_by_league_season(query_data: Dict[str, League]) -> int:
+    """Sort key for query data containing leagues.
+
+    Args:
+        query_data (dict[str, League]): Query data item containing a league.
+
+    Returns:
+        int: Season of the league.
+
+    """
+    return query_data["league"].season
+
+
+def _sort_by_position_type(query_data: Dict[str, PositionType]) -> str:
+    """Sort key for query data containing position types.
+
+    Args:
+        query_data (dict[str, PositionType]): Query data item containing a position type.
+
+    Returns:
+        str: Type of the position type.
+
+    """
+    return query_data["position_type"].type
+
+
+def _sort_by_roster_position(query_data: Dict[str, RosterPosition]) -> str:
+    """Sort key for query data containing roster positions.
+
+    Args:
+        query_data (dict[str, RosterPosition]): Query data item containing a roster position.
+
+    Returns:
+        str: Position of the roster position.
+
+    """
+    return query_data["roster_position"].position
 
 
 # noinspection PyTypeChecker, PyUnresolvedReferences
 class YahooFantasySportsQuery(object):
     """Yahoo Fantasy Sports REST API query CLASS to retrieve all types of fantasy sports data.
+
+    Note:
+        Query objects declare __slots__ and have no instance __dict__, so attributes other than the declared ones
+        cannot be set on them, and methods cannot be replaced on an instance (for example to mock or wrap a query
+        method). Patch the method on the class (or on a subclass) instead.
     """
 
+    __slots__ = (
+        "_yahoo_access_token",
+        "_yahoo_refresh_token",
+        "_yahoo_consumer_key",
+        "_yahoo_consumer_secret",
+        "_browser_callback",
+        "_retries",
+        "_backoff",
+        "fantasy_content_data_field",
+        "league_id",
+        "game_id",
+        "game_code",
+        "offline",
+        "all_output_as_json_str",
+        "league_key",
+        "executed_queries",
+        "oauth",
+        "_query_cache",
+        "_cache_ttl",
+        "_league_finished",
+        "_league_draft_finished",
+        "_league_current_week",
+        "_league_num_teams",
+        "_league_status_selection",
+        "_league_key_cache",
+        "_inflight",
+        "_inflight_lock",
+        "_cancel_event",
+        "_temp_dir",
+        "_auth_dir",
+        "_fetch_function",
+        "_prewarm_future",
+        "_prefetch_executor",
+    )
+
     YFO = TypeVar("YFO", bound=YahooFantasyObject)
 
     def __init__(self, league_id: str, access_token: str, refresh_token: str, 
                  consumer_key: str, consumer_secret: str, game_id: int = None, game_code: str = "nfl",
                  offline: bool = False, all_output_as_json_str: bool = False, browser_callback: bool = True, 
-                 retries: int = 3, backoff: int = 0):
+                 retries: int = 3, backoff: int = 0, cache_ttl: float = LIVE_DATA_CACHE_TTL_SECONDS,
+                 cache_dir: Union[Path, str] = None, fetch_function: Callable[[str], Union[bytes, str]] = None,
+                 prewarm: bool = False, prefetch: bool = False):
         """Instantiate a YahooQueryObject for running queries against the Yahoo fantasy REST API.
+
+        Queries can be replayed from previously captured responses (for back-testing and fixture-driven workflows) by
+        providing a fetch_function, which receives each query URL and returns the captured JSON response content for
+        it. Replayed queries are parsed without authenticating or making any requests, so they also run with
+        offline=True.
+
+        When prewarm is True, the OAuth access token is validated (and refreshed if needed) and a keep-alive connection
+        to the REST API is opened in a background thread, so the first query does not pay for them. Queries only wait
+        for the prewarm to finish if it is still in progress.
+
+        When prefetch is True, queries that are usually followed by a predictable next query (such as player stats for
+        the next week, or matchups of the next team) retrieve and cache the results of that next query in the
+        background, so iterating over weeks or teams does not wait for each request in turn.
         """
         self._yahoo_access_token = access_token
         self._yahoo_refresh_token = refresh_token
@@ -65,37 +367,63 @@ class YahooFantasySportsQuery(object):
         self.all_output_as_json_str: bool = all_output_as_json_str
 
         self.league_key: str = None
-        self.executed_queries: List[Dict[str, Any]] = []
-
-        # Create a temporary directory for this session
-        self._temp_dir = tempfile.TemporaryDirectory()
-        self._auth_dir = Path(self._temp_dir.name)
-
-        # Create token.json file in the temporary directory
-        token_data = {
-            "access_token": self._yahoo_access_token,
-            "refresh_token": self._yahoo_refresh_token,
-            "consumer_key": self._yahoo_consumer_key,
-            "consumer_secret": self._yahoo_consumer_secret
-        }
-        with open(self._auth_dir / "token.json", "w") as token_file:
-            json.dump(token_data, token_file)
+        # summaries of the most recently executed queries (bounded so long-running processes do not grow unbounded)
+        self.executed_queries: Deque[Dict[str, Any]] = deque(maxlen=EXECUTED_QUERIES_MAXLEN)
+
+        # cache of parsed query results, where data that does not change (historical game data, finished leagues, etc.)
+        # never expires, and data that can still change expires after the cache TTL
+        self._query_cache: QueryCache = QueryCache(cache_dir=cache_dir)
+        self._cache_ttl: float = cache_ttl
+        self._league_finished: bool = False
+        self._league_draft_finished: bool = False
+        self._league_current_week: Optional[int] = None
+        self._league_num_teams: Optional[int] = None
+        # league selection (league key, game ID, and league ID) for which the above league status was recorded
+        self._league_status_selection: Tuple[Optional[str], Optional[int], Optional[str]] = (
+            self.league_key, self.game_id, self.league_id
+        )
+        self._league_key_cache: Dict[Tuple[Optional[int], Optional[int], str], str] = {}
+
+        # requests currently in flight by URL, so that concurrent callers for the same URL share a single request
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # set by cleanup() to interrupt request retries that are waiting to be sent
+        self._cancel_event = threading.Event()
+
+        # temporary directory for the OAuth token file (only created when tokens must be retrieved interactively)
+        self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._auth_dir: Optional[Path] = None
+
+        # loads captured response content by query URL instead of requesting it from the REST API (when provided)
+        self._fetch_function: Optional[Callable[[str], Union[bytes, str]]] = fetch_function
+
+        # resolved once the background OAuth token validation and connection prewarm is done (when requested)
+        self._prewarm_future: Optional[Future] = None
+
+        # retrieves and caches the results of likely next queries in the background (when prefetching is enabled)
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=PREFETCH_MAX_WORKERS, thread_name_prefix="yfpy-prefetch")
+            if prefetch and not offline else None
+        )
 
         if not self.offline:
             self._authenticate()
+            if prewarm and getattr(self, "oauth", None):
+                self._start_prewarm()
 
     def _authenticate(self) -> None:
         """Authenticate with the Yahoo Fantasy Sports REST API.
-    
+
         Returns:
             None
         """
         logger.debug("Authenticating with Yahoo.")
-        
+
         # If consumer key and secret are not provided, try to load them from the private.json file
         if not self._yahoo_consumer_key or not self._yahoo_consumer_secret:
-            private_json_path = self._auth_dir / "private.json"
-            if private_json_path.is_file():
+            private_json_path = self._auth_dir / "private.json" if self._auth_dir else None
+            if private_json_path and private_json_path.is_file():
                 with open(private_json_path) as yahoo_app_credentials:
                     auth_info = json.load(yahoo_app_credentials)
                     self._yahoo_consumer_key = auth_info["consumer_key"]
@@ -103,24 +431,50 @@ class YahooFantasySportsQuery(object):
             else:
                 logger.error("Consumer key and secret are not provided, and private.json does not exist.")
                 return
-    
-       # Create OAuth2 object
-        self.oauth = OAuth2(self._yahoo_consumer_key, self._yahoo_consumer_secret, 
-                            from_file=str(self._auth_dir / "token.json"), 
-                            browser_callback=self._browser_callback)
-        
+
         if self._yahoo_access_token and self._yahoo_refresh_token:
-            # Tokens are already provided, no need to authenticate again
+            # Tokens are already provided, so reuse the shared OAuth2 object for these credentials if one exists, else
+            # create the OAuth2 object in memory without a token file round-trip
             logger.debug("Tokens are already provided.")
-            self.oauth.token = {
-                'access_token': self._yahoo_access_token,
-                'refresh_token': self._yahoo_refresh_token,
-                'token_type': 'bearer',
-                'expires_in': 3600,  # assuming a default value, you might want to adjust this
-            }
-            self.oauth.token_time = time.time()
+            oauth_pool_key = (
+                self._yahoo_consumer_key,
+                hashlib.sha256(self._yahoo_refresh_token.encode("utf-8")).hexdigest()
+            )
+            with _OAUTH_POOL_LOCK:
+                oauth = _OAUTH_POOL.get(oauth_pool_key)
+                if oauth:
+                    logger.debug("Reusing existing OAuth object for provided tokens.")
+                    self.oauth = oauth
+                else:
+                    self.oauth = OAuth2(self._yahoo_consumer_key, self._yahoo_consumer_secret,  # nosec B106
+                                        access_token=self._yahoo_access_token,
+                                        refresh_token=self._yahoo_refresh_token,
+                                        token_type="bearer",
+                                        token_time=time.time(),
+                                        store_file=False,
+                                        browser_callback=self._browser_callback)
+                    self._configure_session()
+                    _OAUTH_POOL[oauth_pool_key] = self.oauth
+            logger.debug("Authentication successful, OAuth object assigned.")
             return
-    
+
+        # Create token.json file in a temporary directory for the OAuth2 object to store retrieved tokens
+        if not self._temp_dir:
+            self._temp_dir = tempfile.TemporaryDirectory()
+            self._auth_dir = Path(self._temp_dir.name)
+        token_file_path = self._auth_dir / "token.json"
+        with open(token_file_path, "w") as token_file:
+            json.dump({
+                "consumer_key": self._yahoo_consumer_key,
+                "consumer_secret": self._yahoo_consumer_secret
+            }, token_file)
+
+        # Create OAuth2 object
+        self.oauth = OAuth2(self._yahoo_consumer_key, self._yahoo_consumer_secret,
+                            from_file=str(token_file_path),
+                            browser_callback=self._browser_callback)
+        self._configure_session()
+
         # If tokens are not provided, complete OAuth2 3-legged handshake
         if not self.oauth.token_is_valid():
             logger.debug("Token is not valid or not provided, refreshing access token.")
@@ -133,166 +487,1096 @@ class YahooFantasySportsQuery(object):
                 self.oauth.refresh_access_token()
         logger.debug("Authentication successful, OAuth object assigned.")
 
+    def _start_prewarm(self) -> None:
+        """Validate the OAuth access token and open a keep-alive connection to the REST API in a background thread.
+
+        Returns:
+            None
+
+        """
+        self._prewarm_future = Future()
+        threading.Thread(
+            target=self._prewarm, args=(self._prewarm_future,), name="yfpy-prewarm", daemon=True
+        ).start()
+
+    def _prewarm(self, prewarm_future: Future) -> None:
+        """Validate (and refresh if needed) the OAuth access token and open a pooled keep-alive connection to the REST
+        API, so the first query does not have to.
+
+        Failures are only logged, since the first query retries both as part of its request anyway.
+
+        Args:
+            prewarm_future (Future): Future resolved once the prewarm is done.
+
+        Returns:
+            None
+
+        """
+        try:
+            if not self.oauth.token_is_valid():
+                self._refresh_access_token(self.oauth.access_token)
+            self.oauth.session.head(YAHOO_FANTASY_API_BASE_URL, timeout=PREWARM_TIMEOUT_SECONDS)
+            logger.debug("Prewarmed OAuth token and connection to: %s", YAHOO_FANTASY_API_BASE_URL)
+        except Exception as e:
+            logger.debug("Unable to prewarm OAuth token and connection: %s", e)
+        finally:
+            prewarm_future.set_result(None)
+
+    def _wait_for_prewarm(self) -> None:
+        """Wait for the background OAuth token validation and connection prewarm if it is still in progress.
+
+        Returns:
+            None
+
+        """
+        prewarm_future = self._prewarm_future
+        if prewarm_future is not None:
+            prewarm_future.result()
+            # skip checking the prewarm future on subsequent queries
+            self._prewarm_future = None
+
+    def _configure_session(self) -> None:
+        """Configure the OAuth session to reuse pooled keep-alive connections and request compressed responses.
+
+        Returns:
+            None
+
+        """
+        # disable adapter level retries since failed requests are retried by get_response
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+        self.oauth.session.mount("https://", adapter)
+        self.oauth.session.mount("http://", adapter)
+        # advertise brotli/zstandard in addition to gzip/deflate when their optional decoders are installed
+        self.oauth.session.headers.update({"Accept-Encoding": DEFAULT_ACCEPT_ENCODING})
+
+    def _is_access_token_expiring(self) -> bool:
+        """Check if the OAuth access token is about to expire without logging on every request like
+        OAuth2.token_is_valid does.
+
+        Returns:
+            bool: Boolean representing if the access token is older than ACCESS_TOKEN_REFRESH_AGE_SECONDS.
+
+        """
+        token_time = getattr(self.oauth, "token_time", None)
+        return token_time is not None and time.time() - token_time > ACCESS_TOKEN_REFRESH_AGE_SECONDS
+
+    def _refresh_access_token(self, stale_access_token: str = None) -> None:
+        """Refresh the Yahoo access token and apply it to the existing OAuth session.
+
+        Args:
+            stale_access_token (str, optional): Access token that was rejected by the Yahoo Fantasy Sports REST API.
+
+        Returns:
+            None
+
+        """
+        # only one thread refreshes the token of an OAuth object shared between query objects
+        with _OAUTH_POOL_LOCK:
+            if self.oauth.access_token != stale_access_token and self.oauth.token_is_valid():
+                logger.debug("Access token was already refreshed.")
+            else:
+                logger.debug("Refreshing access token.")
+                self.oauth.refresh_access_token()
+            # reuse the existing session (and its pooled connections) instead of creating a new one
+            self.oauth.session.access_token = self.oauth.access_token
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
+
+    def cleanup(self) -> None:
+        """Cleanup temporary files and directories, close the disk query cache (if one exists), and cancel any pending
+        request retries and prefetches. The query can still be used after it is cleaned up."""
+        # interrupt pending retry waits, and replace the event so that retries of later requests are not cancelled
+        cancel_event, self._cancel_event = self._cancel_event, threading.Event()
+        cancel_event.set()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+        self._query_cache.close()
+
+        # Close and remove the temporary directory
+        if self._temp_dir:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    def clear_cache(self) -> None:
+        """Remove all cached query results (from memory and disk) so that subsequent queries retrieve fresh data.
+
+        Returns:
+            None
+
+        """
+        self._query_cache.clear()
+
+    def _get_retry_delay(self, response: Response, attempt: int, deadline: float = None) -> Optional[float]:
+        """Calculate how long to wait before retrying a failed request.
+
+        Honors the Retry-After header (up to RETRY_AFTER_MAX_SECONDS) when Yahoo provides one, otherwise uses capped
+        exponential backoff with full jitter so that concurrent clients sharing a rate limit do not retry in lockstep.
+
+        Args:
+            response (Response): Failed API response from Yahoo Fantasy Sports API request.
+            attempt (int): Zero-based index of the failed request attempt.
+            deadline (float, optional): Monotonic clock time (see time.monotonic) by which the request must be done.
+
+        Returns:
+            float | None: Number of seconds to wait before the next request attempt (capped at the time remaining until
+            the deadline), or None if the deadline has already passed.
+
+        """
+        delay = self._get_backoff_delay(response, attempt)
+        if deadline is not None:
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
+                return None
+            delay = min(delay, remaining_seconds)
+        return delay
+
+    def _get_backoff_delay(self, response: Response, attempt: int) -> float:
+        """Calculate the backoff delay before retrying a failed request, without regard to any deadline.
+
+        Args:
+            response (Response): Failed API response from Yahoo Fantasy Sports API request.
+            attempt (int): Zero-based index of the failed request attempt.
+
+        Returns:
+            float: Number of seconds to wait before the next request attempt.
+
+        """
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except (TypeError, ValueError):
+            # Retry-After can also be an HTTP date, in which case fall back to exponential backoff
+            retry_after = 0
+
+        if retry_after > 0:
+            return min(retry_after, RETRY_AFTER_MAX_SECONDS)
+
+        # jitter does not require cryptographic randomness
+        return min(
+            RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * (2 ** (self._backoff + attempt))
+        ) * random.random()  # nosec B311
+
+    def get_response(self, url: str, deadline: float = None) -> Response:
+        """Retrieve Yahoo Fantasy Sports data from the REST API.
+
+        Failed requests are retried up to the configured number of retries using exponential backoff with full jitter,
+        unless the deadline passes or pending retries are cancelled by :func:`cleanup` first.
+
+        Args:
+            url (str): REST API request URL string.
+            deadline (float, optional): Monotonic clock time (see time.monotonic) after which failed requests are no
+                longer retried.
+
+        Returns:
+            Response: API response from Yahoo Fantasy Sports API request.
+
+        """
+        response, _ = self._get_response_data(url, deadline)
+        return response
+
+    def _get_response_data(self, url: str, deadline: float = None,
+                           request_headers: Dict[str, str] = None) -> Tuple[Response, Dict[str, Any]]:
+        """Retrieve Yahoo Fantasy Sports data from the REST API along with its decoded JSON content.
+
+        Returning the decoded JSON alongside the response allows callers to avoid decoding the response body twice.
+        Concurrent requests for the same URL (from multiple threads) share a single in-flight request.
+
+        Args:
+            url (str): REST API request URL string.
+            deadline (float, optional): Monotonic clock time (see time.monotonic) after which failed requests are no
+                longer retried (or waited for when another caller is already requesting the same URL).
+            request_headers (dict[str, str], optional): Additional request headers (such as conditional request
+                headers), where only requests to the same URL with the same headers share a single in-flight request.
+
+        Returns:
+            tuple(Response, dict[str, Any]): API response from Yahoo Fantasy Sports API request and its decoded JSON
+            (empty for 304 Not Modified responses to conditional requests).
+
+        """
+        inflight_key = (url, tuple(sorted(request_headers.items()))) if request_headers else url
+        with self._inflight_lock:
+            inflight_future = self._inflight.get(inflight_key)
+            is_leader = inflight_future is None
+            if is_leader:
+                inflight_future = Future()
+                self._inflight[inflight_key] = inflight_future
+
+        if not is_leader:
+            logger.debug("Waiting for in-flight request to URL: %s", url)
+            try:
+                return inflight_future.result(
+                    timeout=max(deadline - time.monotonic(), 0) if deadline is not None else None
+                )
+            except FutureTimeoutError:
+                raise YahooFantasySportsException(
+                    "Deadline expired while waiting for an in-flight request to the same URL.", url=url
+                ) from None
+
+        try:
+            response_data = self._request_response_data(url, deadline, request_headers)
+            inflight_future.set_result(response_data)
+            return response_data
+        except BaseException as e:
+            inflight_future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(inflight_key, None)
+
+    def _request_response_data(self, url: str, deadline: float = None,
+                               request_headers: Dict[str, str] = None) -> Tuple[Response, Dict[str, Any]]:
+        """Request Yahoo Fantasy Sports data from the REST API and decode its JSON content, retrying failed requests.
+
+        Args:
+            url (str): REST API request URL string.
+            deadline (float, optional): Monotonic clock time (see time.monotonic) after which failed requests are no
+                longer retried.
+            request_headers (dict[str, str], optional): Additional request headers (such as conditional request
+                headers).
+
+        Returns:
+            tuple(Response, dict[str, Any]): API response from Yahoo Fantasy Sports API request and its decoded JSON
+            (empty for 304 Not Modified responses to conditional requests).
+
+        """
+        self._wait_for_prewarm()
+        if self._is_access_token_expiring():
+            self._refresh_access_token(self.oauth.access_token)
+
+        response = None
+        response_json = {}
+        for attempt in range(self._retries + 1):
+            logger.debug("Making request to URL: %s", url)
+            access_token = getattr(self.oauth, "access_token", None)
+            response: Response = self.oauth.session.get(url, params={"format": "json"}, headers=request_headers)
+
+            status_code = response.status_code
+            # when you exceed Yahoo's allowed data request limits, they throw a request status code of 999
+            if status_code == 999:
+                raise HTTPError("Yahoo data unavailable due to rate limiting. Please try again later.")
+
+            if status_code == 401 and attempt < self._retries:
+                self._refresh_access_token(access_token)
+                continue
+
+            # previously retrieved data has not changed, so there is no response body to decode
+            if status_code == 304:
+                self._record_executed_query(response.url, status_code, response.elapsed.total_seconds())
+                return response, {}
+
+            try:
+                response_json = {}
+                # skip decoding error responses that cannot contain a Yahoo error description (HTML error pages, etc.)
+                if not self._has_decodable_body(status_code, response.headers.get("Content-Type")):
+                    response.raise_for_status()
+
+                logger.debug("Response content encoding: %s", response.headers.get("Content-Encoding", "identity"))
+                try:
+                    response_json = load_json(response.content)
+                    logger.debug("Response (JSON): %s", response_json)
+                except ValueError:
+                    response.raise_for_status()
+
+                self._check_response_error(status_code, response_json, response.url)
+                response.raise_for_status()
+                break
+
+            except HTTPError as e:
+                remaining_retries = self._retries - attempt
+                delay = self._get_retry_delay(response, attempt, deadline) if remaining_retries > 0 else None
+                if delay is not None:
+                    # retry with exponential back-off and full jitter
+                    logger.warning(f"Request for URL {url} failed with status code {response.status_code}. "
+                                   f"Retrying {remaining_retries} more time{'s' if remaining_retries > 1 else ''} "
+                                   f"in {delay:.2f} seconds...")
+                    self._wait_to_retry(delay)
+                else:
+                    # log error and terminate query if status code is not 200 after all retries
+                    logger.error(f"Request failed with status code: {response.status_code} - {e}")
+                    raise
+
+        self._check_fantasy_content(response_json, response.url)
+
+        self._record_executed_query(response.url, response.status_code, response.elapsed.total_seconds())
+
+        return response, response_json
+
+    def _wait_to_retry(self, delay: float) -> None:
+        """Wait before retrying a failed request, unless pending retries are cancelled by :func:`cleanup`.
+
+        Unlike time.sleep, the wait is interrupted as soon as :func:`cleanup` is called from another thread.
+
+        Args:
+            delay (float): Number of seconds to wait before the next request attempt.
+
+        Returns:
+            None
+
+        """
+        if self._cancel_event.wait(delay):
+            raise YahooFantasySportsException("Request retries were cancelled because the query was cleaned up.")
+
+    def _record_executed_query(self, url: str, status_code: int, elapsed_seconds: float) -> None:
+        """Record a summary of an executed query (the response itself is not kept, so its content can be released).
+
+        Args:
+            url (str): URL of the API response.
+            status_code (int): HTTP status code of the API response.
+            elapsed_seconds (float): Time in seconds between sending the request and receiving the response.
+
+        Returns:
+            None
+
+        """
+        self.executed_queries.append({
+            "url": url,
+            "response_status_code": status_code,
+            "elapsed_ms": elapsed_seconds * 1000
+        })
+
+    @staticmethod
+    def _has_decodable_body(status_code: int, content_type: Optional[str]) -> bool:
+        """Check if the body of a Yahoo Fantasy Sports API response is worth decoding as JSON.
+
+        Successful responses are always decoded, while failed responses are only decoded when they are JSON that might
+        contain a Yahoo error description (rate limited and unavailable responses are never decoded, so they can go
+        straight to being retried).
+
+        Args:
+            status_code (int): HTTP status code of the API response.
+            content_type (str | None): Content-Type header of the API response.
+
+        Returns:
+            bool: True if the response body should be decoded as JSON, else False.
+
+        """
+        if 200 <= status_code < 300:
+            return True
+        elif status_code in (429, 503):
+            return False
+        else:
+            return bool(content_type) and content_type.lower().startswith("application/json")
+
+    @staticmethod
+    def _check_response_error(status_code: int, response_json: Dict[str, Any], response_url: str) -> None:
+        """Raise an exception if a failed Yahoo Fantasy Sports API request returned an error description.
+
+        Args:
+            status_code (int): HTTP status code of the API response.
+            response_json (dict[str, Any]): Decoded JSON content of the API response.
+            response_url (str): URL of the API response.
+
+        Returns:
+            None
+
+        """
+        if (status_code // 100) != 2:
+            # handle if the yahoo query returns an error
+            if response_json.get("error"):
+                response_error_msg = response_json.get("error").get("description")
+                error_msg = f"Attempt to retrieve data at URL {response_url} failed with error: " \
+                            f"\"{response_error_msg}\""
+                logger.error(error_msg)
+                raise YahooFantasySportsDataNotFound(error_msg, url=response_url)
+
+    def _check_fantasy_content(self, response_json: Dict[str, Any], response_url: str) -> None:
+        """Raise an exception if a Yahoo Fantasy Sports API response does not contain any fantasy content data.
+
+        Args:
+            response_json (dict[str, Any]): Decoded JSON content of the API response.
+            response_url (str): URL of the API response.
+
+        Returns:
+            None
+
+        """
+        raw_response_data = response_json.get(self.fantasy_content_data_field)
+
+        # extract data from "fantasy_content" field if it exists
+        if raw_response_data:
+            logger.debug("Data fetched with query URL: %s", response_url)
+            logger.debug(
+                "Response (Yahoo fantasy data extracted from: \"%s\"): %s",
+                self.fantasy_content_data_field, raw_response_data
+            )
+        else:
+            error_msg = f"No data found at URL {response_url} when attempting extraction from field: " \
+                        f"\"{self.fantasy_content_data_field}\""
+            logger.error(error_msg)
+            raise YahooFantasySportsDataNotFound(error_msg, url=response_url)
+
+    @staticmethod
+    def _get_data_key_path(data_key_list: Union[List[str], List[List[str]]]) -> Tuple:
+        """Convert a list of data keys to a hashable data key path.
+
+        Args:
+            data_key_list (list[str] | list[list[str]] | tuple): List (or tuple) of keys used to extract the specific
+                data desired by the given query.
+
+        Returns:
+            tuple: Hashable data key path with nested lists of keys converted to tuples.
+
+        """
+        if isinstance(data_key_list, tuple):
+            # tuples of hashable data keys (such as the data key path constants) are already data key paths, and hashing
+            # them rejects any nested lists of keys faster than scanning the keys one at a time
+            try:
+                hash(data_key_list)
+                return data_key_list
+            except TypeError:
+                pass
+        return tuple(tuple(key) if isinstance(key, list) else key for key in data_key_list)
+
+    def _get_query_cache_key(self, url: str, data_key_list: Union[List[str], List[List[str]]],
+                             data_type_class: Type = None) -> Tuple:
+        """Build a hashable cache key identifying the parsed data returned by a query.
+
+        Args:
+            url (str): REST API request URL string.
+            data_key_list (list[str] | list[list[str]] | tuple): List (or tuple) of keys used to extract the specific
+                data desired by the given query.
+            data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
+                data).
+
+        Returns:
+            tuple: Hashable cache key for the query.
+
+        """
+        return url, self._get_data_key_path(data_key_list), data_type_class
+
+    def _cache_query_data(self, cache_key: Tuple, query_data: Any, cache_ttl: float = None,
+                          validators: Tuple[Optional[str], Optional[str]] = None) -> None:
+        """Store parsed query data in the query cache, evicting the least recently used entry when full.
+
+        Expiring query data is also stored alongside the response validators (ETag and Last-Modified headers), if
+        Yahoo returned any, so that it can be revalidated with a conditional request once it expires.
+
+        Query data of the logged-in user (use_login queries) is only cached in memory, since its URLs are the same for
+        every user and a disk cache directory can be shared by multiple Yahoo accounts.
+
+        Args:
+            cache_key (tuple): Hashable cache key for the query.
+            query_data (Any): Parsed query data to be cached.
+            cache_ttl (float, optional): Number of seconds until the cached data expires (never expires when not
+                provided).
+            validators (tuple(str | None, str | None), optional): ETag and Last-Modified headers of the API response.
+
+        Returns:
+            None
+
+        """
+        persist = "use_login=1" not in cache_key[0]
+        self._query_cache.set(cache_key, query_data, cache_ttl, persist=persist)
+        if cache_ttl is not None and validators and any(validators):
+            self._query_cache.set(("revalidation",) + cache_key, (validators, query_data), persist=persist)
+
+    @staticmethod
+    def _get_response_validators(response: Response) -> Tuple[Optional[str], Optional[str]]:
+        """Get the validators of an API response used to make conditional requests for the same data.
+
+        Args:
+            response (Response): API response from Yahoo Fantasy Sports API request.
+
+        Returns:
+            tuple(str | None, str | None): ETag and Last-Modified headers of the API response.
+
+        """
+        return response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    @staticmethod
+    def _get_conditional_request_headers(validators: Tuple[Optional[str], Optional[str]]) -> Dict[str, str]:
+        """Build conditional request headers from the validators of a previous API response.
+
+        Args:
+            validators (tuple(str | None, str | None)): ETag and Last-Modified headers of a previous API response.
+
+        Returns:
+            dict[str, str]: If-None-Match and/or If-Modified-Since request headers.
+
+        """
+        etag, last_modified = validators
+        request_headers = {}
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+        return request_headers
+
+    def _get_league_cache_ttl(self) -> Optional[float]:
+        """Get how long cached league data remains valid.
+
+        Data for finished leagues does not change, so it never expires, while data for leagues in progress expires after
+        the configured cache TTL.
+
+        Returns:
+            float | None: Number of seconds until cached league data expires, or None if it never expires.
+
+        """
+        self._reset_changed_league_status()
+        return None if self._league_finished else self._cache_ttl
+
+    def _get_draft_results_cache_ttl(self) -> Optional[float]:
+        """Get how long cached league draft results remain valid.
+
+        Draft results do not change once the league draft is finished, so they never expire (and are reused across
+        processes by the disk query cache), while draft results of drafts that are not finished expire after the
+        configured cache TTL. Drafts are only known to be finished once the draft status has been retrieved with the
+        league metadata.
+
+        Returns:
+            float | None: Number of seconds until cached draft results expire, or None if they never expire.
+
+        """
+        self._reset_changed_league_status()
+        return None if self._league_draft_finished else self._get_league_cache_ttl()
+
+    def _get_week_cache_ttl(self, chosen_week: Union[int, str]) -> Optional[float]:
+        """Get how long cached league data for a week remains valid.
+
+        Data for weeks that were completed before the previous week (so stat corrections have been applied) does not
+        change, so it never expires, while data for the current and previous weeks expires after the configured cache
+        TTL. Weeks are only known to be completed once the current week has been retrieved with the league metadata.
+
+        Args:
+            chosen_week (int | str): Selected week of the league data.
+
+        Returns:
+            float | None: Number of seconds until cached league data for the week expires, or None if it never expires.
+
+        """
+        self._reset_changed_league_status()
+        if self._league_finished:
+            return None
+        current_week = self._league_current_week
+        if current_week is not None and str(chosen_week).isdigit() and int(chosen_week) < current_week - 1:
+            return None
+        return self._cache_ttl
+
+    def _update_league_status(self, league: League) -> None:
+        """Record whether the league (and its draft) has finished, its current week, and its number of teams (from any
+        retrieved league data that includes the league metadata).
+
+        Args:
+            league (League): YFPY League instance.
+
+        Returns:
+            None
+
+        """
+        if isinstance(league, League):
+            self._reset_changed_league_status()
+            if league.is_finished:
+                self._league_finished = True
+            if league.draft_status == "postdraft":
+                self._league_draft_finished = True
+            if league.current_week is not None:
+                self._league_current_week = int(league.current_week)
+            if league.num_teams:
+                self._league_num_teams = int(league.num_teams)
+
+    def _reset_changed_league_status(self) -> None:
+        """Forget the recorded league status (see :func:`_update_league_status`) when a different league has been
+        selected (by changing the league key, game ID, or league ID) since it was recorded, so that the cached data of
+        a league in progress is not kept as if it were the previously selected (finished) league.
+
+        Returns:
+            None
+
+        """
+        league_selection = (self.league_key, self.game_id, self.league_id)
+        if league_selection != self._league_status_selection:
+            self._league_finished = False
+            self._league_draft_finished = False
+            self._league_current_week = None
+            self._league_num_teams = None
+            self._league_status_selection = league_selection
+
+    def _prefetch(self, query_function: Callable[..., Any], *args: Any) -> None:
+        """Run a likely next query in the background so that its results are cached before they are requested (when
+        prefetching is enabled).
+
+        Failed prefetches are only logged, since the query is run again (and fails normally) if it is requested.
+
+        Args:
+            query_function (Callable): Function running the query and caching its results.
+            *args: Arguments passed to the query function.
+
+        Returns:
+            None
+
+        """
+        prefetch_executor = self._prefetch_executor
+        if prefetch_executor is None:
+            return
+
+        def prefetch() -> None:
+            try:
+                query_function(*args)
+            except Exception as e:
+                logger.debug("Unable to prefetch query: %s", e)
+
+        try:
+            prefetch_executor.submit(prefetch)
+        except RuntimeError:
+            # the prefetch executor was shut down by cleanup()
+            pass
+
+    # noinspection GrazieInspection
+    def query(self, url: str, data_key_list: Union[List[str], List[List[str]]], data_type_class: Type = None,
+              sort_function: Callable = None, cache: bool = False, lazy: bool = False, raw: bool = False,
+              cache_ttl: float = None) -> (Union[str, YFO, List[YFO], Dict[str, YFO], LazyYahooObject, Any]):
+        """Base query class to retrieve requested data from the Yahoo fantasy sports REST API.
+
+        Args:
+            url (str): REST API request URL string.
+            data_key_list (list[str] | list[list[str]] | tuple): List of keys used to extract the specific data
+                desired by the given query (supports strings and lists of strings). Supports lists containing only key
+                strings such as ["game", "stat_categories"], and also supports lists containing key strings followed by
+                lists of key strings such as ["team", ["team_points", "team_projected_points"]]. Constant data key
+                paths can be passed as tuples of keys so they are not converted on every query.
+            data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
+                data).
+            sort_function (Callable of sort function, optional)): Optional lambda function to return sorted query
+                results.
+            cache (bool, optional): Boolean to reuse previously parsed results for the same query instead of
+                requesting them again (until they expire after cache_ttl seconds).
+            lazy (bool, optional): Boolean to return a LazyYahooObject that only parses the data content that is
+                accessed instead of unpacking all retrieved data up front (intended for call sites that only read a
+                few fields, and never serialized to a JSON string).
+            raw (bool, optional): Boolean to return the raw JSON data extracted at the data key path without unpacking
+                or parsing it (intended for call sites that only read a single value, and never serialized to a JSON
+                string).
+            cache_ttl (float, optional): Number of seconds until cached results expire (cached results never expire
+                when not provided, so only omit it for data that does not change, such as historical game data).
+                Expired results are revalidated with a conditional request (If-None-Match/If-Modified-Since) when Yahoo
+                returned an ETag or Last-Modified header for them, and reused without being parsed again if unchanged.
+                Expired results are also returned (instead of raising an error) when Yahoo is unreachable, or keeps
+                responding with 5xx status codes after all retries.
+
+        Returns:
+            object: Model class instance from yfpy/models.py, dictionary, or list (depending on query), with unpacked
+            and parsed response data.
+
+        """
+        if not self.offline or self._fetch_function is not None:
+            cache_key = None
+            revalidation_entry = None
+            request_headers = None
+            if cache:
+                result_type = self._get_result_type(data_type_class, lazy, raw)
+                cache_key = self._get_query_cache_key(url, data_key_list, result_type)
+                cached_query_data = self._get_cached_query_data(cache_key, lazy or raw)
+                if cached_query_data is not None:
+                    return cached_query_data
+
+            if self._fetch_function is not None:
+                return self._parse_query_data(
+                    url, self._load_response_data(self._fetch_function(url), url), data_key_list, data_type_class,
+                    sort_function, cache_key, lazy, raw, cache_ttl
+                )
+
+            if cache:
+                if cache_ttl is not None:
+                    revalidation_entry = self._query_cache.get(("revalidation",) + cache_key)
+                    if revalidation_entry is not None:
+                        request_headers = self._get_conditional_request_headers(revalidation_entry[0])
+
+            try:
+                response, response_json = self._get_response_data(url, request_headers=request_headers)
+            except (HTTPError, RequestsConnectionError, Timeout) as e:
+                return self._get_stale_query_data(cache_key, e, lazy or raw)
+
+            if response.status_code == 304 and revalidation_entry is not None:
+                logger.debug("Revalidated cached data for query URL: %s", url)
+                validators, query_data = revalidation_entry
+                self._cache_query_data(cache_key, query_data, cache_ttl, validators)
+                return jsonify_data(query_data) if self.all_output_as_json_str and not (lazy or raw) else query_data
+
+            return self._parse_query_data(
+                response.url, response_json, data_key_list, data_type_class, sort_function, cache_key, lazy, raw,
+                cache_ttl, self._get_response_validators(response) if cache_key else None
+            )
+
+        else:
+            logger.error("Cannot run Yahoo query while using offline mode! Please try again with offline=False.")
+
+    def parse_response(self, response_content: Union[bytes, str, Dict[str, Any]],
+                       data_key_list: Union[List[str], List[List[str]]], data_type_class: Type = None,
+                       sort_function: Callable = None, url: str = None
+                       ) -> (Union[str, YFO, List[YFO], Dict[str, YFO], Any]):
+        """Parse the content of a previously captured Yahoo fantasy sports REST API response without making a request.
+
+        Parsing is independent of authentication and HTTP, so it also works with offline=True, and can be run for
+        archived responses in worker processes.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> from yfpy.models import League
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######", offline=True)
+            >>> query.parse_response(Path("/path/to/captured/league_metadata.json").read_bytes(), ["league"], League)
+            League({...})
+
+        Args:
+            response_content (bytes | str | dict[str, Any]): Captured JSON content of the API response (or its decoded
+                JSON data).
+            data_key_list (list[str] | list[list[str]] | tuple): List of keys used to extract the specific data
+                desired by the given query (see :func:`query`).
+            data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
+                data).
+            sort_function (Callable of sort function, optional)): Optional lambda function to return sorted query
+                results.
+            url (str, optional): REST API request URL string of the captured response (only used for logging and error
+                messages).
+
+        Returns:
+            object: Model class instance from yfpy/models.py, dictionary, or list (depending on query), with unpacked
+            and parsed response data.
+
+        """
+        return self._parse_query_data(
+            url, self._load_response_data(response_content, url), data_key_list, data_type_class, sort_function
+        )
+
+    def _load_response_data(self, response_content: Union[bytes, str, Dict[str, Any]],
+                            url: str = None) -> Dict[str, Any]:
+        """Decode the content of a captured Yahoo Fantasy Sports API response and check that it contains fantasy data.
+
+        Args:
+            response_content (bytes | str | dict[str, Any]): Captured JSON content of the API response (or its decoded
+                JSON data).
+            url (str, optional): REST API request URL string of the captured response.
+
+        Returns:
+            dict[str, Any]: Decoded JSON content of the API response.
+
+        """
+        response_json = response_content if isinstance(response_content, dict) else load_json(response_content)
+        self._check_fantasy_content(response_json, url)
+        return response_json
+
+    def query_stream(self, url: str, json_path: str, key_value_pairs: bool = False) -> Iterator[Any]:
+        """Stream the JSON data items at a JSON path from the Yahoo fantasy sports REST API without loading the whole
+        response into memory.
+
+        Intended for large responses (such as all players in a league) where only part of each item is needed. Items
+        are returned as raw JSON data (not unpacked or parsed into YFPY models), and are yielded as the response body is
+        downloaded.
+
+        Note:
+            Requires the optional ijson dependency (pip install ijson).
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> for key, player in query.query_stream(
+            ...     "https://fantasysports.yahooapis.com/fantasy/v2/league/406.l.413954/players",
+            ...     "fantasy_content.league.item.players",
+            ...     key_value_pairs=True
+            ... ):
+            ...     print(player)
+
+        Args:
+            url (str): REST API request URL string.
+            json_path (str): ijson prefix of the items to be streamed, such as "fantasy_content.league.item.players"
+                (see the ijson documentation for the prefix syntax).
+            key_value_pairs (bool, optional): Boolean to stream the (key, value) pairs of the JSON object at the JSON
+                path instead of the items found at it (Yahoo returns collections as objects with keys "0" to "n").
+
+        Returns:
+            Iterator[Any]: Iterator of raw JSON data items (or key/value pairs) found at the JSON path.
+
+        """
+        if ijson is None:
+            raise YahooFantasySportsException(
+                "YahooFantasySportsQuery.query_stream requires the ijson package. Please install it with: "
+                "pip install ijson"
+            )
+
+        if self.offline:
+            logger.error("Cannot run Yahoo query while using offline mode! Please try again with offline=False.")
+            return
+
+        with self._get_stream_response(url) as response:
+            if key_value_pairs:
+                yield from ijson.kvitems(response.raw, json_path)
+            else:
+                yield from ijson.items(response.raw, json_path)
+
+    def _get_stream_response(self, url: str) -> Response:
+        """Request Yahoo Fantasy Sports data from the REST API without downloading the response body, retrying failed
+        requests.
+
+        Args:
+            url (str): REST API request URL string.
+
+        Returns:
+            Response: Successful streaming API response (which must be closed by the caller) with a raw body that is
+            decompressed as it is read.
 
-    def cleanup(self) -> None:
-        """Cleanup temporary files and directories."""
-        # Close and remove the temporary directory
-        self._temp_dir.cleanup()
+        """
+        self._wait_for_prewarm()
+        if self._is_access_token_expiring():
+            self._refresh_access_token(self.oauth.access_token)
 
-    def get_response(self, url: str) -> Response:
-        """Retrieve Yahoo Fantasy Sports data from the REST API.
+        for attempt in range(self._retries + 1):
+            logger.debug("Making streaming request to URL: %s", url)
+            access_token = getattr(self.oauth, "access_token", None)
+            response: Response = self.oauth.session.get(url, params={"format": "json"}, stream=True)
+
+            status_code = response.status_code
+            if status_code == 999:
+                response.close()
+                raise HTTPError("Yahoo data unavailable due to rate limiting. Please try again later.")
+
+            if status_code == 401 and attempt < self._retries:
+                response.close()
+                self._refresh_access_token(access_token)
+                continue
+
+            try:
+                response.raise_for_status()
+            except HTTPError as e:
+                response.close()
+                remaining_retries = self._retries - attempt
+                if remaining_retries > 0:
+                    # retry with exponential back-off and full jitter
+                    delay = self._get_retry_delay(response, attempt)
+                    logger.warning(f"Request for URL {url} failed with status code {status_code}. "
+                                   f"Retrying {remaining_retries} more time{'s' if remaining_retries > 1 else ''} "
+                                   f"in {delay:.2f} seconds...")
+                    self._wait_to_retry(delay)
+                    continue
+                else:
+                    logger.error(f"Request failed with status code: {status_code} - {e}")
+                    raise
+
+            self._record_executed_query(response.url, status_code, response.elapsed.total_seconds())
+
+            # decompress the raw response stream when Yahoo returns gzipped content
+            response.raw.decode_content = True
+            return response
+
+    def _query_collection(self, url: str, data_key_list: Union[List[str], List[List[str]]], json_path: str,
+                          cache: bool = False, cache_ttl: float = None) -> List[YFO]:
+        """Retrieve a collection (such as the players of a team roster) from the Yahoo fantasy sports REST API, parsing
+        its items incrementally while the response is downloaded when the response is large and ijson is installed.
+
+        Unlike :func:`query`, the whole response is never decoded at once, so the raw response and the parsed items are
+        not held in memory at the same time. Responses smaller than STREAMING_MIN_CONTENT_LENGTH (where streaming costs
+        more than it saves) are decoded all at once instead, as are all responses when ijson only has its pure Python
+        backend available (which is an order of magnitude slower than decoding the whole response with load_json).
 
         Args:
             url (str): REST API request URL string.
+            data_key_list (list[str] | list[list[str]] | tuple): List (or tuple) of keys used to extract the collection
+                when it is not streamed.
+            json_path (str): ijson prefix of the JSON object containing the collection items, such as
+                "fantasy_content.team.item.roster.0.players".
+            cache (bool, optional): Boolean to reuse previously parsed results for the same query instead of
+                requesting them again (until they expire after cache_ttl seconds).
+            cache_ttl (float, optional): Number of seconds until cached results expire (never expire when not
+                provided).
 
         Returns:
-            Response: API response from Yahoo Fantasy Sports API request.
+            list[YahooFantasyObject]: List of YFPY model instances in the collection.
 
         """
-        logger.debug(f"Making request to URL: {url}")
-        response: Response = self.oauth.session.get(url, params={"format": "json"})
+        if (ijson is None or ijson.backend == "python" or self.offline or self.all_output_as_json_str
+                or self._fetch_function is not None):
+            return self.query(url, data_key_list, cache=cache, cache_ttl=cache_ttl)
 
-        status_code = response.status_code
-        # when you exceed Yahoo's allowed data request limits, they throw a request status code of 999
-        if status_code == 999:
-            raise HTTPError("Yahoo data unavailable due to rate limiting. Please try again later.")
-
-        if status_code == 401:
-            self._authenticate()
+        cache_key = None
+        if cache:
+            cache_key = self._get_query_cache_key(url, data_key_list)
+            cached_query_data = self._get_cached_query_data(cache_key)
+            if cached_query_data is not None:
+                return cached_query_data
 
-        response_json = {}
         try:
-            response_json = response.json()
-            logger.debug(f"Response (JSON): {response_json}")
-        except json.JSONDecodeError:
-            response.raise_for_status()
+            stream_response = self._get_stream_response(url)
+        except (HTTPError, RequestsConnectionError, Timeout) as e:
+            return self._get_stale_query_data(cache_key, e)
+
+        with stream_response as response:
+            content_length = response.headers.get("Content-Length")
+            if content_length is not None and int(content_length) < STREAMING_MIN_CONTENT_LENGTH:
+                return self._parse_query_data(
+                    response.url, self._load_response_data(response.content, response.url), data_key_list,
+                    cache_key=cache_key, cache_ttl=cache_ttl
+                )
 
-        try:
-            if (status_code // 100) != 2:
-                # handle if the yahoo query returns an error
-                if response_json.get("error"):
-                    response_error_msg = response_json.get("error").get("description")
-                    error_msg = f"Attempt to retrieve data at URL {response.url} failed with error: " \
-                                f"\"{response_error_msg}\""
-                    logger.error(error_msg)
-                    raise YahooFantasySportsDataNotFound(error_msg, url=response.url)
-
-            response.raise_for_status()
-
-        except HTTPError as e:
-            # retry with incremental back-off
-            if self._retries > 0:
-                self._retries -= 1
-                self._backoff += 1
-                logger.warning(f"Request for URL {url} failed with status code {response.status_code}. "
-                               f"Retrying {self._retries} more time{'s' if self._retries > 1 else ''}...")
-                time.sleep(0.3 * self._backoff)
-                response = self.get_response(url)
-            else:
-                # log error and terminate query if status code is not 200 after 3 retries
-                logger.error(f"Request failed with status code: {response.status_code} - {e}")
-                response.raise_for_status()
+            # Yahoo returns collections as objects with item keys "0" to "n" and a "count" key
+            collection_item_key = data_key_list[-1][:-1]
+            query_data = [
+                unpack_data(item, YahooFantasyObject)[collection_item_key]
+                for key, item in ijson.kvitems(response.raw, json_path, use_float=True) if key != "count"
+            ]
 
-        raw_response_data = response_json.get(self.fantasy_content_data_field)
+        if not query_data:
+            error_msg = f"No data found when attempting extraction from fields: {data_key_list}"
+            logger.error(error_msg)
+            raise YahooFantasySportsDataNotFound(error_msg, payload=data_key_list, url=url)
 
-        # extract data from "fantasy_content" field if it exists
-        if raw_response_data:
-            logger.debug(f"Data fetched with query URL: {response.url}")
-            logger.debug(
-                f"Response (Yahoo fantasy data extracted from: "
-                f"\"{self.fantasy_content_data_field}\"): {raw_response_data}"
-            )
+        if cache_key:
+            self._cache_query_data(cache_key, query_data, cache_ttl)
+
+        return query_data
+
+    @staticmethod
+    def _get_result_type(data_type_class: Type = None, lazy: bool = False, raw: bool = False) -> Optional[Type]:
+        """Get the type of result returned by a query, so that lazy and raw results are cached separately from fully
+        parsed results for the same query.
+
+        Args:
+            data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
+                data).
+            lazy (bool, optional): Boolean representing if the query returns a LazyYahooObject.
+            raw (bool, optional): Boolean representing if the query returns raw JSON data.
+
+        Returns:
+            Type: Type of result returned by the query.
+
+        """
+        if raw:
+            return dict
+        elif lazy:
+            return LazyYahooObject
         else:
-            error_msg = f"No data found at URL {response.url} when attempting extraction from field: " \
-                        f"\"{self.fantasy_content_data_field}\""
-            logger.error(error_msg)
-            raise YahooFantasySportsDataNotFound(error_msg, url=response.url)
+            return data_type_class
 
-        return response
+    def _get_cached_query_data(self, cache_key: Tuple, unparsed: bool = False) -> Any:
+        """Retrieve previously parsed query data from the query cache.
 
-    # noinspection GrazieInspection
-    def query(self, url: str, data_key_list: Union[List[str], List[List[str]]], data_type_class: Type = None,
-              sort_function: Callable = None) -> (Union[str, YFO, List[YFO], Dict[str, YFO]]):
-        """Base query class to retrieve requested data from the Yahoo fantasy sports REST API.
+        Args:
+            cache_key (tuple): Hashable cache key for the query.
+            unparsed (bool, optional): Boolean representing if the cached data is a LazyYahooObject or raw JSON data.
+
+        Returns:
+            object: Cached query data (serialized to a JSON string if all_output_as_json_str is True and not unparsed),
+            or None if no unexpired query data is cached for the query.
+
+        """
+        query_data = self._query_cache.get(cache_key)
+        if query_data is None:
+            return None
+
+        logger.debug("Retrieved cached data for query URL: %s", cache_key[0])
+        return jsonify_data(query_data) if self.all_output_as_json_str and not unparsed else query_data
+
+    def _get_stale_query_data(self, cache_key: Optional[Tuple], error: Exception, unparsed: bool = False) -> Any:
+        """Fall back on expired cached query data when a query fails because Yahoo is unreachable (network errors) or
+        unavailable (5xx status codes after all retries), re-raising the error otherwise.
 
         Args:
-            url (str): REST API request URL string.
-            data_key_list (list[str] | list[list[str]]): List of keys used to extract the specific data desired by the
-                given query (supports strings and lists of strings). Supports lists containing only key strings such as
-                ["game", "stat_categories"], and also supports lists containing key strings followed by lists of key
-                strings such as ["team", ["team_points", "team_projected_points"]].
+            cache_key (tuple | None): Hashable cache key for the query (None if the query is not cached).
+            error (Exception): Error raised by the failed query request.
+            unparsed (bool, optional): Boolean representing if the cached data is a LazyYahooObject or raw JSON data.
+
+        Returns:
+            object: Expired cached query data (serialized to a JSON string if all_output_as_json_str is True and not
+            unparsed).
+
+        """
+        if isinstance(error, HTTPError):
+            yahoo_unavailable = error.response is not None and error.response.status_code >= 500
+        else:
+            yahoo_unavailable = True
+
+        query_data = self._query_cache.get_stale(cache_key) if cache_key and yahoo_unavailable else None
+        if query_data is None:
+            raise error
+
+        logger.warning(f"Yahoo Fantasy Sports API request failed ({error}). Returning stale cached data for query "
+                       f"URL: {cache_key[0]}")
+        return jsonify_data(query_data) if self.all_output_as_json_str and not unparsed else query_data
+
+    def _parse_query_data(self, response_url: str, response_json: Dict[str, Any],
+                          data_key_list: Union[List[str], List[List[str]]], data_type_class: Type = None,
+                          sort_function: Callable = None, cache_key: Tuple = None,
+                          lazy: bool = False, raw: bool = False, cache_ttl: float = None,
+                          validators: Tuple[Optional[str], Optional[str]] = None
+                          ) -> (Union[str, YFO, List[YFO], Dict[str, YFO], LazyYahooObject, Any]):
+        """Extract, unpack, and parse the requested data from a decoded Yahoo Fantasy Sports API response.
+
+        Args:
+            response_url (str): URL of the API response.
+            response_json (dict[str, Any]): Decoded JSON content of the API response.
+            data_key_list (list[str] | list[list[str]] | tuple): List (or tuple) of keys used to extract the specific
+                data desired by the given query.
             data_type_class (:obj:`Type`, optional): Highest level data model type (if one exists for the retrieved
                 data).
             sort_function (Callable of sort function, optional)): Optional lambda function to return sorted query
                 results.
+            cache_key (tuple, optional): Hashable cache key used to store the parsed data in the query cache.
+            lazy (bool, optional): Boolean to return a LazyYahooObject instead of unpacking all retrieved data.
+            raw (bool, optional): Boolean to return the raw JSON data extracted at the data key path without unpacking
+                or parsing it.
+            cache_ttl (float, optional): Number of seconds until the cached data expires (never expires when not
+                provided).
+            validators (tuple(str | None, str | None), optional): ETag and Last-Modified headers of the API response,
+                cached with the parsed data so that it can be revalidated once it expires.
 
         Returns:
             object: Model class instance from yfpy/models.py, dictionary, or list (depending on query), with unpacked
             and parsed response data.
 
         """
-        if not self.offline:
-            response = self.get_response(url)
-            raw_response_data = response.json().get(self.fantasy_content_data_field)
-
-            # iterate through list of data keys and drill down to final desired data field
-            for i in range(len(data_key_list)):
-                if isinstance(raw_response_data, list):
-                    if isinstance(data_key_list[i], list):
-                        reformatted = reformat_json_list(raw_response_data)
-                        raw_response_data = [
-                            {data_key_list[i][0]: reformatted[data_key_list[i][0]]},
-                            {data_key_list[i][1]: reformatted[data_key_list[i][1]]}
-                        ]
-                    else:
-                        raw_response_data = reformat_json_list(raw_response_data)[data_key_list[i]]
-                else:
-                    if isinstance(data_key_list[i], list):
-                        raw_response_data = [
-                            {data_key_list[i][0]: raw_response_data[data_key_list[i][0]]},
-                            {data_key_list[i][1]: raw_response_data[data_key_list[i][1]]}
-                        ]
-                    else:
-                        raw_response_data = raw_response_data.get(data_key_list[i])
+        raw_response_data = response_json.get(self.fantasy_content_data_field)
 
-            if raw_response_data:
-                logger.debug(f"Response (Yahoo fantasy data extracted from: {data_key_list}): {raw_response_data}")
-            else:
-                error_msg = f"No data found when attempting extraction from fields: {data_key_list}"
-                logger.error(error_msg)
-                raise YahooFantasySportsDataNotFound(error_msg, payload=data_key_list, url=response.url)
+        # drill down through the data keys to the final desired data field using the compiled data key path
+        raw_response_data = compile_data_key_path(self._get_data_key_path(data_key_list))(raw_response_data)
 
-            # unpack, parse, and assign data types to all retrieved data content
-            unpacked = unpack_data(raw_response_data, YahooFantasyObject)
-            logger.debug(
-                f"Unpacked and parsed JSON (Yahoo fantasy data wth parent type: {data_type_class}):\n{unpacked}")
+        if raw_response_data:
+            logger.debug("Response (Yahoo fantasy data extracted from: %s): %s", data_key_list, raw_response_data)
+        else:
+            error_msg = f"No data found when attempting extraction from fields: {data_key_list}"
+            logger.error(error_msg)
+            raise YahooFantasySportsDataNotFound(error_msg, payload=data_key_list, url=response_url)
 
-            self.executed_queries.append({
-                "url": response.url,
-                "response_status_code": response.status_code,
-                "response": response
-            })
+        if raw or lazy:
+            query_data = raw_response_data if raw else LazyYahooObject(raw_response_data, YahooFantasyObject)
+            if cache_key:
+                self._cache_query_data(cache_key, query_data, cache_ttl, validators)
+            return query_data
 
-            # cast the highest level of data to type corresponding to query (if type exists)
-            query_data = data_type_class(unpacked) if data_type_class else unpacked
+        # unpack, parse, and assign data types to all retrieved data content
+        unpacked = unpack_data(raw_response_data, YahooFantasyObject)
+        logger.debug(
+            "Unpacked and parsed JSON (Yahoo fantasy data wth parent type: %s):\n%s", data_type_class, unpacked)
 
-            # sort data when applicable
-            if sort_function and not isinstance(query_data, dict):
-                query_data = sorted(query_data, key=sort_function)
+        # cast the highest level of data to type corresponding to query (if type exists)
+        query_data = data_type_class(unpacked) if data_type_class else unpacked
 
-            # flatten lists of single-key dicts of objects into lists of those objects
-            if isinstance(query_data, list):
-                last_data_key = data_key_list[-1]
-                if last_data_key.endswith("s"):
-                    query_data = [el[last_data_key[:-1]] for el in query_data]
+        # collections with a single item are unpacked to a single-key dict instead of a list of single-key dicts
+        last_data_key = data_key_list[-1]
+        if isinstance(query_data, dict) and isinstance(last_data_key, str) and last_data_key in COLLECTION_DATA_KEYS:
+            query_data = [query_data]
 
-            if self.all_output_as_json_str:
-                return jsonify_data(query_data)
+        # sort data when applicable
+        if sort_function and not isinstance(query_data, dict):
+            if isinstance(query_data, list):
+                # sort unpacked lists in place instead of copying them
+                query_data.sort(key=sort_function)
             else:
-                return query_data
+                query_data = sorted(query_data, key=sort_function)
+
+        # flatten lists of single-key dicts of objects into lists of those objects
+        if isinstance(query_data, list) and isinstance(last_data_key, str) and last_data_key.endswith("s"):
+            query_data = list(map(itemgetter(last_data_key[:-1]), query_data))
+
+        if cache_key:
+            self._cache_query_data(cache_key, query_data, cache_ttl, validators)
 
+        if self.all_output_as_json_str:
+            return jsonify_data(query_data)
         else:
-            logger.error("Cannot run Yahoo query while using offline mode! Please try again with offline=False.")
+            return query_data
 
     def get_all_yahoo_fantasy_game_keys(self) -> List[Game]:
         """Retrieve all Yahoo Fantasy Sports game keys by ID (from year of inception to present), sorted by season/year.
@@ -324,9 +1608,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/games;game_codes={self.game_code}",
-            ["games"],
-            sort_function=lambda x: x.get("game").season
+            f"{YAHOO_FANTASY_API_BASE_URL}/games;game_codes={self.game_code}",
+            ("games",),
+            sort_function=_sort_by_game_season,
+            cache=True
         )
 
     # noinspection PyUnresolvedReferences
@@ -347,20 +1632,12 @@ class YahooFantasySportsQuery(object):
             str: The game key for a Yahoo Fantasy Sports game specified by season.
 
         """
-        all_output_as_json = False
-        if self.all_output_as_json_str:
-            self.all_output_as_json_str = False
-            all_output_as_json = True
-
-        game_key = self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/games;game_codes={self.game_code};seasons={season}",
-            ["games"]
-        ).get("game").game_key
-
-        if all_output_as_json:
-            self.all_output_as_json_str = True
-
-        return game_key
+        return self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/games;game_codes={self.game_code};seasons={season}",
+            ("games", "0", "game", "game_key"),
+            cache=True,
+            raw=True
+        )
 
     def get_current_game_info(self) -> Game:
         """Retrieve game info for current fantasy season.
@@ -430,9 +1707,8 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{self.game_code};"
-            f"out=metadata,players,game_weeks,stat_categories,position_types,roster_positions",
-            ["game"],
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{self.game_code};out={GAME_INFO_SUBRESOURCES}",
+            ("game",),
             Game
         )
 
@@ -463,8 +1739,8 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{self.game_code}/metadata",
-            ["game"],
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{self.game_code}/metadata",
+            ("game",),
             Game
         )
 
@@ -539,9 +1815,8 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_id};"
-            f"out=metadata,players,game_weeks,stat_categories,position_types,roster_positions",
-            ["game"],
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id};out={GAME_INFO_SUBRESOURCES}",
+            ("game",),
             Game
         )
 
@@ -574,9 +1849,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_id}/metadata",
-            ["game"],
-            Game
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/metadata",
+            ("game",),
+            Game,
+            cache=True
         )
 
     def get_game_weeks_by_game_id(self, game_id: int) -> List[GameWeek]:
@@ -611,8 +1887,9 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_id}/game_weeks",
-            ["game", "game_weeks"]
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/game_weeks",
+            ("game", "game_weeks"),
+            cache=True
         )
 
     def get_game_stat_categories_by_game_id(self, game_id: int) -> StatCategories:
@@ -653,9 +1930,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_id}/stat_categories",
-            ["game", "stat_categories"],
-            StatCategories
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/stat_categories",
+            ("game", "stat_categories"),
+            StatCategories,
+            cache=True
         )
 
     def get_game_position_types_by_game_id(self, game_id: int) -> List[PositionType]:
@@ -686,9 +1964,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_id}/position_types",
-            ["game", "position_types"],
-            sort_function=lambda x: x.get("position_type").type
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/position_types",
+            ("game", "position_types"),
+            sort_function=_sort_by_position_type,
+            cache=True
         )
 
     def get_game_roster_positions_by_game_id(self, game_id: int) -> List[RosterPosition]:
@@ -718,9 +1997,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/game/{game_id}/roster_positions",
-            ["game", "roster_positions"],
-            sort_function=lambda x: x.get("roster_position").position
+            f"{YAHOO_FANTASY_API_BASE_URL}/game/{game_id}/roster_positions",
+            ("game", "roster_positions"),
+            sort_function=_sort_by_roster_position,
+            cache=True
         )
 
     def get_league_key(self, season: int = None) -> str:
@@ -740,17 +2020,38 @@ class YahooFantasySportsQuery(object):
             str: League key string for selected league.
 
         """
-        if not self.league_key:
+        if self.league_key:
+            return self.league_key
+
+        # memoize the league key so repeated league key lookups do not require additional queries
+        league_key_cache_key = (season, self.game_id, self.league_id)
+        league_key = self._league_key_cache.get(league_key_cache_key)
+        if not league_key:
             if season:
-                return f"{self.get_game_key_by_season(season)}.l.{self.league_id}"
+                game_key = self.get_game_key_by_season(season)
             elif self.game_id:
-                return f"{self.get_game_metadata_by_game_id(self.game_id).game_key}.l.{self.league_id}"
+                game_key = self.get_game_metadata_by_game_id(self.game_id).game_key
             else:
                 logger.warning(
                     "No game id or season/year provided, defaulting to current fantasy season.")
-                return f"{self.get_current_game_metadata().game_key}.l.{self.league_id}"
-        else:
-            return self.league_key
+                game_key = self.get_current_game_metadata().game_key
+            league_key = self._league_key_cache[league_key_cache_key] = f"{game_key}.l.{self.league_id}"
+
+        return league_key
+
+    def _get_team_key(self, team_id: Union[str, int]) -> str:
+        """Build the team key of a team in the chosen league from its team ID.
+
+        Args:
+            team_id (str | int): Selected team ID (can be integers 1 through n where n is the number of teams in the
+                league).
+
+        Returns:
+            str: Team key string for selected team.
+
+        """
+        _check_team_id(team_id)
+        return f"{self.get_league_key()}.t.{team_id}"
 
     def get_current_user(self) -> User:
         """Retrieve metadata for current logged-in user.
@@ -769,8 +2070,8 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            "https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/",
-            ["users", "0", "user"],
+            f"{YAHOO_FANTASY_API_BASE_URL}/users;use_login=1/",
+            ("users", "0", "user"),
             User
         )
 
@@ -804,9 +2105,11 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;codes={self.game_code}/",
-            ["users", "0", "user", "games"],
-            sort_function=lambda x: x.get("game").season
+            f"{YAHOO_FANTASY_API_BASE_URL}/users;use_login=1/games;codes={self.game_code}/",
+            ("users", "0", "user", "games"),
+            sort_function=_sort_by_game_season,
+            cache=True,
+            cache_ttl=self._cache_ttl
         )
 
     def get_user_leagues_by_game_key(self, game_key: Union[int, str]) -> List[League]:
@@ -859,12 +2162,13 @@ class YahooFantasySportsQuery(object):
             list[League]: List of YFPY League instances.
 
         """
-        leagues = self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;game_keys={game_key}/leagues/",
-            ["users", "0", "user", "games", "0", "game", "leagues"],
-            sort_function=lambda x: x.get("league").season
+        return self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/users;use_login=1/games;game_keys={game_key}/leagues/",
+            ("users", "0", "user", "games", "0", "game", "leagues"),
+            sort_function=_sort_by_league_season,
+            cache=True,
+            cache_ttl=self._cache_ttl
         )
-        return leagues if isinstance(leagues, list) else [leagues]
 
     def get_user_teams(self) -> List[Game]:
         """Retrieve teams for all leagues for current logged-in user for current game sorted by season/year.
@@ -937,14 +2241,19 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/users;use_login=1/games;codes={self.game_code}/teams/",
-            ["users", "0", "user", "games"],
-            sort_function=lambda x: x.get("game").season
+            f"{YAHOO_FANTASY_API_BASE_URL}/users;use_login=1/games;codes={self.game_code}/teams/",
+            ("users", "0", "user", "games"),
+            sort_function=_sort_by_game_season
         )
 
-    def get_league_info(self) -> League:
+    def get_league_info(self, sections: Iterable[str] = None) -> League:
         """Retrieve info for chosen league.
 
+        Args:
+            sections (Iterable[str], optional): League info sections to retrieve (any of "metadata", "settings",
+                "standings", "scoreboard", "teams", "players", "draftresults", and "transactions"), which defaults to
+                all of them. Only requesting the sections that are needed reduces the amount of data Yahoo returns.
+
         Examples:
             >>> from pathlib import Path
             >>> from yfpy.query import YahooFantasySportsQuery
@@ -999,12 +2308,41 @@ class YahooFantasySportsQuery(object):
             League: YFPY League instance.
 
         """
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()};"
-            f"out=metadata,settings,standings,scoreboard,teams,players,draftresults,transactions",
-            ["league"],
-            League
+        league = self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()};"
+            f"out={self._get_league_info_subresources(sections)}",
+            ("league",),
+            League,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
+        self._update_league_status(league)
+        return league
+
+    @staticmethod
+    def _get_league_info_subresources(sections: Iterable[str] = None) -> str:
+        """Build the subresources parameter used to retrieve the selected league info sections.
+
+        Args:
+            sections (Iterable[str], optional): League info sections to retrieve, which defaults to all of them.
+
+        Returns:
+            str: Comma-separated league info subresources in a consistent order (so equivalent selections of league info
+            sections share cached results).
+
+        """
+        if sections is None:
+            return LEAGUE_INFO_SUBRESOURCES
+
+        sections = set(sections)
+        league_info_subresources = LEAGUE_INFO_SUBRESOURCES.split(",")
+        invalid_sections = sections.difference(league_info_subresources)
+        if invalid_sections:
+            raise YahooFantasySportsException(
+                f"Invalid league info sections: {sorted(invalid_sections)}. Valid league info sections are: "
+                f"{league_info_subresources}."
+            )
+        return ",".join(section for section in league_info_subresources if section in sections)
 
     def get_league_metadata(self) -> League:
         """Retrieve metadata for chosen league.
@@ -1047,11 +2385,15 @@ class YahooFantasySportsQuery(object):
             League: YFPY League instance.
 
         """
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/metadata",
-            ["league"],
-            League
+        league = self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/metadata",
+            ("league",),
+            League,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
+        self._update_league_status(league)
+        return league
 
     def get_league_settings(self) -> Settings:
         """Retrieve settings (rules) for chosen league.
@@ -1136,9 +2478,11 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/settings",
-            ["league", "settings"],
-            Settings
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/settings",
+            ("league", "settings"),
+            Settings,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_league_standings(self) -> Standings:
@@ -1217,9 +2561,11 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/standings",
-            ["league", "standings"],
-            Standings
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/standings",
+            ("league", "standings"),
+            Standings,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_league_teams(self) -> List[Team]:
@@ -1274,8 +2620,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/teams",
-            ["league", "teams"]
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/teams",
+            ("league", "teams"),
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_league_players(self, player_count_limit: int = None, player_count_start: int = 0,
@@ -1336,82 +2684,176 @@ class YahooFantasySportsQuery(object):
             list[Player]: List of YFPY Player instances.
 
         """
+        league_key = self.get_league_key()
+        if is_retry:
+            return self._get_league_player_batch(league_key, player_count_start, 1)
+
         league_player_count = player_count_start
         all_players_retrieved = False
         league_player_data = []
-        league_player_retrieval_limit = 25
-        while not all_players_retrieved:
-
-            try:
-                league_player_query_data = self.query(
-                    f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-                    f"start={league_player_count};count={league_player_retrieval_limit if not is_retry else 1}",
-                    ["league", "players"]
-                )
+        with ThreadPoolExecutor(max_workers=LEAGUE_PLAYERS_MAX_WORKERS) as executor:
+            while not all_players_retrieved:
+                # retrieve the next window of player batches concurrently
+                window_end = league_player_count + LEAGUE_PLAYERS_BATCH_SIZE * LEAGUE_PLAYERS_MAX_WORKERS
+                if player_count_limit:
+                    window_end = min(window_end, player_count_limit)
+                batch_starts = list(range(league_player_count, window_end, LEAGUE_PLAYERS_BATCH_SIZE))
+                batch_sizes = [min(LEAGUE_PLAYERS_BATCH_SIZE, window_end - batch_start) for batch_start in batch_starts]
+                batch_futures = [
+                    executor.submit(self._get_league_player_batch_safe, league_key, batch_start, batch_size)
+                    for batch_start, batch_size in zip(batch_starts, batch_sizes)
+                ]
 
-                league_players = (league_player_query_data if isinstance(league_player_query_data, list) else
-                                  [league_player_query_data])
-                league_player_count_from_query = len(league_players)
+                # batches are processed in order, so players are returned in the same order as they are retrieved
+                for batch_start, batch_size, batch_future in zip(batch_starts, batch_sizes, batch_futures):
+                    league_players, yfpy_err = batch_future.result()
 
-                if player_count_limit:
-                    if (league_player_count + league_player_count_from_query) < player_count_limit:
-                        league_player_count += league_player_count_from_query
+                    if yfpy_err is None:
                         league_player_data.extend(league_players)
-
-                    else:
-                        for ndx in range(player_count_limit - league_player_count):
-                            league_player_data.append(league_players[ndx])
-                        league_player_count += (player_count_limit - league_player_count)
+                        league_player_count = batch_start + len(league_players)
+                        # a batch with fewer players than requested contains the last player of the league
+                        all_players_retrieved = len(league_players) < batch_size
+                    elif yfpy_err.payload:
                         all_players_retrieved = True
+                    else:
+                        league_player_data.extend(
+                            self._retrieve_league_players_individually(executor, league_key, batch_start, batch_size)
+                        )
+                        league_player_count = batch_start + batch_size
 
-                else:
-                    league_player_count += league_player_count_from_query
-                    league_player_data.extend(league_players)
-
-            except YahooFantasySportsDataNotFound as yfpy_err:
-                if not is_retry:
-                    payload = yfpy_err.payload
-                    if payload:
+                    if all_players_retrieved:
                         logger.debug("No more league player data available.")
-                        all_players_retrieved = True
-                    else:
-                        logger.warning(
-                            f"Error retrieving player batch: "
-                            f"{league_player_count}-{league_player_count + league_player_retrieval_limit - 1}. "
-                            f"Attempting to retrieve individual players from batch.")
-
-                        player_retrieval_successes = []
-                        player_retrieval_failures = []
-                        for i in range(25):
-                            try:
-                                player_data = self.get_league_players(
-                                    player_count_limit=league_player_count + 1,
-                                    player_count_start=league_player_count,
-                                    is_retry=True
-                                )
-                                player_retrieval_successes.extend(player_data)
-
-                            except YahooFantasySportsDataNotFound as nested_yfpy_err:
-                                player_retrieval_failures.append(
-                                    {
-                                        "failed_player_retrieval_index": league_player_count,
-                                        "failed_player_retrieval_url": nested_yfpy_err.url,
-                                        "failed_player_retrieval_message": nested_yfpy_err.message
-                                    }
-                                )
-
-                            league_player_count += 1
-
-                        league_player_data.extend(player_retrieval_successes)
-                        logger.warning(f"Players retrieval failures:\n{prettify_data(player_retrieval_failures)}")
+                        # skip the batches past the last player, and do not send the ones that have not been sent yet
+                        for remaining_batch_future in batch_futures:
+                            remaining_batch_future.cancel()
+                        break
 
-                else:
-                    raise yfpy_err
+                if player_count_limit and league_player_count >= player_count_limit:
+                    all_players_retrieved = True
 
-            logger.debug(f"League player count: {league_player_count}")
+                logger.debug("League player count: %s", league_player_count)
 
         return league_player_data
 
+    def _get_league_player_batch(self, league_key: str, batch_start: int, batch_size: int) -> List[Player]:
+        """Retrieve a batch of valid players for chosen league.
+
+        Args:
+            league_key (str): League key of the chosen league.
+            batch_start (int): Index from which to retrieve players.
+            batch_size (int): Number of players to retrieve (up to 25).
+
+        Returns:
+            list[Player]: List of YFPY Player instances.
+
+        """
+        return self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{league_key}/players;start={batch_start};count={batch_size}",
+            ("league", "players")
+        )
+
+    def _get_league_player(self, league_key: str, player_start: int) -> Player:
+        """Retrieve a single valid player for chosen league.
+
+        Args:
+            league_key (str): League key of the chosen league.
+            player_start (int): Index of the player to retrieve.
+
+        Returns:
+            Player: YFPY Player instance.
+
+        """
+        return self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{league_key}/players;start={player_start};count=1",
+            LEAGUE_PLAYER_DATA_KEY_PATH,
+            Player
+        )
+
+    def _get_league_player_batch_safe(self, league_key: str, batch_start: int,
+                                      batch_size: int) -> Tuple[List[Player], Optional[YahooFantasySportsDataNotFound]]:
+        """Retrieve a batch of valid players for chosen league, returning instead of raising a missing data error.
+
+        Args:
+            league_key (str): League key of the chosen league.
+            batch_start (int): Index from which to retrieve players.
+            batch_size (int): Number of players to retrieve (up to 25).
+
+        Returns:
+            tuple(list[Player], YahooFantasySportsDataNotFound | None): List of YFPY Player instances (empty if the
+            batch could not be retrieved) and the error raised while retrieving the batch (if any).
+
+        """
+        try:
+            return self._get_league_player_batch(league_key, batch_start, batch_size), None
+        except YahooFantasySportsDataNotFound as yfpy_err:
+            return [], yfpy_err
+
+    def _get_league_player_safe(self, league_key: str,
+                                player_start: int) -> Tuple[Optional[Player], Optional[Dict[str, Any]]]:
+        """Retrieve a single valid player for chosen league, returning instead of raising a missing data error.
+
+        Args:
+            league_key (str): League key of the chosen league.
+            player_start (int): Index of the player to retrieve.
+
+        Returns:
+            tuple(Player | None, dict[str, Any] | None): YFPY Player instance (None if the player could not be
+            retrieved) and the details of the failed player retrieval (if any).
+
+        """
+        # skip players that previously failed to be retrieved (cached in memory only, since the index of a failed
+        # player does not identify the same player across processes once Yahoo reorders the league players)
+        failure_cache_key = ("failed_player_retrieval", league_key, player_start)
+        player_retrieval_failure = self._query_cache.get(failure_cache_key)
+        if player_retrieval_failure is not None:
+            logger.debug("Skipping player retrieval that previously failed at index: %s", player_start)
+            return None, player_retrieval_failure
+
+        try:
+            return self._get_league_player(league_key, player_start), None
+        except YahooFantasySportsDataNotFound as yfpy_err:
+            player_retrieval_failure = {
+                "failed_player_retrieval_index": player_start,
+                "failed_player_retrieval_url": yfpy_err.url,
+                "failed_player_retrieval_message": yfpy_err.message
+            }
+            self._query_cache.set(
+                failure_cache_key, player_retrieval_failure, FAILED_PLAYER_RETRIEVAL_CACHE_TTL_SECONDS, persist=False
+            )
+            return None, player_retrieval_failure
+
+    def _retrieve_league_players_individually(self, executor: ThreadPoolExecutor, league_key: str, batch_start: int,
+                                              batch_size: int) -> List[Player]:
+        """Retrieve the valid players of a failed player batch for chosen league concurrently one player at a time,
+        skipping (and logging) the players that cannot be retrieved.
+
+        Args:
+            executor (ThreadPoolExecutor): Thread pool executor with which to retrieve the players concurrently.
+            league_key (str): League key of the chosen league.
+            batch_start (int): Index from which the failed batch retrieved players.
+            batch_size (int): Number of players the failed batch retrieved.
+
+        Returns:
+            list[Player]: List of YFPY Player instances.
+
+        """
+        logger.warning(
+            f"Error retrieving player batch: {batch_start}-{batch_start + batch_size - 1}. "
+            f"Attempting to retrieve individual players from batch.")
+
+        league_players = []
+        player_retrieval_failures = []
+        player_starts = range(batch_start, batch_start + batch_size)
+        for player, player_retrieval_failure in executor.map(
+                self._get_league_player_safe, repeat(league_key), player_starts):
+            if player_retrieval_failure is None:
+                league_players.append(player)
+            else:
+                player_retrieval_failures.append(player_retrieval_failure)
+
+        logger.warning(f"Players retrieval failures:\n{prettify_data(player_retrieval_failures)}")
+        return league_players
+
     def get_league_draft_results(self) -> List[DraftResult]:
         """Retrieve draft results for chosen league.
 
@@ -1436,8 +2878,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/draftresults",
-            ["league", "draft_results"]
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/draftresults",
+            ("league", "draft_results"),
+            cache=True,
+            cache_ttl=self._get_draft_results_cache_ttl()
         )
 
     def get_league_transactions(self) -> List[Transaction]:
@@ -1490,8 +2934,10 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/transactions",
-            ["league", "transactions"]
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/transactions",
+            ("league", "transactions"),
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_league_scoreboard_by_week(self, chosen_week: int) -> Scoreboard:
@@ -1560,12 +3006,59 @@ class YahooFantasySportsQuery(object):
 
         """
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/scoreboard;"
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/scoreboard;"
             f"week={chosen_week}",
-            ["league", "scoreboard"],
-            Scoreboard
+            ("league", "scoreboard"),
+            Scoreboard,
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
         )
 
+    def get_league_scoreboards(self, weeks: Iterable[int]) -> Dict[int, Scoreboard]:
+        """Concurrently retrieve scoreboards of chosen league for multiple weeks.
+
+        Args:
+            weeks (Iterable[int]): Selected weeks for which to retrieve data.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_league_scoreboards(range(1, 18))
+            {
+              1: Scoreboard({...}),
+              ...,
+              17: Scoreboard({...})
+            }
+
+        Returns:
+            dict[int, Scoreboard]: Dictionary of YFPY Scoreboard instances keyed by week (in the same order as the
+            selected weeks).
+
+        """
+        return self._get_by_weeks(self.get_league_scoreboard_by_week, weeks)
+
+    def _get_by_weeks(self, get_by_week: Callable[..., Any], weeks: Iterable[Union[int, str]],
+                      *args) -> Dict[Union[int, str], Any]:
+        """Concurrently run a query method retrieving data by week (or by date) for multiple weeks (or dates).
+
+        Args:
+            get_by_week (Callable[..., Any]): Query method of this query object which takes the selected week (or date)
+                as its last argument.
+            weeks (Iterable[int | str]): Selected weeks (or dates) for which to retrieve data.
+            *args: Positional arguments passed to the query method before the selected week (or date).
+
+        Returns:
+            dict[int | str, Any]: Dictionary of query results keyed by week or date (in the same order as the selected
+            weeks or dates).
+
+        """
+        weeks = list(weeks)
+        # resolve the league key once before fanning out so concurrent queries do not all look it up
+        self.get_league_key()
+        with ThreadPoolExecutor(max_workers=LEAGUE_WEEKS_MAX_WORKERS) as executor:
+            return dict(zip(weeks, executor.map(lambda week: get_by_week(*args, week), weeks)))
+
     def get_league_matchups_by_week(self, chosen_week: int) -> List[Matchup]:
         """Retrieve matchups for chosen league by week.
 
@@ -1627,15 +3120,22 @@ class YahooFantasySportsQuery(object):
             list[Matchup]: List of YFPY Matchup instances.
 
         """
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/scoreboard;"
+        return self._query_collection(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/scoreboard;"
             f"week={chosen_week}",
-            ["league", "scoreboard", "0", "matchups"]
+            LEAGUE_MATCHUPS_DATA_KEY_PATH,
+            "fantasy_content.league.item.scoreboard.0.matchups",
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
         )
 
     def get_team_info(self, team_id: Union[str, int]) -> Team:
         """Retrieve info of specific team by team_id for chosen league.
 
+        Note:
+            Use :func:`get_teams_info` to retrieve the info of multiple teams with a single request instead of calling
+            this method for each team.
+
         Args:
             team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
                 number of teams in the league).
@@ -1713,14 +3213,41 @@ class YahooFantasySportsQuery(object):
             Team: YFPY Team instance.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key};"
-            f"out=metadata,stats,standings,roster,draftresults,matchups",
-            ["team"],
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key};out={TEAM_INFO_SUBRESOURCES}",
+            TEAM_DATA_KEY_PATH,
             Team
         )
 
+    def get_teams_info(self, team_ids: Iterable[Union[str, int]]) -> List[Team]:
+        """Retrieve info of multiple teams by team_id for chosen league with a single request.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_teams_info([1, 2])
+            [
+              Team({...}),
+              Team({...})
+            ]
+
+        Args:
+            team_ids (Iterable[str | int]): Selected team IDs for which to retrieve data (can be integers 1 through n
+                where n is the number of teams in the league).
+
+        Returns:
+            list[Team]: List of YFPY Team instances.
+
+        """
+        team_keys = ",".join(map(self._get_team_key, team_ids))
+        return self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/teams;team_keys={team_keys};"
+            f"out={TEAM_INFO_SUBRESOURCES}",
+            ("league", "teams")
+        )
+
     def get_team_metadata(self, team_id: Union[str, int]) -> Team:
         """Retrieve metadata of specific team by team_id for chosen league.
 
@@ -1771,11 +3298,13 @@ class YahooFantasySportsQuery(object):
             Team: YFPY Team instance.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/metadata",
-            ["team"],
-            Team
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/metadata",
+            TEAM_DATA_KEY_PATH,
+            Team,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_team_stats(self, team_id: Union[str, int]) -> TeamPoints:
@@ -1800,11 +3329,13 @@ class YahooFantasySportsQuery(object):
             TeamPoints: YFPY TeamPoints instance.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/stats",
-            ["team", "team_points"],
-            TeamPoints
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/stats",
+            TEAM_POINTS_DATA_KEY_PATH,
+            TeamPoints,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_team_stats_by_week(
@@ -1840,12 +3371,42 @@ class YahooFantasySportsQuery(object):
                 "team_projected_points" with respective values YFPY TeamPoints and YFPY TeamProjectedPoints instances.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/stats;type=week;week={chosen_week}",
-            ["team", ["team_points", "team_projected_points"]]
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/stats;type=week;week={chosen_week}",
+            TEAM_WEEK_POINTS_DATA_KEY_PATH,
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
         )
 
+    def get_team_stats_by_weeks(
+            self, team_id: Union[str, int], weeks: Iterable[int]
+    ) -> Dict[int, Dict[str, Union[TeamPoints, TeamProjectedPoints]]]:
+        """Concurrently retrieve stats of specific team by team_id for multiple weeks for chosen league.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            weeks (Iterable[int]): Selected weeks for which to retrieve data.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_team_stats_by_weeks(1, range(1, 18))
+            {
+              1: {"team_points": TeamPoints({...}), "team_projected_points": TeamProjectedPoints({...})},
+              ...,
+              17: {"team_points": TeamPoints({...}), "team_projected_points": TeamProjectedPoints({...})}
+            }
+
+        Returns:
+            dict[int, dict[str, TeamPoints | TeamProjectedPoints]]: Dictionary of team stats (see
+            :func:`get_team_stats_by_week`) keyed by week (in the same order as the selected weeks).
+
+        """
+        return self._get_by_weeks(self.get_team_stats_by_week, weeks, team_id)
+
     def get_team_standings(self, team_id: Union[str, int]) -> TeamStandings:
         """Retrieve standings of specific team by team_id for chosen league.
 
@@ -1879,16 +3440,22 @@ class YahooFantasySportsQuery(object):
             TeamStandings: YFPY TeamStandings instance.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/standings",
-            ["team", "team_standings"],
-            TeamStandings
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/standings",
+            TEAM_STANDINGS_DATA_KEY_PATH,
+            TeamStandings,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_team_roster_by_week(self, team_id: Union[str, int], chosen_week: Union[int, str] = "current") -> Roster:
         """Retrieve roster of specific team by team_id and by week for chosen league.
 
+        Note:
+            Use :func:`get_teams_roster_by_week` to retrieve the rosters of multiple teams with a single request instead
+            of calling this method for each team.
+
         Args:
             team_id (str | int): Selected team ID for which to retrieva data (can be integers 1 through n where n is the
                 number of teams in the league).
@@ -1951,15 +3518,74 @@ class YahooFantasySportsQuery(object):
             })
 
         Returns:
-            Roster: YFPY Roster instance.
+            Roster: YFPY Roster instance.
+
+        """
+        team_key = self._get_team_key(team_id)
+        return self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster;week={chosen_week}",
+            TEAM_ROSTER_DATA_KEY_PATH,
+            Roster,
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
+        )
+
+    def get_team_roster_by_weeks(self, team_id: Union[str, int], weeks: Iterable[int]) -> Dict[int, Roster]:
+        """Concurrently retrieve rosters of specific team by team_id for multiple weeks for chosen league.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            weeks (Iterable[int]): Selected weeks for which to retrieve data.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_team_roster_by_weeks(1, range(1, 18))
+            {
+              1: Roster({...}),
+              ...,
+              17: Roster({...})
+            }
+
+        Returns:
+            dict[int, Roster]: Dictionary of YFPY Roster instances keyed by week (in the same order as the selected
+            weeks).
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/roster;week={chosen_week}",
-            ["team", "roster"],
-            Roster
+        return self._get_by_weeks(self.get_team_roster_by_week, weeks, team_id)
+
+    def get_teams_roster_by_week(self, team_ids: Iterable[Union[str, int]],
+                                 chosen_week: Union[int, str] = "current") -> List[Roster]:
+        """Retrieve rosters of multiple teams by team_id and by week for chosen league with a single request.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_teams_roster_by_week([1, 2], 1)
+            [
+              Roster({...}),
+              Roster({...})
+            ]
+
+        Args:
+            team_ids (Iterable[str | int]): Selected team IDs for which to retrieve data (can be integers 1 through n
+                where n is the number of teams in the league).
+            chosen_week (int): Selected week for which to retrieve data.
+
+        Returns:
+            list[Roster]: List of YFPY Roster instances in the order of the teams returned by Yahoo.
+
+        """
+        team_keys = ",".join(map(self._get_team_key, team_ids))
+        teams = self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/teams;team_keys={team_keys}/"
+            f"roster;week={chosen_week}",
+            ("league", "teams")
         )
+        return [team.roster for team in teams]
 
     def get_team_roster_player_info_by_week(self, team_id: Union[str, int],
                                             chosen_week: Union[int, str] = "current") -> List[Player]:
@@ -2060,11 +3686,14 @@ class YahooFantasySportsQuery(object):
                 "percent_owned", and "player_stats".
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/roster;week={chosen_week}/players;"
-            f"out=metadata,stats,ownership,percent_owned,draft_analysis",
-            ["team", "roster", "0", "players"]
+        team_key = self._get_team_key(team_id)
+        return self._query_collection(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster;week={chosen_week}/players;"
+            f"out={PLAYER_INFO_SUBRESOURCES}",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH,
+            "fantasy_content.team.item.roster.0.players",
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
         )
 
     def get_team_roster_player_info_by_date(self, team_id: Union[str, int],
@@ -2162,14 +3791,49 @@ class YahooFantasySportsQuery(object):
                 "percent_owned", and "player_stats".
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/"
-            f"roster{';date=' + str(chosen_date) if chosen_date else ''}/players;"
-            f"out=metadata,stats,ownership,percent_owned,draft_analysis",
-            ["team", "roster", "0", "players"]
+        if chosen_date:
+            _check_date(chosen_date)
+        team_key = self._get_team_key(team_id)
+        roster_resource = f"roster;date={chosen_date}" if chosen_date else "roster"
+        return self._query_collection(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/{roster_resource}/players;out={PLAYER_INFO_SUBRESOURCES}",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH,
+            "fantasy_content.team.item.roster.0.players"
         )
 
+    def get_team_roster_player_info_by_dates(self, team_id: Union[str, int],
+                                             chosen_dates: Iterable[str]) -> Dict[str, List[Player]]:
+        """Concurrently retrieve rosters with ALL player info of specific team by team_id for multiple dates for chosen
+        league.
+
+        Note:
+            This applies to MLB, NBA, and NHL leagues, but does NOT apply to NFL leagues.
+            This query will FAIL if you pass it an INVALID date string!
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            chosen_dates (Iterable[str]): Selected dates for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex.
+                2011-05-01)
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_team_roster_player_info_by_dates(1, ["2011-05-01", "2011-05-02"])
+            {
+              "2011-05-01": [Player({...}), ..., Player({...})],
+              "2011-05-02": [Player({...}), ..., Player({...})]
+            }
+
+        Returns:
+            dict[str, list[Player]]: Dictionary of lists of YFPY Player instances containing attributes
+            "draft_analysis", "ownership", "percent_owned", and "player_stats" keyed by date (in the same order as the
+            selected dates).
+
+        """
+        return self._get_by_weeks(self.get_team_roster_player_info_by_date, chosen_dates, team_id)
+
     def get_team_roster_player_stats(self, team_id: Union[str, int]) -> List[Player]:
         """Retrieve roster with ALL player info for the season of specific team by team_id and for chosen league.
 
@@ -2254,10 +3918,13 @@ class YahooFantasySportsQuery(object):
                 "percent_owned", and "player_stats".
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/roster/players/stats;type=season",
-            ["team", "roster", "0", "players"]
+        team_key = self._get_team_key(team_id)
+        return self._query_collection(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster/players/stats;type=season",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH,
+            "fantasy_content.team.item.roster.0.players",
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_team_roster_player_stats_by_week(self, team_id: Union[str, int],
@@ -2341,11 +4008,99 @@ class YahooFantasySportsQuery(object):
             list[Player]: List of YFPY Player instances containing attribute "player_stats".
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
-        return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/roster;week={chosen_week}/players/stats",
-            ["team", "roster", "0", "players"]
+        team_key = self._get_team_key(team_id)
+        return self._query_collection(
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/roster;week={chosen_week}/players/stats",
+            TEAM_ROSTER_PLAYERS_DATA_KEY_PATH,
+            "fantasy_content.team.item.roster.0.players",
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
+        )
+
+    def get_team_roster_player_stats_by_weeks(self, team_id: Union[str, int],
+                                              weeks: Iterable[int]) -> Dict[int, List[Player]]:
+        """Concurrently retrieve roster player stats of specific team by team_id for multiple weeks for chosen league.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+            weeks (Iterable[int]): Selected weeks for which to retrieve data.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_team_roster_player_stats_by_weeks(1, range(1, 18))
+            {
+              1: [Player({...}), ..., Player({...})],
+              ...,
+              17: [Player({...}), ..., Player({...})]
+            }
+
+        Returns:
+            dict[int, list[Player]]: Dictionary of lists of YFPY Player instances containing attribute "player_stats"
+            keyed by week (in the same order as the selected weeks).
+
+        """
+        return self._get_by_weeks(self.get_team_roster_player_stats_by_week, weeks, team_id)
+
+    def get_teams_roster_player_stats_by_week(self, team_ids: Iterable[Union[str, int]],
+                                              chosen_week: Union[int, str] = "current") -> Dict[Any, List[Player]]:
+        """Retrieve roster with player stats of multiple teams by team_id and by week for chosen league, with a single
+        request for the rosters of all teams and one request per 25 rostered players for their stats (run concurrently)
+        instead of one request per team.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_teams_roster_player_stats_by_week(range(1, 11), 1)
+            {
+              1: [Player({...}), ..., Player({...})],
+              ...,
+              10: [Player({...}), ..., Player({...})]
+            }
+
+        Args:
+            team_ids (Iterable[str | int]): Selected team IDs for which to retrieve data (can be integers 1 through n
+                where n is the number of teams in the league).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            dict[Any, list[Player]]: Dictionary of lists of YFPY Player instances containing attribute "player_stats"
+            keyed by team ID (in the same order as the selected team IDs). Rostered players missing from the stats
+            response (such as players dropped between the roster and stats requests) are skipped.
+
+        """
+        team_keys = {team_id: self._get_team_key(team_id) for team_id in team_ids}
+        teams = self.query(
+            f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/teams;"
+            f"team_keys={','.join(team_keys.values())}/roster;week={chosen_week}",
+            ("league", "teams")
         )
+        roster_player_keys = {
+            team.team_key: [player.player_key for player in team.roster.players] for team in teams
+        }
+
+        players_by_key = {
+            player.player_key: player for player in self.get_players_stats_by_week(
+                [player_key for player_keys in roster_player_keys.values() for player_key in player_keys], chosen_week
+            )
+        }
+        missing_player_keys = [
+            player_key for player_keys in roster_player_keys.values() for player_key in player_keys
+            if player_key not in players_by_key
+        ]
+        if missing_player_keys:
+            logger.warning(f"Skipping rostered players missing from player stats: {', '.join(missing_player_keys)}")
+
+        return {
+            team_id: [
+                players_by_key[player_key] for player_key in roster_player_keys.get(team_key, [])
+                if player_key in players_by_key
+            ]
+            for team_id, team_key in team_keys.items()
+        }
 
     def get_team_draft_results(self, team_id: Union[str, int]) -> List[DraftResult]:
         """Retrieve draft results of specific team by team_id for chosen league.
@@ -2374,10 +4129,12 @@ class YahooFantasySportsQuery(object):
             list[DraftResult]: List of YFPY DraftResult instances.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/draftresults",
-            ["team", "draft_results"]
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/draftresults",
+            TEAM_DRAFT_RESULTS_DATA_KEY_PATH,
+            cache=True,
+            cache_ttl=self._get_draft_results_cache_ttl()
         )
 
     def get_team_matchups(self, team_id: Union[str, int]) -> List[Matchup]:
@@ -2402,19 +4159,115 @@ class YahooFantasySportsQuery(object):
             list[Matchup]: List of YFPY Matchup instances.
 
         """
-        team_key = f"{self.get_league_key()}.t.{team_id}"
+        team_matchups = self._query_team_matchups(team_id)
+        # matchups are usually retrieved for every team in turn, so prefetch the matchups of the next team
+        if str(team_id).isdigit() and int(team_id) < (self._league_num_teams or 0):
+            self._prefetch(self._query_team_matchups, int(team_id) + 1)
+        return team_matchups
+
+    def _query_team_matchups(self, team_id: Union[str, int]) -> List[Matchup]:
+        """Retrieve matchups of specific team by team_id for chosen league.
+
+        Args:
+            team_id (str | int): Selected team ID for which to retrieve data (can be integers 1 through n where n is the
+                number of teams in the league).
+
+        Returns:
+            list[Matchup]: List of YFPY Matchup instances.
+
+        """
+        team_key = self._get_team_key(team_id)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/team/{team_key}/matchups",
-            ["team", "matchups"]
+            f"{YAHOO_FANTASY_API_BASE_URL}/team/{team_key}/matchups",
+            TEAM_MATCHUPS_DATA_KEY_PATH,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
-    def get_player_stats_for_season(self, player_key: str, limit_to_league_stats: bool = True) -> Player:
+    def _get_player_url(self, player_key: str, limit_to_league_stats: bool = True) -> Tuple[str, Tuple[str, ...]]:
+        """Build the REST API request URL and data key path for queries of a specific player by player_key.
+
+        Args:
+            player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
+            limit_to_league_stats (bool, optional): Boolean to query the player within the chosen league instead of
+                across the game as a whole.
+
+        Returns:
+            tuple(str, tuple(str)): REST API request URL of the player and data key path of the player in its response.
+
+        """
+        _check_player_key(player_key)
+        if limit_to_league_stats:
+            return (
+                f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/players;player_keys={player_key}",
+                LEAGUE_PLAYER_DATA_KEY_PATH
+            )
+        return f"{YAHOO_FANTASY_API_BASE_URL}/players;player_keys={player_key}", PLAYER_DATA_KEY_PATH
+
+    def _query_player_stats(self, url: str, data_key_list: Tuple[str, ...], cache_ttl: Optional[float],
+                            only_stat_ids: Optional[Iterable[Union[int, str]]],
+                            lazy: bool = False) -> Union[Player, LazyYahooObject]:
+        """Retrieve the stats of a specific player, only unpacking and parsing the selected stats when stat IDs are
+        provided (or only the accessed player data when lazy).
+
+        Args:
+            url (str): REST API request URL string.
+            data_key_list (tuple): Data key path of the player in the API response.
+            cache_ttl (float | None): Number of seconds until cached results expire (never expire when None).
+            only_stat_ids (Iterable[int | str] | None): Stat IDs of the only player stats to retrieve (all player stats
+                are retrieved when None).
+            lazy (bool, optional): Boolean to return a LazyYahooObject that only parses the player data that is
+                accessed instead of a fully parsed Player.
+
+        Returns:
+            Player | LazyYahooObject: YFPY Player instance (or lazy proxy of the player data) containing attribute
+            "player_stats".
+
+        """
+        if only_stat_ids is None:
+            return self.query(url, data_key_list, Player, cache=True, lazy=lazy, cache_ttl=cache_ttl)
+
+        stat_ids = frozenset(map(str, only_stat_ids))
+        cache_key = self._get_query_cache_key(url, data_key_list, self._get_result_type(Player, lazy)) + (stat_ids,)
+        player = self._get_cached_query_data(cache_key, lazy)
+        if player is not None:
+            return player
+
+        # filter the raw stats (which are cached unfiltered) before any of them are unpacked into model instances
+        player_data = [
+            {
+                **player_data,
+                "player_stats": {
+                    **player_data["player_stats"],
+                    "stats": [
+                        stat for stat in player_data["player_stats"].get("stats", [])
+                        if str(stat["stat"]["stat_id"]) in stat_ids
+                    ]
+                }
+            } if isinstance(player_data, dict) and "player_stats" in player_data else player_data
+            for player_data in self.query(url, data_key_list, cache=True, raw=True, cache_ttl=cache_ttl)
+        ]
+        if lazy:
+            player = LazyYahooObject(player_data, YahooFantasyObject)
+        else:
+            player = Player(unpack_data(player_data, YahooFantasyObject))
+        self._query_cache.set(cache_key, player, cache_ttl)
+        return jsonify_data(player) if self.all_output_as_json_str and not lazy else player
+
+    def get_player_stats_for_season(self, player_key: str, limit_to_league_stats: bool = True,
+                                    only_stat_ids: Iterable[Union[int, str]] = None,
+                                    lazy: bool = False) -> Union[Player, LazyYahooObject]:
         """Retrieve stats of specific player by player_key for the entire season for chosen league.
 
         Args:
             player_key (str): The player key of chosen player (example: 331.p.7200 - <game_id>.p.<player_id>).
             limit_to_league_stats (bool): Boolean (default: True) to limit the retrieved player stats to those for the
                 selected league. When set to False, query retrieves all player stats for the game (NFL, NHL, NBA, MLB).
+            only_stat_ids (Iterable[int | str], optional): Stat IDs of the only player stats to retrieve, so that the
+                other player stats are not unpacked and parsed (all player stats are retrieved when not provided).
+            lazy (bool, optional): Boolean to return a LazyYahooObject that only parses the player data that is accessed
+                (such as player_points) instead of a fully parsed Player, which is much faster for callers that only
+                read a few fields (never serialized to a JSON string).
 
         Examples:
             >>> from pathlib import Path
@@ -2473,26 +4326,17 @@ class YahooFantasySportsQuery(object):
             })
 
         Returns:
-            Player: YFPY Player instance.
+            Player | LazyYahooObject: YFPY Player instance (or lazy proxy of the player data when lazy is True).
 
         """
-        if limit_to_league_stats:
-            return self.query(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-                f"player_keys={player_key}/stats",
-                ["league", "players", "0", "player"],
-                Player
-            )
-        else:
-            return self.query(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/players;"
-                f"player_keys={player_key}/stats",
-                ["players", "0", "player"],
-                Player
-            )
+        player_url, data_key_path = self._get_player_url(player_key, limit_to_league_stats)
+        return self._query_player_stats(
+            f"{player_url}/stats", data_key_path, self._get_league_cache_ttl(), only_stat_ids, lazy
+        )
 
     def get_player_stats_by_week(self, player_key: str, chosen_week: Union[int, str] = "current",
-                                 limit_to_league_stats: bool = True) -> Player:
+                                 limit_to_league_stats: bool = True, only_stat_ids: Iterable[Union[int, str]] = None,
+                                 lazy: bool = False) -> Union[Player, LazyYahooObject]:
         """Retrieve stats of specific player by player_key and by week for chosen league.
 
         Args:
@@ -2500,6 +4344,11 @@ class YahooFantasySportsQuery(object):
             chosen_week (int): Selected week for which to retrieve data.
             limit_to_league_stats (bool): Boolean (default: True) to limit the retrieved player stats to those for the
                 selected league. When set to False, query retrieves all player stats for the game (NFL, NHL, NBA, MLB).
+            only_stat_ids (Iterable[int | str], optional): Stat IDs of the only player stats to retrieve, so that the
+                other player stats are not unpacked and parsed (all player stats are retrieved when not provided).
+            lazy (bool, optional): Boolean to return a LazyYahooObject that only parses the player data that is accessed
+                (such as player_points) instead of a fully parsed Player, which is much faster for callers that only
+                read a few fields (never serialized to a JSON string).
 
         Examples:
             >>> from pathlib import Path
@@ -2560,26 +4409,27 @@ class YahooFantasySportsQuery(object):
             })
 
         Returns:
-            Player: YFPY Player instance containing attribute "player_stats".
+            Player | LazyYahooObject: YFPY Player instance (or lazy proxy of the player data when lazy is True)
+            containing attribute "player_stats".
 
         """
-        if limit_to_league_stats:
-            return self.query(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-                f"player_keys={player_key}/stats;type=week;week={chosen_week}",
-                ["league", "players", "0", "player"],
-                Player
-            )
-        else:
-            return self.query(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/players;"
-                f"player_keys={player_key}/stats;type=week;week={chosen_week}",
-                ["players", "0", "player"],
-                Player
+        player_url, data_key_path = self._get_player_url(player_key, limit_to_league_stats)
+        player = self._query_player_stats(
+            f"{player_url}/stats;type=week;week={chosen_week}", data_key_path, self._get_week_cache_ttl(chosen_week),
+            only_stat_ids, lazy
+        )
+        # player stats are usually retrieved for every week in turn, so prefetch the player stats of the next week (up
+        # to the current week)
+        if str(chosen_week).isdigit() and int(chosen_week) < (self._league_current_week or 0):
+            next_week = int(chosen_week) + 1
+            self._prefetch(
+                self._query_player_stats, f"{player_url}/stats;type=week;week={next_week}", data_key_path,
+                self._get_week_cache_ttl(next_week), only_stat_ids, lazy
             )
+        return player
 
-    def get_player_stats_by_date(self, player_key: str, chosen_date: str = None,
-                                 limit_to_league_stats: bool = True) -> Player:
+    def get_player_stats_by_date(self, player_key: str, chosen_date: str = None, limit_to_league_stats: bool = True,
+                                 lazy: bool = False) -> Union[Player, LazyYahooObject]:
         """Retrieve player stats by player_key and by date for chosen league.
 
         Note:
@@ -2591,6 +4441,9 @@ class YahooFantasySportsQuery(object):
             chosen_date (str): Selected date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex. 2011-05-01)
             limit_to_league_stats (bool): Boolean (default: True) to limit the retrieved player stats to those for the
                 selected league. When set to False, query retrieves all player stats for the game (NFL, NHL, NBA, MLB).
+            lazy (bool, optional): Boolean to return a LazyYahooObject that only parses the player data that is accessed
+                (such as player_points) instead of a fully parsed Player, which is much faster for callers that only
+                read a few fields (never serialized to a JSON string).
 
         Examples:
             >>> from pathlib import Path
@@ -2677,23 +4530,21 @@ class YahooFantasySportsQuery(object):
             })
 
         Returns:
-            Player: YFPY Player instnace containing attribute "player_stats".
+            Player | LazyYahooObject: YFPY Player instance (or lazy proxy of the player data when lazy is True)
+            containing attribute "player_stats".
 
         """
-        if limit_to_league_stats:
-            return self.query(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-                f"player_keys={player_key}/stats;type=date;date={chosen_date}",
-                ["league", "players", "0", "player"],
-                Player
-            )
-        else:
-            return self.query(
-                f"https://fantasysports.yahooapis.com/fantasy/v2/players;"
-                f"player_keys={player_key}/stats;type=date;date={chosen_date}",
-                ["players", "0", "player"],
-                Player
-            )
+        if chosen_date is not None:
+            _check_date(chosen_date)
+        player_url, data_key_path = self._get_player_url(player_key, limit_to_league_stats)
+        return self.query(
+            f"{player_url}/stats;type=date;date={chosen_date}",
+            data_key_path,
+            Player,
+            cache=True,
+            lazy=lazy,
+            cache_ttl=self._get_league_cache_ttl()
+        )
 
     def get_player_ownership(self, player_key: str) -> Player:
         """Retrieve ownership of specific player by player_key for chosen league.
@@ -2786,11 +4637,13 @@ class YahooFantasySportsQuery(object):
             Player: YFPY Player instance containing attribute "ownership".
 
         """
+        player_url, data_key_path = self._get_player_url(player_key)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-            f"player_keys={player_key}/ownership",
-            ["league", "players", "0", "player"],
-            Player
+            f"{player_url}/ownership",
+            data_key_path,
+            Player,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
         )
 
     def get_player_percent_owned_by_week(self, player_key: str, chosen_week: Union[int, str] = "current") -> Player:
@@ -2850,11 +4703,13 @@ class YahooFantasySportsQuery(object):
             Player: YFPY Player instance containing attribute "percent_owned".
 
         """
+        player_url, data_key_path = self._get_player_url(player_key)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-            f"player_keys={player_key}/percent_owned;type=week;week={chosen_week}",
-            ["league", "players", "0", "player"],
-            Player
+            f"{player_url}/percent_owned;type=week;week={chosen_week}",
+            data_key_path,
+            Player,
+            cache=True,
+            cache_ttl=self._get_week_cache_ttl(chosen_week)
         )
 
     def get_player_draft_analysis(self, player_key: str) -> Player:
@@ -2913,9 +4768,228 @@ class YahooFantasySportsQuery(object):
             Player: YFPY Player instance containing attribute "draft_analysis".
 
         """
+        player_url, data_key_path = self._get_player_url(player_key)
         return self.query(
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.get_league_key()}/players;"
-            f"player_keys={player_key}/draft_analysis",
-            ["league", "players", "0", "player"],
-            Player
+            f"{player_url}/draft_analysis",
+            data_key_path,
+            Player,
+            cache=True,
+            cache_ttl=self._get_league_cache_ttl()
+        )
+
+    def _get_players_by_keys(self, player_keys: Iterable[str], player_subresource: str,
+                             limit_to_league_stats: bool = True, cache_ttl: float = None) -> List[Player]:
+        """Retrieve a subresource of multiple players by player_key with one request per batch of players.
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            player_subresource (str): Player subresource (with its parameters) to retrieve for each player.
+            limit_to_league_stats (bool, optional): Boolean to retrieve the players within the chosen league instead of
+                across the game as a whole.
+            cache_ttl (float, optional): Number of seconds until cached batches of players expire (never expire when
+                not provided).
+
+        Returns:
+            list[Player]: List of YFPY Player instances in the same order as the player keys.
+
+        """
+        player_keys = list(player_keys)
+        for player_key in player_keys:
+            _check_player_key(player_key)
+        if limit_to_league_stats:
+            players_url = f"{YAHOO_FANTASY_API_BASE_URL}/league/{self.get_league_key()}/players"
+            data_key_list = ("league", "players")
+        else:
+            players_url = f"{YAHOO_FANTASY_API_BASE_URL}/players"
+            data_key_list = ("players",)
+
+        def get_player_batch(batch_start: int) -> List[Player]:
+            batch_player_keys = ",".join(player_keys[batch_start:batch_start + LEAGUE_PLAYERS_BATCH_SIZE])
+            return self.query(
+                f"{players_url};player_keys={batch_player_keys}/{player_subresource}",
+                data_key_list,
+                cache=True,
+                cache_ttl=cache_ttl
+            )
+
+        batch_starts = range(0, len(player_keys), LEAGUE_PLAYERS_BATCH_SIZE)
+        if len(batch_starts) == 1:
+            return get_player_batch(0)
+
+        with ThreadPoolExecutor(max_workers=LEAGUE_PLAYERS_MAX_WORKERS) as executor:
+            return [player for player_batch in executor.map(get_player_batch, batch_starts) for player in player_batch]
+
+    def get_players_stats_for_season(self, player_keys: Iterable[str],
+                                     limit_to_league_stats: bool = True) -> List[Player]:
+        """Retrieve stats of multiple players by player_key for the entire season for chosen league with one request per
+        25 players.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_players_stats_for_season(["331.p.7200", "331.p.9317"])
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            list[Player]: List of YFPY Player instances in the same order as the player keys.
+
+        """
+        return self._get_players_by_keys(player_keys, "stats", limit_to_league_stats, self._get_league_cache_ttl())
+
+    def get_players_stats_by_week(self, player_keys: Iterable[str], chosen_week: Union[int, str] = "current",
+                                  limit_to_league_stats: bool = True) -> List[Player]:
+        """Retrieve stats of multiple players by player_key and by week for chosen league with one request per 25
+        players.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_players_stats_by_week(["331.p.7200", "331.p.9317"], 1)
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "player_stats" in the same order as the
+            player keys.
+
+        """
+        return self._get_players_by_keys(
+            player_keys, f"stats;type=week;week={chosen_week}", limit_to_league_stats,
+            self._get_week_cache_ttl(chosen_week)
+        )
+
+    def get_players_stats_by_date(self, player_keys: Iterable[str], chosen_date: str = None,
+                                  limit_to_league_stats: bool = True) -> List[Player]:
+        """Retrieve stats of multiple players by player_key and by date for chosen league with one request per 25
+        players.
+
+        Note:
+            This applies to MLB, NBA, and NHL leagues, but does NOT apply to NFL leagues.
+            This query will FAIL if you pass it an INVALID date string!
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_players_stats_by_date(["403.p.4588", "403.p.5441"], "2021-10-13")
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 403.p.4588 -
+                <game_id>.p.<player_id>).
+            chosen_date (str, optional): Selected date for which to retrieve data. REQUIRED FORMAT: YYYY-MM-DD (Ex.
+                2011-05-01)
+            limit_to_league_stats (bool, optional): Boolean (default: True) to limit the retrieved player stats to
+                those for the selected league.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "player_stats" in the same order as the
+            player keys.
+
+        """
+        if chosen_date is not None:
+            _check_date(chosen_date)
+        return self._get_players_by_keys(
+            player_keys, f"stats;type=date;date={chosen_date}", limit_to_league_stats, self._get_league_cache_ttl()
+        )
+
+    def get_players_ownership(self, player_keys: Iterable[str]) -> List[Player]:
+        """Retrieve ownership of multiple players by player_key for chosen league with one request per 25 players.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_players_ownership(["331.p.7200", "331.p.9317"])
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "ownership" in the same order as the player
+            keys.
+
+        """
+        return self._get_players_by_keys(player_keys, "ownership", cache_ttl=self._get_league_cache_ttl())
+
+    def get_players_percent_owned_by_week(self, player_keys: Iterable[str],
+                                          chosen_week: Union[int, str] = "current") -> List[Player]:
+        """Retrieve percent-owned of multiple players by player_key and by week for chosen league with one request per
+        25 players.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_players_percent_owned_by_week(["331.p.7200", "331.p.9317"], 1)
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+            chosen_week (int | str, optional): Selected week for which to retrieve data.
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "percent_owned" in the same order as the
+            player keys.
+
+        """
+        return self._get_players_by_keys(
+            player_keys, f"percent_owned;type=week;week={chosen_week}", cache_ttl=self._get_week_cache_ttl(chosen_week)
         )
+
+    def get_players_draft_analysis(self, player_keys: Iterable[str]) -> List[Player]:
+        """Retrieve draft analysis of multiple players by player_key for chosen league with one request per 25 players.
+
+        Examples:
+            >>> from pathlib import Path
+            >>> from yfpy.query import YahooFantasySportsQuery
+            >>> query = YahooFantasySportsQuery(Path("/path/to/auth/directory"), league_id="######")
+            >>> query.get_players_draft_analysis(["331.p.7200", "331.p.9317"])
+            [
+              Player({...}),
+              Player({...})
+            ]
+
+        Args:
+            player_keys (Iterable[str]): The player keys of chosen players (example: 331.p.7200 -
+                <game_id>.p.<player_id>).
+
+        Returns:
+            list[Player]: List of YFPY Player instances containing attribute "draft_analysis" in the same order as the
+            player keys.
+
+        """
+        return self._get_players_by_keys(player_keys, "draft_analysis", cache_ttl=self._get_league_cache_ttl())
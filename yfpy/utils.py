@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 """YFPY module for managing complex JSON data structures.
 
+Note:
+    JSON serialization and deserialization use the optional orjson package when it is installed (pip install orjson),
+    and JSON deserialization falls back to the optional msgspec package (pip install msgspec) and then the optional
+    ujson package when orjson is not installed.
+
 Attributes:
     logger (Logger): Module level logger for usage and debugging.
 
@@ -9,16 +14,35 @@ __author__ = "Wren J. R. (uberfastman)"
 __email__ = "uberfastman@uberfastman.dev"
 
 import json
-import re
 from collections import ChainMap, OrderedDict
-from typing import Any, Dict, IO, List, Type, Union
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Callable, Dict, IO, List, Tuple, Type, Union
 
 import stringcase
 
 from yfpy.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
 logger = get_logger(__name__)
 
+# sentinel distinguishing data keys that do not exist from data keys with None values
+_MISSING = object()
+
 
 def complex_json_handler(obj: Any) -> Any:
     """Custom handler to allow custom YFPY objects to be serialized into JSON.
@@ -42,6 +66,12 @@ def complex_json_handler(obj: Any) -> Any:
 def jsonify_data(data: object) -> str:
     """Function to serialize a YahooFantasyObject to a JSON string.
 
+    Note:
+        When orjson is installed, floats in exponent notation can be formatted differently than by stdlib json
+        (depending on the orjson version, such as 1e-7 instead of 1e-07), and NaN and infinite floats are serialized
+        as null (stdlib json writes NaN and Infinity, which are not valid JSON). The parsed values are otherwise the
+        same.
+
     Args:
         data (object): YahooFantasyObject to be serialized to a JSON string.
 
@@ -49,18 +79,52 @@ def jsonify_data(data: object) -> str:
         str: JSON string serialized from YahooFantasyObject.
 
     """
+    if orjson:
+        try:
+            return orjson.dumps(data, default=complex_json_handler, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            # orjson does not support non-string dictionary keys or integers above 64 bits, so fall back to stdlib json
+            pass
     return json.dumps(data, indent=2, ensure_ascii=False, default=complex_json_handler)
 
 
+def load_json(json_data: Union[bytes, str]) -> Any:
+    """Function to deserialize a JSON document (such as the raw content of a Yahoo Fantasy Sports API response).
+
+    Args:
+        json_data (bytes | str): JSON document to be deserialized.
+
+    Returns:
+        Any: Python object deserialized from the JSON document.
+
+    Raises:
+        ValueError: If the JSON document is invalid.
+
+    """
+    if orjson:
+        return orjson.loads(json_data)
+    elif msgspec:
+        try:
+            return msgspec.json.decode(json_data)
+        except msgspec.DecodeError as err:
+            # match the ValueError raised by the other JSON decoders
+            raise ValueError(str(err)) from err
+    elif ujson:
+        return ujson.loads(json_data)
+    return json.loads(json_data)
+
+
 def jsonify_data_to_file(data: object, data_file: IO[str]) -> None:
     """Function to serialize a YahooFantasyObject to JSON and output it to a file.
 
+    The JSON is serialized with :func:`jsonify_data`, so the file output always matches the JSON string output.
+
     Args:
         data (object): YahooFantasyObject to be serialized to JSON and output to a file.
         data_file (IO[str])
 
     """
-    json.dump(data, data_file, indent=2, ensure_ascii=False, default=complex_json_handler)
+    data_file.write(jsonify_data(data))
 
 
 def prettify_data(data: object) -> str:
@@ -76,6 +140,22 @@ def prettify_data(data: object) -> str:
     return f"\n{jsonify_data(data)}\n"
 
 
+@lru_cache(maxsize=32)
+def get_subclasses(parent_class: Type) -> Dict[str, Type]:
+    """Function to map the snake case names of the subclasses of a parent class to the subclasses for casting.
+
+    The mapping is built once per parent class instead of at every level of the recursive unpacking of each response.
+
+    Args:
+        parent_class (Type): Parent class from which to derive subclasses for casting.
+
+    Returns:
+        dict[str, Type]: Dictionary of subclasses with snake case subclass names as keys and classes as values.
+
+    """
+    return {stringcase.snakecase(cls.__name__): cls for cls in parent_class.__subclasses__()}
+
+
 # noinspection PyTypeChecker
 def unpack_data(json_obj: Any, parent_class: Type = None) -> Any:
     """Recursive function to parse, clean, and assign custom data types to retrieved Yahoo Fantasy Sports data.
@@ -89,9 +169,7 @@ def unpack_data(json_obj: Any, parent_class: Type = None) -> Any:
 
     """
     # extract subclasses from parent class for typing
-    subclasses = {}
-    if parent_class:
-        subclasses = {stringcase.snakecase(cls.__name__): cls for cls in parent_class.__subclasses__()}
+    subclasses = get_subclasses(parent_class) if parent_class else {}
 
     # discard empty lists and dictionaries and include when json value = 0
     if json_obj == 0 or json_obj:
@@ -112,15 +190,15 @@ def unpack_data(json_obj: Any, parent_class: Type = None) -> Any:
         elif isinstance(json_obj, dict):
 
             # eliminate odd single-key Yahoo dicts with key = "0" and value = <next layer of desired data>
-            if "0" in json_obj.keys() and "1" not in json_obj.keys():
-                if len(json_obj.keys()) == 1:
+            if "0" in json_obj and "1" not in json_obj:
+                if len(json_obj) == 1:
                     return unpack_data(json_obj.get("0"), parent_class)
                 else:
                     if isinstance(json_obj.get("0"), dict):
                         json_obj.update(json_obj.pop("0"))
 
             # eliminate data obj counts (except in player_position dicts, which have position counts in league settings)
-            if "count" in json_obj.keys() and "position" in json_obj.keys():
+            if "count" in json_obj and "position" in json_obj:
                 # assign/cast data type where applicable
                 # TODO: figure out how to do this without explicit object type keys
                 return get_type(
@@ -138,7 +216,7 @@ def unpack_data(json_obj: Any, parent_class: Type = None) -> Any:
                 )
 
                 # flatten dicts with keys "0", "1",..., "n" to a list of objects
-                if "0" in json_obj.keys() and "1" in json_obj.keys():
+                if "0" in json_obj and "1" in json_obj:
                     json_obj = flatten_to_list(json_obj)
                 # TODO: figure out how to do this without breaking the above unpacking using explicit type keys
                 # else:
@@ -164,14 +242,19 @@ def convert_strings_to_numeric_equivalents(json_obj: Any) -> Union[int, float, A
         else the original JSON object.
 
     """
-    if isinstance(json_obj, str):
+    if isinstance(json_obj, str) and json_obj:
+        first_char = json_obj[0]
 
-        if len(json_obj) > 1 and str.startswith(json_obj, "0"):
+        # skip text (names, keys, URLs, etc.) without copying it, since numeric strings must start with a digit, a minus
+        # sign, or a decimal point
+        if not (first_char.isdigit() or first_char == "-" or first_char == "."):
+            return json_obj
+        elif first_char == "0" and len(json_obj) > 1:
             return json_obj
         else:
-            if str.isdigit(json_obj):
+            if json_obj.isdigit():
                 return int(json_obj)
-            elif str.isdigit(re.sub("[-]", "", re.sub("[.]", "", json_obj, count=1), count=1)):
+            elif json_obj.replace(".", "", 1).replace("-", "", 1).isdigit():
                 return float(json_obj)
             else:
                 return json_obj
@@ -183,7 +266,8 @@ def get_type(json_obj_dict: Dict[str, Any], parent_class: Type, subclasses: Dict
     """Cast JSON object to custom subclass type extracted from parent class.
 
     Args:
-        json_obj_dict (dict of str: Any): JSON dictionary with strings of data type as keys and JSON objects as values.
+        json_obj_dict (dict of str: Any): JSON dictionary with strings of data type as keys and JSON objects as values
+            (already parsed and cleaned by :func:`unpack_data`, so they are cast without being unpacked again).
         parent_class (Type): Parent class from which to derive subclasses for casting.
         subclasses (dict of str: Type): Dictionary of subclasses with strings that match the json dict keys as keys
             and classes for casting as values.
@@ -194,8 +278,10 @@ def get_type(json_obj_dict: Dict[str, Any], parent_class: Type, subclasses: Dict
     """
     for k, v in json_obj_dict.items():
         # check if key is in the provided subclasses' dict, that the object isn't already cast
-        if k in subclasses.keys() and isinstance(v, dict) and not isinstance(v, subclasses.get(k)):
-            json_obj_dict[k] = subclasses[k](unpack_data(v, parent_class))
+        if isinstance(v, dict):
+            subclass = subclasses.get(k)
+            if subclass is not None and not isinstance(v, subclass):
+                json_obj_dict[k] = subclass(v)
     return json_obj_dict
 
 
@@ -336,3 +422,106 @@ def reformat_json_list(json_obj: Any) -> Any:
     else:
         # create chain map that filters out empty lists/dicts but leaves objects where value = 0
         return ChainMap(*[value for value in json_obj if (value == 0 or value)])
+
+
+def extract_data_key(json_obj: Any, data_key: str) -> Any:
+    """Function to extract the value of a single data key from a JSON dictionary or Yahoo JSON list of dictionaries.
+
+    Args:
+        json_obj (Any): JSON object (typically a dictionary or list of single-key dictionaries).
+        data_key (str): Key of the data to be extracted.
+
+    Returns:
+        Any: Extracted JSON data, or None if the data key does not exist.
+
+    """
+    if isinstance(json_obj, list):
+        return get_json_list_value(json_obj, data_key)
+    return json_obj.get(data_key)
+
+
+def extract_data_keys(json_obj: Any, data_keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Function to extract the values of multiple sibling data keys from a JSON dictionary or Yahoo JSON list.
+
+    Args:
+        json_obj (Any): JSON object (typically a dictionary or list of single-key dictionaries).
+        data_keys (tuple[str, ...]): Keys of the data to be extracted.
+
+    Returns:
+        list[dict[str, Any]]: List of single-key dictionaries containing the extracted JSON data for each data key.
+
+    """
+    if isinstance(json_obj, list):
+        extracted_data = []
+        for data_key in data_keys:
+            value = get_json_list_value(json_obj, data_key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(data_key)
+            extracted_data.append({data_key: value})
+        return extracted_data
+    return [{data_key: json_obj[data_key]} for data_key in data_keys]
+
+
+def get_json_list_value(json_list: List[Any], data_key: str, default: Any = None) -> Any:
+    """Function to look up a data key in a Yahoo JSON list of dictionaries (which may contain nested lists).
+
+    The value is read from the first dictionary containing the data key, which matches a lookup on the chain map built
+    by :func:`reformat_json_list` without building the chain map first.
+
+    Args:
+        json_list (list[Any]): Yahoo JSON list of dictionaries and/or nested lists of dictionaries.
+        data_key (str): Key of the data to be looked up.
+        default (Any, optional): Value to return when no dictionary in the list contains the data key.
+
+    Returns:
+        Any: Value of the data key, or the default value if the data key does not exist.
+
+    """
+    # like reformat_json_list, only look up data keys in nested lists when the list starts with a nested list
+    nested = bool(json_list) and isinstance(json_list[0], list)
+    for item in json_list:
+        if isinstance(item, list):
+            if not nested:
+                continue
+            value = get_json_list_value(item, data_key, _MISSING)
+            if value is not _MISSING:
+                return value
+        elif isinstance(item, Mapping) and data_key in item:
+            return item[data_key]
+    return default
+
+
+@lru_cache(maxsize=256)
+def compile_data_key_path(data_key_path: Tuple[Union[str, Tuple[str, ...]], ...]) -> Callable[[Any], Any]:
+    """Function to compile a path of data keys into a reusable function that drills down to the data at that path.
+
+    Each data key in the path is resolved to its extraction step once, so repeated queries with the same data key path
+    do not need to re-interpret it.
+
+    Args:
+        data_key_path (tuple[str | tuple[str, ...], ...]): Hashable path of data keys (supports strings and tuples of
+            strings for extracting multiple sibling data keys), such as
+            ("team", ("team_points", "team_projected_points")).
+
+    Returns:
+        Callable: Function that takes a JSON object and returns the data extracted at the data key path (or None if any
+        data key along the path does not exist).
+
+    """
+    # resolve whether each data key extracts multiple sibling data keys once instead of on every extraction
+    extraction_steps = tuple((isinstance(data_key, tuple), data_key) for data_key in data_key_path)
+
+    # drill down in a single loop instead of through a chain of nested per-data-key functions
+    def extract(json_obj: Any) -> Any:
+        for extracts_multiple_data_keys, data_key in extraction_steps:
+            if json_obj is None:
+                return None
+            if extracts_multiple_data_keys:
+                json_obj = extract_data_keys(json_obj, data_key)
+            elif isinstance(json_obj, list):
+                json_obj = get_json_list_value(json_obj, data_key)
+            else:
+                json_obj = json_obj.get(data_key)
+        return json_obj
+
+    return extract